@@ -106,49 +106,33 @@ class MindStreamApp:
                 ui_element = getattr(event, "ui_element", None)
                 if ui_element is not None:
                     if self.sub_window and ui_element.ui_manager == self.sub_window.ui_manager:
-                        self.sub_window.ui_manager.process_events(event)
-                        self.sub_window.process_event(event)
+                        self.sub_window.handle_event(event)
                     else:
-                        self.main_window.ui_manager.process_events(event)
-                        self.main_window.process_event(event)
+                        self.main_window.handle_event(event)
                     continue
 
                 # window属性でルーティング
                 event_window = getattr(event, "window", None)
                 if event_window is not None:
                     if event_window == self.main_window.window:
-                        self.main_window.ui_manager.process_events(event)
-                        self.main_window.process_event(event)
+                        self.main_window.handle_event(event)
                     elif self.sub_window and event_window == self.sub_window.window:
-                        self.sub_window.ui_manager.process_events(event)
-                        self.sub_window.process_event(event)
+                        self.sub_window.handle_event(event)
                 else:
                     # window属性がないイベントは両方のウィンドウに送る
-                    self.main_window.ui_manager.process_events(event)
-                    self.main_window.process_event(event)
+                    self.main_window.handle_event(event)
                     if self.sub_window:
-                        self.sub_window.ui_manager.process_events(event)
-                        self.sub_window.process_event(event)
+                        self.sub_window.handle_event(event)
 
             # データ更新
             self.data_hub.update()
 
-            # メインウィンドウ更新・描画
-            self.main_window.update(time_delta)
-            self.main_window.ui_manager.update(time_delta)
-            self.main_window.draw_background()
-            self.main_window.draw()
-            self.main_window.ui_manager.draw_ui(self.main_window.surface)
-            self.main_window.flip()
+            # メインウィンドウ更新・描画（変化がない場合は描画を省略）
+            self.main_window.render_frame(time_delta)
 
             # サブウィンドウ更新・描画（表示中のみ）
             if self.sub_window:
-                self.sub_window.update(time_delta)
-                self.sub_window.ui_manager.update(time_delta)
-                self.sub_window.draw_background()
-                self.sub_window.draw()
-                self.sub_window.ui_manager.draw_ui(self.sub_window.surface)
-                self.sub_window.flip()
+                self.sub_window.render_frame(time_delta)
 
         # 終了処理
         self.data_hub.disconnect()
@@ -0,0 +1,120 @@
+"""MindStream リングバッファ
+
+マルチチャンネルEEGサンプル用のNumPyリングバッファ
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+
+def fill_nan_forward(chunk: np.ndarray, previous: np.ndarray) -> np.ndarray:
+    """NaNを直前の有効値で埋める（インプレース）
+
+    Args:
+        chunk: 形状 (サンプル数, チャンネル数) の配列
+        previous: チャンクより前の最終値（チャンネル数分）。先頭のNaNはこの値で埋める
+
+    Returns:
+        NaNを埋めたchunk
+    """
+    nan_mask = np.isnan(chunk)
+    if not nan_mask.any():
+        return chunk
+
+    # 各位置について直近の有効サンプルの行番号を求める（無ければ-1）
+    rows = np.arange(chunk.shape[0])[:, np.newaxis]
+    source = np.maximum.accumulate(np.where(nan_mask, -1, rows), axis=0)
+    filled = np.take_along_axis(chunk, np.maximum(source, 0), axis=0)
+    chunk[:] = np.where(source < 0, previous, filled)
+    return chunk
+
+
+class RingBuffer:
+    """マルチチャンネルのリングバッファ
+
+    全チャンネルを1つの float32 配列 (チャンネル数, 2 * size) に保持する。
+    各サンプルを位置 i と i + size の2か所に書き込む（ミラー配置）ことで、
+    直近Nサンプルを常にコピーなしの連続スライスとして取り出せる。
+    """
+
+    def __init__(self, num_channels: int, size: int) -> None:
+        """リングバッファを初期化（全サンプル0で埋める）
+
+        Args:
+            num_channels: チャンネル数
+            size: チャンネルあたりのサンプル数
+        """
+        self.num_channels = num_channels
+        self.size = size
+        self._data = np.zeros((num_channels, size * 2), dtype=np.float32)
+        self._write_idx = 0
+        # 更新カウンタ（サンプル追加・リセットのたびに増える。内容の変化検知用）
+        self.write_count = 0
+
+    def __len__(self) -> int:
+        """チャンネルあたりのサンプル数"""
+        return self.size
+
+    def extend(self, chunk: np.ndarray) -> None:
+        """サンプルを追加
+
+        Args:
+            chunk: 形状 (サンプル数, チャンネル数) の配列。
+                チャンネル数がバッファより少ない場合は先頭チャンネルのみ更新する。
+        """
+        n, channels = chunk.shape
+        channels = min(channels, self.num_channels)
+        if n == 0:
+            return
+
+        # バッファより長い場合は末尾のみ保持
+        if n > self.size:
+            chunk = chunk[-self.size :]
+            n = self.size
+
+        samples = chunk[:, :channels].T
+        size = self.size
+        idx = self._write_idx
+
+        # 折り返し前後の2回に分けて、通常位置とミラー位置の両方に書き込む
+        first = min(n, size - idx)
+        for offset in (0, size):
+            self._data[:channels, offset + idx : offset + idx + first] = samples[:, :first]
+            if first < n:
+                self._data[:channels, offset : offset + n - first] = samples[:, first:]
+
+        self._write_idx = (idx + n) % size
+        self.write_count += n
+
+    def ingest(self, chunk: np.ndarray) -> None:
+        """NaNを直前の値で埋めてからサンプルを追加
+
+        Args:
+            chunk: 形状 (サンプル数, チャンネル数) の float32 配列（インプレースで書き換える）
+        """
+        channels = min(chunk.shape[1], self.num_channels)
+        last_idx = (self._write_idx - 1) % self.size
+        fill_nan_forward(chunk[:, :channels], self._data[:channels, last_idx])
+        self.extend(chunk)
+
+    def latest(self, n: int) -> np.ndarray:
+        """直近nサンプルを古い順に取得
+
+        Args:
+            n: 取得するサンプル数（sizeを超える場合はsizeに切り詰める）
+
+        Returns:
+            形状 (チャンネル数, n) の読み取り専用ビュー
+        """
+        n = min(n, self.size)
+        end = self._write_idx + self.size
+        view = self._data[:, end - n : end]
+        view.flags.writeable = False
+        return view
+
+    def reset(self) -> None:
+        """全サンプルを0にリセット"""
+        self._data.fill(0.0)
+        self._write_idx = 0
+        self.write_count += 1
@@ -6,19 +6,18 @@
 from __future__ import annotations
 
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 from mindstream.config import Config
 
 
-def parse_args(args: list[str] | None = None) -> argparse.Namespace:
-    """コマンドライン引数を解析する
-
-    Args:
-        args: 引数リスト (Noneの場合はsys.argvを使用)
+@lru_cache(maxsize=1)
+def _get_parser() -> argparse.ArgumentParser:
+    """引数パーサーを構築する（プロセス内で一度だけ構築し、以降は再利用）
 
     Returns:
-        解析された引数
+        引数パーサー
     """
     parser = argparse.ArgumentParser(
         prog="mindstream",
@@ -72,7 +71,37 @@ def parse_args(args: list[str] | None = None) -> argparse.Namespace:
         help="Initial amplitude scale in uV (default: 100)",
     )
 
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: list[str] | None = None) -> argparse.Namespace:
+    """コマンドライン引数を解析する
+
+    Args:
+        args: 引数リスト (Noneの場合はsys.argvを使用)
+
+    Returns:
+        解析された引数
+    """
+    return _get_parser().parse_args(args)
+
+
+@lru_cache(maxsize=32)
+def _load_config_file(path: str, mtime_ns: int, size: int) -> Config:
+    """設定ファイルを読み込む（同じ内容のファイルは一度だけ解析）
+
+    更新日時とサイズをキャッシュキーに含めるため、ファイルが書き換えられた場合は
+    再度読み込まれる。Configは不変のため、返された設定はそのまま共有してよい。
+
+    Args:
+        path: 設定ファイルのパス
+        mtime_ns: ファイルの更新日時（ナノ秒）
+        size: ファイルサイズ（バイト）
+
+    Returns:
+        読み込んだ設定
+    """
+    return Config.from_toml(Path(path))
 
 
 def load_config(args: argparse.Namespace) -> Config:
@@ -90,18 +119,18 @@ def load_config(args: argparse.Namespace) -> Config:
     Returns:
         設定
     """
-    config = Config()
-
     # 設定ファイルのパスを決定
     config_path = args.config
     if config_path is None:
-        default_path = Path("config.toml")
-        if default_path.exists():
-            config_path = default_path
-
-    # 設定ファイルが存在する場合は読み込み
-    if config_path is not None and config_path.exists():
-        config = Config.from_toml(config_path)
+        config_path = Path("config.toml")
+
+    # 設定ファイルが存在する場合は読み込み（存在確認とキャッシュキーの取得を1回のstatで行う）
+    try:
+        stat = config_path.stat()
+    except FileNotFoundError:
+        config = Config()
+    else:
+        config = _load_config_file(str(config_path.absolute()), stat.st_mtime_ns, stat.st_size)
 
     # CLI引数で上書き
     config = config.merge_cli_args(args)
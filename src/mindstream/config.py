@@ -5,22 +5,153 @@
 
 from __future__ import annotations
 
-import tomllib
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
 
 type Color = tuple[int, int, int]
 
+# CLI引数名と上書き先（セクション名, フィールド名）の対応
+_CLI_MAP: tuple[tuple[str, str, str], ...] = (
+    ("window_width", "display", "window_width"),
+    ("window_height", "display", "window_height"),
+    ("fps", "display", "fps"),
+    ("display_seconds", "eeg", "default_display_seconds"),
+    ("amplitude_scale", "eeg", "default_amplitude_scale"),
+)
+
+
+# 読み込んだ色の共有テーブル（同じ色は同じタプルを共有し、キャッシュキーの比較を速くする）
+_COLOR_INTERN: dict[Color, Color] = {}
+
 
 def _parse_color(value: list[int] | tuple[int, int, int]) -> Color:
     """リストまたはタプルをColor型に変換"""
     if len(value) != 3:
         raise ValueError(f"Color must have 3 components, got {len(value)}")
-    return (int(value[0]), int(value[1]), int(value[2]))
-
-
-@dataclass
+    color = (int(value[0]), int(value[1]), int(value[2]))
+    return _COLOR_INTERN.setdefault(color, color)
+
+
+def _parse_color_map(value: dict[str, list[int]]) -> dict[str, Color]:
+    """名前と色の対応表をColor型の辞書に変換"""
+    return {name: _parse_color(color) for name, color in value.items()}
+
+
+# 窓設定（windows.main / windows.sub）のフィールド
+_WINDOW_FIELDS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("width", int),
+    ("height", int),
+    ("position_x", int),
+    ("position_y", int),
+    ("title", str),
+    ("visible", bool),
+)
+
+# TOMLの読み込みスキーマ（セクション名, セクションのキーパス, (フィールド名, 変換関数)の組）
+# 未指定のフィールドは各設定クラスのデフォルト値を使う
+_SCHEMA: tuple[tuple[str, tuple[str, ...], tuple[tuple[str, Callable[[Any], Any]], ...]], ...] = (
+    ("display", ("display",), (("window_width", int), ("window_height", int), ("fps", int))),
+    (
+        "eeg",
+        ("eeg",),
+        (
+            ("sample_rate", int),
+            ("max_buffer_seconds", int),
+            ("default_display_seconds", int),
+            ("default_amplitude_scale", int),
+        ),
+    ),
+    (
+        "colors",
+        ("colors",),
+        (
+            ("background", _parse_color),
+            ("grid", _parse_color),
+            ("text", _parse_color),
+            ("channels", _parse_color_map),
+        ),
+    ),
+    ("fonts", ("fonts",), (("title_size", int), ("label_size", int))),
+    ("layout", ("layout",), (("padding", int), ("line_thickness", int))),
+    ("slider", ("slider",), (("enabled", bool), ("width", int))),
+    (
+        "frequency",
+        ("frequency",),
+        (
+            ("enabled", bool),
+            ("panel_width", int),
+            ("window_seconds", float),
+            ("update_interval_ms", int),
+            ("show_per_channel", bool),
+            ("show_average", bool),
+        ),
+    ),
+    (
+        "view",
+        ("view",),
+        (("default_layout", str), ("raw_waveform", bool), ("frequency_bars", bool)),
+    ),
+    (
+        "view.power_trend",
+        ("view", "power_trend"),
+        (
+            ("enabled", bool),
+            ("panel_width", int),
+            ("time_window_seconds", int),
+            ("show_legend", bool),
+        ),
+    ),
+    (
+        "view.indicator",
+        ("view", "indicator"),
+        (
+            ("enabled", bool),
+            ("panel_width", int),
+            ("show_focus", bool),
+            ("show_relax", bool),
+            ("show_meditation", bool),
+            ("show_trend", bool),
+            ("trend_window_seconds", int),
+        ),
+    ),
+    (
+        "indicator",
+        ("indicator",),
+        (
+            ("focus_baseline", float),
+            ("relax_baseline", float),
+            ("meditation_baseline", float),
+            ("smoothing_factor", float),
+        ),
+    ),
+    (
+        "keybindings",
+        ("keybindings",),
+        (
+            ("toggle_raw_waveform", str),
+            ("toggle_frequency_bars", str),
+            ("toggle_power_trend", str),
+            ("toggle_focus_relax", str),
+            ("cycle_layout", str),
+        ),
+    ),
+    (
+        "events",
+        ("events",),
+        (("enabled", bool), ("focus_low_threshold", int), ("focus_high_threshold", int)),
+    ),
+    ("windows", ("windows",), (("sync_close", bool),)),
+    ("windows.main", ("windows", "main"), _WINDOW_FIELDS),
+    ("windows.sub", ("windows", "sub"), _WINDOW_FIELDS),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DisplayConfig:
     """画面表示設定"""
 
@@ -29,7 +160,7 @@ class DisplayConfig:
     fps: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EEGConfig:
     """EEG信号処理設定"""
 
@@ -44,24 +175,32 @@ class EEGConfig:
         return self.max_buffer_seconds * self.sample_rate
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ColorsConfig:
-    """色設定"""
+    """色設定
+
+    channelsは読み取り専用のマッピングとして保持する（ハッシュ値の計算には含めない）。
+    """
 
     background: Color = (20, 20, 30)
     grid: Color = (40, 40, 60)
     text: Color = (200, 200, 200)
-    channels: dict[str, Color] = field(
+    channels: Mapping[str, Color] = field(
         default_factory=lambda: {
             "TP9": (255, 100, 100),
             "AF7": (100, 255, 100),
             "AF8": (100, 100, 255),
             "TP10": (255, 255, 100),
-        }
+        },
+        hash=False,
     )
 
+    def __post_init__(self) -> None:
+        """チャンネル色を読み取り専用のマッピングに変換（渡された辞書とは共有しない）"""
+        object.__setattr__(self, "channels", MappingProxyType(dict(self.channels)))
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FontsConfig:
     """フォント設定"""
 
@@ -69,7 +208,7 @@ class FontsConfig:
     label_size: int = 24
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class LayoutConfig:
     """レイアウト設定"""
 
@@ -77,7 +216,7 @@ class LayoutConfig:
     line_thickness: int = 2
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SliderConfig:
     """スライダー設定"""
 
@@ -85,7 +224,7 @@ class SliderConfig:
     width: int = 80
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FrequencyConfig:
     """周波数解析設定"""
 
@@ -97,7 +236,7 @@ class FrequencyConfig:
     show_average: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViewPowerTrendConfig:
     """パワートレンドビュー設定"""
 
@@ -107,7 +246,7 @@ class ViewPowerTrendConfig:
     show_legend: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViewIndicatorConfig:
     """インジケータービュー設定"""
 
@@ -120,7 +259,7 @@ class ViewIndicatorConfig:
     trend_window_seconds: int = 60
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViewConfig:
     """ビュー全体設定"""
 
@@ -134,7 +273,7 @@ class ViewConfig:
     indicator: ViewIndicatorConfig = field(default_factory=ViewIndicatorConfig)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class IndicatorConfig:
     """インジケーター計算設定"""
 
@@ -146,7 +285,7 @@ class IndicatorConfig:
     smoothing_factor: float = 0.3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class KeybindingsConfig:
     """キーバインド設定"""
 
@@ -157,7 +296,7 @@ class KeybindingsConfig:
     cycle_layout: str = "TAB"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventsConfig:
     """イベント/通知設定（将来拡張用）"""
 
@@ -166,7 +305,7 @@ class EventsConfig:
     focus_high_threshold: int = 80
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MainWindowConfig:
     """メインウィンドウ設定"""
 
@@ -178,7 +317,7 @@ class MainWindowConfig:
     visible: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SubWindowConfig:
     """サブウィンドウ設定"""
 
@@ -190,7 +329,7 @@ class SubWindowConfig:
     visible: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WindowsConfig:
     """マルチウィンドウ設定"""
 
@@ -199,7 +338,7 @@ class WindowsConfig:
     sync_close: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """MindStream全体設定"""
 
@@ -230,328 +369,83 @@ class Config:
             FileNotFoundError: ファイルが存在しない場合
             tomllib.TOMLDecodeError: TOML形式が不正な場合
         """
-        with open(path, "rb") as f:
-            data = tomllib.load(f)
-        return cls._from_dict(data)
+        return cls.from_toml_bytes(Path(path).read_bytes())
+
+    @classmethod
+    def from_toml_bytes(cls, data: bytes) -> Config:
+        """TOML形式のバイト列から設定を読み込む
+
+        Args:
+            data: UTF-8でエンコードされたTOML
+
+        Returns:
+            読み込んだ設定
+
+        Raises:
+            tomllib.TOMLDecodeError: TOML形式が不正な場合
+        """
+        # tomllibの読み込みは初回のTOML読み込み時まで遅延（モジュールのインポートを軽くする）
+        import tomllib
+
+        return cls._from_dict(tomllib.loads(data.decode()))
 
     @classmethod
     def _from_dict(cls, data: dict[str, Any]) -> Config:
         """辞書から設定を生成"""
-        config = cls()
-
-        # display セクション
-        if "display" in data:
-            display_data = data["display"]
-            if "window_width" in display_data:
-                config.display.window_width = int(display_data["window_width"])
-            if "window_height" in display_data:
-                config.display.window_height = int(display_data["window_height"])
-            if "fps" in display_data:
-                config.display.fps = int(display_data["fps"])
-
-        # eeg セクション
-        if "eeg" in data:
-            eeg_data = data["eeg"]
-            if "sample_rate" in eeg_data:
-                config.eeg.sample_rate = int(eeg_data["sample_rate"])
-            if "max_buffer_seconds" in eeg_data:
-                config.eeg.max_buffer_seconds = int(eeg_data["max_buffer_seconds"])
-            if "default_display_seconds" in eeg_data:
-                config.eeg.default_display_seconds = int(eeg_data["default_display_seconds"])
-            if "default_amplitude_scale" in eeg_data:
-                config.eeg.default_amplitude_scale = int(eeg_data["default_amplitude_scale"])
-
-        # colors セクション
-        if "colors" in data:
-            colors_data = data["colors"]
-            if "background" in colors_data:
-                config.colors.background = _parse_color(colors_data["background"])
-            if "grid" in colors_data:
-                config.colors.grid = _parse_color(colors_data["grid"])
-            if "text" in colors_data:
-                config.colors.text = _parse_color(colors_data["text"])
-            if "channels" in colors_data:
-                config.colors.channels = {
-                    name: _parse_color(color) for name, color in colors_data["channels"].items()
-                }
-
-        # fonts セクション
-        if "fonts" in data:
-            fonts_data = data["fonts"]
-            if "title_size" in fonts_data:
-                config.fonts.title_size = int(fonts_data["title_size"])
-            if "label_size" in fonts_data:
-                config.fonts.label_size = int(fonts_data["label_size"])
-
-        # layout セクション
-        if "layout" in data:
-            layout_data = data["layout"]
-            if "padding" in layout_data:
-                config.layout.padding = int(layout_data["padding"])
-            if "line_thickness" in layout_data:
-                config.layout.line_thickness = int(layout_data["line_thickness"])
-
-        # slider セクション
-        if "slider" in data:
-            slider_data = data["slider"]
-            if "enabled" in slider_data:
-                config.slider.enabled = bool(slider_data["enabled"])
-            if "width" in slider_data:
-                config.slider.width = int(slider_data["width"])
-
-        # frequency セクション
-        if "frequency" in data:
-            freq_data = data["frequency"]
-            if "enabled" in freq_data:
-                config.frequency.enabled = bool(freq_data["enabled"])
-            if "panel_width" in freq_data:
-                config.frequency.panel_width = int(freq_data["panel_width"])
-            if "window_seconds" in freq_data:
-                config.frequency.window_seconds = float(freq_data["window_seconds"])
-            if "update_interval_ms" in freq_data:
-                config.frequency.update_interval_ms = int(freq_data["update_interval_ms"])
-            if "show_per_channel" in freq_data:
-                config.frequency.show_per_channel = bool(freq_data["show_per_channel"])
-            if "show_average" in freq_data:
-                config.frequency.show_average = bool(freq_data["show_average"])
-
-        # view セクション
-        if "view" in data:
-            view_data = data["view"]
-            if "default_layout" in view_data:
-                config.view.default_layout = str(view_data["default_layout"])
-            if "raw_waveform" in view_data:
-                config.view.raw_waveform = bool(view_data["raw_waveform"])
-            if "frequency_bars" in view_data:
-                config.view.frequency_bars = bool(view_data["frequency_bars"])
-
-            # view.power_trend サブセクション
-            if "power_trend" in view_data:
-                pt_data = view_data["power_trend"]
-                if "enabled" in pt_data:
-                    config.view.power_trend.enabled = bool(pt_data["enabled"])
-                if "panel_width" in pt_data:
-                    config.view.power_trend.panel_width = int(pt_data["panel_width"])
-                if "time_window_seconds" in pt_data:
-                    config.view.power_trend.time_window_seconds = int(
-                        pt_data["time_window_seconds"]
-                    )
-                if "show_legend" in pt_data:
-                    config.view.power_trend.show_legend = bool(pt_data["show_legend"])
-
-            # view.indicator サブセクション
-            if "indicator" in view_data:
-                ind_data = view_data["indicator"]
-                if "enabled" in ind_data:
-                    config.view.indicator.enabled = bool(ind_data["enabled"])
-                if "panel_width" in ind_data:
-                    config.view.indicator.panel_width = int(ind_data["panel_width"])
-                if "show_focus" in ind_data:
-                    config.view.indicator.show_focus = bool(ind_data["show_focus"])
-                if "show_relax" in ind_data:
-                    config.view.indicator.show_relax = bool(ind_data["show_relax"])
-                if "show_meditation" in ind_data:
-                    config.view.indicator.show_meditation = bool(ind_data["show_meditation"])
-                if "show_trend" in ind_data:
-                    config.view.indicator.show_trend = bool(ind_data["show_trend"])
-                if "trend_window_seconds" in ind_data:
-                    config.view.indicator.trend_window_seconds = int(
-                        ind_data["trend_window_seconds"]
-                    )
-
-        # indicator セクション
-        if "indicator" in data:
-            ind_data = data["indicator"]
-            if "focus_baseline" in ind_data:
-                config.indicator.focus_baseline = float(ind_data["focus_baseline"])
-            if "relax_baseline" in ind_data:
-                config.indicator.relax_baseline = float(ind_data["relax_baseline"])
-            if "meditation_baseline" in ind_data:
-                config.indicator.meditation_baseline = float(ind_data["meditation_baseline"])
-            if "smoothing_factor" in ind_data:
-                config.indicator.smoothing_factor = float(ind_data["smoothing_factor"])
-
-        # keybindings セクション
-        if "keybindings" in data:
-            kb_data = data["keybindings"]
-            if "toggle_raw_waveform" in kb_data:
-                config.keybindings.toggle_raw_waveform = str(kb_data["toggle_raw_waveform"])
-            if "toggle_frequency_bars" in kb_data:
-                config.keybindings.toggle_frequency_bars = str(kb_data["toggle_frequency_bars"])
-            if "toggle_power_trend" in kb_data:
-                config.keybindings.toggle_power_trend = str(kb_data["toggle_power_trend"])
-            if "toggle_focus_relax" in kb_data:
-                config.keybindings.toggle_focus_relax = str(kb_data["toggle_focus_relax"])
-            if "cycle_layout" in kb_data:
-                config.keybindings.cycle_layout = str(kb_data["cycle_layout"])
-
-        # events セクション
-        if "events" in data:
-            events_data = data["events"]
-            if "enabled" in events_data:
-                config.events.enabled = bool(events_data["enabled"])
-            if "focus_low_threshold" in events_data:
-                config.events.focus_low_threshold = int(events_data["focus_low_threshold"])
-            if "focus_high_threshold" in events_data:
-                config.events.focus_high_threshold = int(events_data["focus_high_threshold"])
-
-        # windows セクション
-        if "windows" in data:
-            windows_data = data["windows"]
-            if "sync_close" in windows_data:
-                config.windows.sync_close = bool(windows_data["sync_close"])
-
-            # windows.main サブセクション
-            if "main" in windows_data:
-                main_data = windows_data["main"]
-                if "width" in main_data:
-                    config.windows.main.width = int(main_data["width"])
-                if "height" in main_data:
-                    config.windows.main.height = int(main_data["height"])
-                if "position_x" in main_data:
-                    config.windows.main.position_x = int(main_data["position_x"])
-                if "position_y" in main_data:
-                    config.windows.main.position_y = int(main_data["position_y"])
-                if "title" in main_data:
-                    config.windows.main.title = str(main_data["title"])
-                if "visible" in main_data:
-                    config.windows.main.visible = bool(main_data["visible"])
-
-            # windows.sub サブセクション
-            if "sub" in windows_data:
-                sub_data = windows_data["sub"]
-                if "width" in sub_data:
-                    config.windows.sub.width = int(sub_data["width"])
-                if "height" in sub_data:
-                    config.windows.sub.height = int(sub_data["height"])
-                if "position_x" in sub_data:
-                    config.windows.sub.position_x = int(sub_data["position_x"])
-                if "position_y" in sub_data:
-                    config.windows.sub.position_y = int(sub_data["position_y"])
-                if "title" in sub_data:
-                    config.windows.sub.title = str(sub_data["title"])
-                if "visible" in sub_data:
-                    config.windows.sub.visible = bool(sub_data["visible"])
-
-        return config
+        # セクションごとに設定値を集め、最後に各セクションを生成する（設定は不変のため）
+        kwargs: dict[str, dict[str, Any]] = {}
+        for section, path, fields in _SCHEMA:
+            section_data: dict[str, Any] = data
+            for key in path:
+                section_data = section_data.get(key, {})
+            kwargs[section] = {
+                name: coerce(section_data[name]) for name, coerce in fields if name in section_data
+            }
+
+        return cls(
+            display=DisplayConfig(**kwargs["display"]),
+            eeg=EEGConfig(**kwargs["eeg"]),
+            colors=ColorsConfig(**kwargs["colors"]),
+            fonts=FontsConfig(**kwargs["fonts"]),
+            layout=LayoutConfig(**kwargs["layout"]),
+            slider=SliderConfig(**kwargs["slider"]),
+            frequency=FrequencyConfig(**kwargs["frequency"]),
+            view=ViewConfig(
+                power_trend=ViewPowerTrendConfig(**kwargs["view.power_trend"]),
+                indicator=ViewIndicatorConfig(**kwargs["view.indicator"]),
+                **kwargs["view"],
+            ),
+            indicator=IndicatorConfig(**kwargs["indicator"]),
+            keybindings=KeybindingsConfig(**kwargs["keybindings"]),
+            events=EventsConfig(**kwargs["events"]),
+            windows=WindowsConfig(
+                main=MainWindowConfig(**kwargs["windows.main"]),
+                sub=SubWindowConfig(**kwargs["windows.sub"]),
+                **kwargs["windows"],
+            ),
+        )
 
     def merge_cli_args(self, args: Any) -> Config:
         """CLI引数で設定を上書きした新しいConfigを返す
 
+        上書きしたセクションのみ新しいインスタンスに置き換え、
+        それ以外のセクションは元のConfigと共有する。
+
         Args:
             args: argparse.Namespace (window_width, window_height等の属性を持つ)
 
         Returns:
             CLI引数で上書きした新しいConfig
         """
-        # 新しいConfigを作成（既存の値をコピー）
-        new_config = Config(
-            display=DisplayConfig(
-                window_width=self.display.window_width,
-                window_height=self.display.window_height,
-                fps=self.display.fps,
-            ),
-            eeg=EEGConfig(
-                sample_rate=self.eeg.sample_rate,
-                max_buffer_seconds=self.eeg.max_buffer_seconds,
-                default_display_seconds=self.eeg.default_display_seconds,
-                default_amplitude_scale=self.eeg.default_amplitude_scale,
-            ),
-            colors=ColorsConfig(
-                background=self.colors.background,
-                grid=self.colors.grid,
-                text=self.colors.text,
-                channels=dict(self.colors.channels),
-            ),
-            fonts=FontsConfig(
-                title_size=self.fonts.title_size,
-                label_size=self.fonts.label_size,
-            ),
-            layout=LayoutConfig(
-                padding=self.layout.padding,
-                line_thickness=self.layout.line_thickness,
-            ),
-            slider=SliderConfig(
-                enabled=self.slider.enabled,
-                width=self.slider.width,
-            ),
-            frequency=FrequencyConfig(
-                enabled=self.frequency.enabled,
-                panel_width=self.frequency.panel_width,
-                window_seconds=self.frequency.window_seconds,
-                update_interval_ms=self.frequency.update_interval_ms,
-                show_per_channel=self.frequency.show_per_channel,
-                show_average=self.frequency.show_average,
-            ),
-            view=ViewConfig(
-                default_layout=self.view.default_layout,
-                raw_waveform=self.view.raw_waveform,
-                frequency_bars=self.view.frequency_bars,
-                power_trend=ViewPowerTrendConfig(
-                    enabled=self.view.power_trend.enabled,
-                    panel_width=self.view.power_trend.panel_width,
-                    time_window_seconds=self.view.power_trend.time_window_seconds,
-                    show_legend=self.view.power_trend.show_legend,
-                ),
-                indicator=ViewIndicatorConfig(
-                    enabled=self.view.indicator.enabled,
-                    panel_width=self.view.indicator.panel_width,
-                    show_focus=self.view.indicator.show_focus,
-                    show_relax=self.view.indicator.show_relax,
-                    show_meditation=self.view.indicator.show_meditation,
-                    show_trend=self.view.indicator.show_trend,
-                    trend_window_seconds=self.view.indicator.trend_window_seconds,
-                ),
-            ),
-            indicator=IndicatorConfig(
-                focus_baseline=self.indicator.focus_baseline,
-                relax_baseline=self.indicator.relax_baseline,
-                meditation_baseline=self.indicator.meditation_baseline,
-                smoothing_factor=self.indicator.smoothing_factor,
-            ),
-            keybindings=KeybindingsConfig(
-                toggle_raw_waveform=self.keybindings.toggle_raw_waveform,
-                toggle_frequency_bars=self.keybindings.toggle_frequency_bars,
-                toggle_power_trend=self.keybindings.toggle_power_trend,
-                toggle_focus_relax=self.keybindings.toggle_focus_relax,
-                cycle_layout=self.keybindings.cycle_layout,
-            ),
-            events=EventsConfig(
-                enabled=self.events.enabled,
-                focus_low_threshold=self.events.focus_low_threshold,
-                focus_high_threshold=self.events.focus_high_threshold,
-            ),
-            windows=WindowsConfig(
-                main=MainWindowConfig(
-                    width=self.windows.main.width,
-                    height=self.windows.main.height,
-                    position_x=self.windows.main.position_x,
-                    position_y=self.windows.main.position_y,
-                    title=self.windows.main.title,
-                    visible=self.windows.main.visible,
-                ),
-                sub=SubWindowConfig(
-                    width=self.windows.sub.width,
-                    height=self.windows.sub.height,
-                    position_x=self.windows.sub.position_x,
-                    position_y=self.windows.sub.position_y,
-                    title=self.windows.sub.title,
-                    visible=self.windows.sub.visible,
-                ),
-                sync_close=self.windows.sync_close,
-            ),
-        )
-
-        # CLI引数で上書き (Noneでない値のみ)
-        if getattr(args, "window_width", None) is not None:
-            new_config.display.window_width = args.window_width
-        if getattr(args, "window_height", None) is not None:
-            new_config.display.window_height = args.window_height
-        if getattr(args, "fps", None) is not None:
-            new_config.display.fps = args.fps
-        if getattr(args, "display_seconds", None) is not None:
-            new_config.eeg.default_display_seconds = args.display_seconds
-        if getattr(args, "amplitude_scale", None) is not None:
-            new_config.eeg.default_amplitude_scale = args.amplitude_scale
-
-        return new_config
+        # セクションごとに上書きする値を集める (Noneでない値のみ)
+        overrides: dict[str, dict[str, Any]] = {}
+        for arg_name, section, field_name in _CLI_MAP:
+            value = getattr(args, arg_name, None)
+            if value is not None:
+                overrides.setdefault(section, {})[field_name] = value
+
+        sections = {
+            section: replace(getattr(self, section), **fields)
+            for section, fields in overrides.items()
+        }
+        return replace(self, **sections)
@@ -6,13 +6,13 @@
 from __future__ import annotations
 
 import time
-from collections import deque
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 import numpy as np
 from pylsl import StreamInlet, resolve_byprop
 
+from mindstream.buffer import RingBuffer
 from mindstream.constants import CHANNEL_NAMES, NUM_CHANNELS
 
 if TYPE_CHECKING:
@@ -29,7 +29,7 @@ class DataHub:
     """
 
     config: Config
-    buffers: list[deque[float]] = field(default_factory=list)
+    buffers: RingBuffer = field(init=False)
     inlet: StreamInlet | None = None
     connected: bool = False
 
@@ -45,13 +45,16 @@ class DataHub:
     display_seconds: int = 5
     amplitude_scale: int = 100
 
+    # 更新カウンタ（ウィンドウが再描画の要否を判定するために参照）
+    # state_revision: 解析結果・接続状態の変化・リセットで増加
+    # freq_result_revision: current_freq_resultの差し替えで増加
+    state_revision: int = 0
+    freq_result_revision: int = 0
+
     def __post_init__(self) -> None:
         """初期化後の処理"""
-        # バッファを初期化
-        buffer_size = self.config.eeg.buffer_size
-        self.buffers = [deque(maxlen=buffer_size) for _ in range(NUM_CHANNELS)]
-        for buf in self.buffers:
-            buf.extend([0.0] * buffer_size)
+        # バッファを初期化（全チャンネル共通のリングバッファ）
+        self.buffers = RingBuffer(NUM_CHANNELS, self.config.eeg.buffer_size)
 
         # 表示パラメータを設定から初期化
         self.display_seconds = self.config.eeg.default_display_seconds
@@ -71,6 +74,22 @@ class DataHub:
 
         self.indicator_calculator = IndicatorCalculator(self.config.indicator)
 
+    @property
+    def sample_revision(self) -> int:
+        """バッファの更新カウンタ（サンプル追加・リセットで増加）"""
+        return self.buffers.write_count
+
+    def tail(self, n: int) -> np.ndarray:
+        """全チャンネルの直近nサンプルを取得
+
+        Args:
+            n: 取得するサンプル数（バッファサイズを超える場合は切り詰める）
+
+        Returns:
+            形状 (チャンネル数, n) の読み取り専用ビュー
+        """
+        return self.buffers.latest(n)
+
     def connect_to_stream(self) -> bool:
         """LSLストリームに接続
 
@@ -87,6 +106,7 @@ class DataHub:
         print(f"ストリームが見つかりました: {streams[0].name()}")
         self.inlet = StreamInlet(streams[0], max_chunklen=12)
         self.connected = True
+        self.state_revision += 1
         return True
 
     def disconnect(self) -> None:
@@ -94,7 +114,9 @@ class DataHub:
         if self.inlet is not None:
             self.inlet.close_stream()
             self.inlet = None
-        self.connected = False
+        if self.connected:
+            self.connected = False
+            self.state_revision += 1
 
     def update(self) -> None:
         """LSLからデータを取得して解析を更新"""
@@ -110,36 +132,36 @@ class DataHub:
         samples, _ = self.inlet.pull_chunk(timeout=0.0, max_samples=32)
 
         if samples:
-            for sample in samples:
-                for i in range(min(NUM_CHANNELS, len(sample))):
-                    value = sample[i]
-                    # NaN値は前の値を維持（または0）
-                    if np.isnan(value):
-                        value = self.buffers[i][-1] if self.buffers[i] else 0.0
-                    self.buffers[i].append(float(value))
+            # NaN値は前の値を維持
+            self.buffers.ingest(np.asarray(samples, dtype=np.float32))
 
     def _update_analysis(self) -> None:
         """周波数解析とインジケーターを更新"""
         current_time = time.time()
 
-        # 周波数解析
+        # 周波数解析（解析間隔内とバッファ未更新時は前回と同じ結果オブジェクトが返る）
         if self.frequency_analyzer is not None:
-            self.current_freq_result = self.frequency_analyzer.analyze(
-                self.buffers,
+            freq_result = self.frequency_analyzer.analyze(
+                self.buffers.latest(self.buffers.size),
                 CHANNEL_NAMES,
                 current_time,
+                write_count=self.buffers.write_count,
             )
+            if freq_result is not self.current_freq_result:
+                self.current_freq_result = freq_result
+                self.freq_result_revision += 1
+                self.state_revision += 1
 
-        # インジケーター計算
+        # インジケーター計算（スムージングにより同じ解析結果でも値が変わりうる）
         if self.indicator_calculator is not None and self.current_freq_result is not None:
-            self.current_indicators = self.indicator_calculator.calculate(self.current_freq_result)
+            indicators = self.indicator_calculator.calculate(self.current_freq_result)
+            if indicators != self.current_indicators:
+                self.state_revision += 1
+            self.current_indicators = indicators
 
     def reset_buffers(self) -> None:
         """バッファをリセット"""
-        buffer_size = self.config.eeg.buffer_size
-        for buf in self.buffers:
-            buf.clear()
-            buf.extend([0.0] * buffer_size)
+        self.buffers.reset()
 
         # 解析器もリセット
         if self.frequency_analyzer is not None:
@@ -150,3 +172,5 @@ class DataHub:
 
         self.current_freq_result = None
         self.current_indicators = None
+        self.freq_result_revision += 1
+        self.state_revision += 1
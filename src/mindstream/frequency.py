@@ -7,6 +7,7 @@ from __future__ import annotations
 
 from collections import deque
 from dataclasses import dataclass, field
+from itertools import islice
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -35,12 +36,18 @@ class BandPower:
     relative_power: float  # 相対パワー (0-100%)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelBandPowers:
-    """単一チャンネルの全帯域パワー"""
+    """単一チャンネルの全帯域パワー
+
+    帯域数は固定（BAND_ORDER）のため、辞書ではなく帯域ごとのフィールドで保持する。
+    """
 
     channel_name: str
-    bands: dict[str, BandPower]
+    delta: BandPower | None = None
+    theta: BandPower | None = None
+    alpha: BandPower | None = None
+    beta: BandPower | None = None
 
 
 @dataclass
@@ -102,7 +109,7 @@ class PowerHistory:
 
         return [e for e in self.entries if e.timestamp >= cutoff]
 
-    def get_band_series(self, band_name: str, seconds: float) -> tuple[list[float], list[float]]:
+    def get_band_series(self, band_name: str, seconds: float) -> tuple[np.ndarray, np.ndarray]:
         """特定帯域の時系列データを取得
 
         Args:
@@ -110,16 +117,17 @@ class PowerHistory:
             seconds: 取得する秒数
 
         Returns:
-            (タイムスタンプのリスト, パワー値のリスト)
+            (タイムスタンプの配列, パワー値の配列)
         """
-        entries = self.get_recent(seconds)
-        timestamps = []
-        powers = []
-        for entry in entries:
-            if band_name in entry.band_powers:
-                timestamps.append(entry.timestamp)
-                powers.append(entry.band_powers[band_name])
-        return timestamps, powers
+        series = [
+            (entry.timestamp, entry.band_powers[band_name])
+            for entry in self.get_recent(seconds)
+            if band_name in entry.band_powers
+        ]
+        if not series:
+            return np.empty(0), np.empty(0)
+        data = np.array(series, dtype=np.float64)
+        return data[:, 0], data[:, 1]
 
 
 class FrequencyAnalyzer:
@@ -136,6 +144,7 @@ class FrequencyAnalyzer:
         self.sample_rate = sample_rate
         self._last_update_time: float = -float("inf")  # 初回は必ず更新
         self._cached_result: FrequencyAnalysisResult | None = None
+        self._cached_write_count: int | None = None  # キャッシュ結果の解析時のバッファ更新カウンタ
 
         # パワー履歴（300エントリ = 5分間 @ 1Hz更新）
         self.power_history = PowerHistory(max_entries=300)
@@ -143,8 +152,11 @@ class FrequencyAnalyzer:
         # FFT窓サイズ計算
         self._window_samples = int(config.window_seconds * sample_rate)
 
-        # Hanning窓を事前計算
-        self._hanning_window = np.hanning(self._window_samples)
+        # Hanning窓を事前計算（EEGサンプルは16bit精度のため、解析全体をfloat32で行う）
+        self._hanning_window = np.hanning(self._window_samples).astype(np.float32)
+
+        # 窓適用後のサンプルを書き込む作業配列（チャンネル数が変わったときのみ作り直す）
+        self._frames = np.empty((0, self._window_samples), dtype=np.float32)
 
         # 周波数ビンを事前計算
         self._freq_bins = np.fft.rfftfreq(self._window_samples, 1 / sample_rate)
@@ -152,6 +164,21 @@ class FrequencyAnalyzer:
         # 各帯域のFFTビンインデックスを事前計算
         self._band_indices = self._compute_band_indices()
 
+        # 帯域名と、np.add.reduceatで全帯域のパワーを一度に積算するための境界
+        # （[low0, high0, low1, high1, ...] の偶数番目の区間が各帯域になる）
+        self._band_names = tuple(self._band_indices)
+        self._band_edges = np.array(
+            [idx for band in self._band_indices.values() for idx in band], dtype=np.intp
+        )
+        # reduceatは空区間で0にならないため、空の帯域を別途記録しておく
+        self._empty_bands = np.array(
+            [low_idx >= high_idx for low_idx, high_idx in self._band_indices.values()]
+        )
+
+        # パワースペクトルの作業配列（チャンネル数が変わったときのみ作り直す）
+        # 帯域の上端がビン数と等しい場合もreduceatの境界として使えるよう、末尾に0の列を持つ
+        self._power = np.zeros((0, len(self._freq_bins) + 1), dtype=np.float32)
+
     def _compute_band_indices(self) -> dict[str, tuple[int, int]]:
         """各周波数帯域のFFTビンインデックスを計算"""
         indices = {}
@@ -161,6 +188,11 @@ class FrequencyAnalyzer:
             indices[band_name] = (low_idx, high_idx)
         return indices
 
+    @property
+    def window_samples(self) -> int:
+        """FFT窓のサンプル数"""
+        return self._window_samples
+
     def should_update(self, current_time: float) -> bool:
         """更新が必要かどうかを判定
 
@@ -172,18 +204,72 @@ class FrequencyAnalyzer:
         """
         return (current_time - self._last_update_time) >= self.config.update_interval_ms / 1000.0
 
+    def _windowed_frames(
+        self, buffers: list[deque[float]] | np.ndarray, num_channels: int
+    ) -> np.ndarray:
+        """全チャンネルの最新のFFT窓分のサンプルにHanning窓を適用
+
+        結果は作業配列に書き込むため、次回の呼び出しで上書きされる。
+
+        Args:
+            buffers: EEGデータバッファ
+            num_channels: 解析するチャンネル数
+
+        Returns:
+            形状 (チャンネル数, 窓サンプル数) のfloat32配列
+        """
+        window_samples = self._window_samples
+        num_channels = min(num_channels, len(buffers))
+        if self._frames.shape[0] != num_channels:
+            self._frames = np.empty((num_channels, window_samples), dtype=np.float32)
+        frames = self._frames
+
+        if isinstance(buffers, np.ndarray):
+            latest = buffers[:num_channels, -window_samples:]
+        else:
+            # dequeはリスト化せずに末尾のみ読み出す
+            for row, buffer in zip(frames, buffers, strict=False):
+                row[:] = np.fromiter(
+                    islice(buffer, len(buffer) - window_samples, None),
+                    dtype=np.float32,
+                    count=window_samples,
+                )
+            latest = frames
+
+        return np.multiply(latest, self._hanning_window, out=frames, casting="same_kind")
+
+    def _power_buffers(self, num_channels: int) -> tuple[np.ndarray, np.ndarray]:
+        """パワースペクトルの作業配列を取得
+
+        Args:
+            num_channels: チャンネル数
+
+        Returns:
+            (末尾に0の列を含む作業配列全体, パワースペクトルを書き込む部分のビュー)
+        """
+        if self._power.shape[0] != num_channels:
+            self._power = np.zeros((num_channels, len(self._freq_bins) + 1), dtype=np.float32)
+        return self._power, self._power[:, :-1]
+
     def analyze(
         self,
-        buffers: list[deque[float]],
+        buffers: list[deque[float]] | np.ndarray,
         channel_names: list[str],
         current_time: float,
+        *,
+        write_count: int | None = None,
     ) -> FrequencyAnalysisResult | None:
         """EEGバッファの周波数帯域解析を実行
 
+        write_countを渡した場合、前回の解析以降にバッファが更新されていなければ
+        更新間隔が経過していても再解析せずに前回の結果を返す（パワー履歴も追加しない）。
+
         Args:
-            buffers: EEGデータバッファのリスト（チャンネル別）
+            buffers: EEGデータバッファ（チャンネル別のdequeリスト、
+                または形状 (チャンネル数, サンプル数) の配列）
             channel_names: チャンネル名のリスト
             current_time: 現在時刻
+            write_count: バッファの更新カウンタ（RingBuffer.write_count等）
 
         Returns:
             解析結果、またはデータ不足の場合None
@@ -194,67 +280,69 @@ class FrequencyAnalyzer:
 
         self._last_update_time = current_time
 
+        # バッファ未更新チェック
+        if (
+            write_count is not None
+            and write_count == self._cached_write_count
+            and self._cached_result is not None
+        ):
+            return self._cached_result
+
         # データ量チェック
-        if not buffers or len(buffers[0]) < self._window_samples:
+        if len(buffers) == 0 or len(buffers[0]) < self._window_samples:
             return None
 
+        # 全チャンネルの最新窓にHanning窓を適用し、FFTも全チャンネル一括で計算
+        # （float32で計算するため、FFT結果はcomplex64になる）
+        windows = self._windowed_frames(buffers, len(channel_names))
+        fft_result = np.fft.rfft(windows, axis=1)
+        power, power_spectrum = self._power_buffers(len(windows))
+        np.square(fft_result.real, out=power_spectrum)
+        power_spectrum += np.square(fft_result.imag)
+
+        # 総パワー（相対パワー用）と各帯域のパワー: 形状 (チャンネル数, 帯域数)
+        total_powers = power_spectrum.sum(axis=1)[:, np.newaxis]
+        band_powers = np.add.reduceat(power, self._band_edges, axis=1)[:, ::2]
+        if self._empty_bands.any():
+            band_powers[:, self._empty_bands] = 0.0
+        relative_powers = np.zeros_like(band_powers)
+        np.divide(band_powers, total_powers, out=relative_powers, where=total_powers > 0)
+        relative_powers *= 100
+
+        band_names = self._band_names
         channel_powers: list[ChannelBandPowers] = []
-
-        # 平均計算用の累積値
-        band_power_sums: dict[str, tuple[float, float]] = dict.fromkeys(FREQUENCY_BANDS, (0.0, 0.0))
-
-        for buffer, ch_name in zip(buffers, channel_names, strict=False):
-            # 最新のサンプルを取得
-            data = np.array(list(buffer)[-self._window_samples :])
-
-            # Hanning窓を適用
-            windowed = data * self._hanning_window
-
-            # FFT計算
-            fft_result = np.fft.rfft(windowed)
-            power_spectrum = np.abs(fft_result) ** 2
-
-            # 総パワー計算（相対パワー用）
-            total_power = float(np.sum(power_spectrum))
-
-            # 各帯域のパワーを計算
-            bands: dict[str, BandPower] = {}
-            for band_name, (low_idx, high_idx) in self._band_indices.items():
-                band_power = float(np.sum(power_spectrum[low_idx:high_idx]))
-                relative = (band_power / total_power * 100) if total_power > 0 else 0.0
-
-                bands[band_name] = BandPower(
+        for ch_name, abs_row, rel_row in zip(
+            channel_names, band_powers.tolist(), relative_powers.tolist(), strict=False
+        ):
+            bands = {
+                band_name: BandPower(
                     band_name=band_name,
-                    absolute_power=band_power,
+                    absolute_power=absolute,
                     relative_power=relative,
                 )
-
-                # 累積値を更新
-                abs_sum, rel_sum = band_power_sums[band_name]
-                band_power_sums[band_name] = (abs_sum + band_power, rel_sum + relative)
-
-            channel_powers.append(
-                ChannelBandPowers(
-                    channel_name=ch_name,
-                    bands=bands,
-                )
-            )
+                for band_name, absolute, relative in zip(band_names, abs_row, rel_row, strict=True)
+            }
+            channel_powers.append(ChannelBandPowers(channel_name=ch_name, **bands))
 
         # 平均を計算
         num_channels = len(buffers)
-        average_powers: dict[str, BandPower] = {}
-        for band_name, (abs_sum, rel_sum) in band_power_sums.items():
-            average_powers[band_name] = BandPower(
+        abs_means = (band_powers.sum(axis=0) / num_channels).tolist()
+        rel_means = (relative_powers.sum(axis=0) / num_channels).tolist()
+        average_powers: dict[str, BandPower] = {
+            band_name: BandPower(
                 band_name=band_name,
-                absolute_power=abs_sum / num_channels,
-                relative_power=rel_sum / num_channels,
+                absolute_power=absolute,
+                relative_power=relative,
             )
+            for band_name, absolute, relative in zip(band_names, abs_means, rel_means, strict=True)
+        }
 
         self._cached_result = FrequencyAnalysisResult(
             channel_powers=channel_powers,
             average_powers=average_powers,
             timestamp=current_time,
         )
+        self._cached_write_count = write_count
 
         # パワー履歴に追加（平均の相対パワーを記録）
         history_entry = {band_name: bp.relative_power for band_name, bp in average_powers.items()}
@@ -8,12 +8,34 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
-import pygame  # noqa: TC002
+import pygame
 
 if TYPE_CHECKING:
     from mindstream.config import Config
 
 
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """キャッシュ用サーフェスをディスプレイのピクセル形式に変換
+
+    変換済みサーフェスは転送時のピクセル形式変換が不要になる。
+    変換先の形式はdisplay.set_mode()またはWindow.get_surface()で決まるため、
+    マルチウィンドウ構成でも変換される。変換先の形式が未設定の場合（テスト等）は
+    そのまま返す。
+
+    Args:
+        surface: 変換するサーフェス
+
+    Returns:
+        変換後のサーフェス
+    """
+    try:
+        if surface.get_flags() & pygame.SRCALPHA:
+            return surface.convert_alpha()
+        return surface.convert()
+    except pygame.error:
+        return surface
+
+
 class ViewPanel(ABC):
     """ビューパネルの抽象基底クラス
 
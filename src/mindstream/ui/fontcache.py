@@ -0,0 +1,32 @@
+"""MindStream Font Cache
+
+フォントオブジェクトの共有キャッシュ
+"""
+
+from __future__ import annotations
+
+import pygame
+
+# (フォント名, サイズ) ごとのフォント（pygame終了時にクリア）
+_FONT_CACHE: dict[tuple[str | None, int], pygame.font.Font] = {}
+
+
+def get_font(name: str | None, size: int) -> pygame.font.Font:
+    """フォントを取得（同じ名前・サイズのフォントは1つだけ生成して共有）
+
+    Args:
+        name: フォントファイル名（Noneでデフォルトフォント）
+        size: フォントサイズ
+
+    Returns:
+        フォント
+    """
+    key = (name, size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        # pygame.quit()後のフォントは無効になるため、終了時にキャッシュを破棄する
+        if not _FONT_CACHE:
+            pygame.register_quit(_FONT_CACHE.clear)
+        font = pygame.font.Font(name, size)
+        _FONT_CACHE[key] = font
+    return font
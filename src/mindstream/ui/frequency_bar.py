@@ -9,7 +9,10 @@ from typing import TYPE_CHECKING
 
 import pygame
 
-from mindstream.ui.base import ViewPanel
+from mindstream.constants import CHANNEL_NAMES
+from mindstream.frequency import BAND_ORDER
+from mindstream.ui.base import ViewPanel, to_display_format
+from mindstream.ui.fontcache import get_font
 
 if TYPE_CHECKING:
     from mindstream.config import Config
@@ -40,6 +43,16 @@ BAND_DISPLAY_NAMES: dict[str, str] = {
     "beta": "Beta",
 }
 
+# 平均セクション用の帯域描画仕様（色, 表示名）、BAND_ORDER順
+_AVERAGE_BAND_SPECS: tuple[tuple[tuple[int, int, int], str], ...] = tuple(
+    (BAND_COLORS[name], BAND_DISPLAY_NAMES[name][:5]) for name in BAND_ORDER
+)
+
+# チャンネル別セクション用の帯域描画仕様（色, 短縮ラベル）、BAND_ORDER順
+_CHANNEL_BAND_SPECS: tuple[tuple[tuple[int, int, int], str], ...] = tuple(
+    (BAND_COLORS[name], BAND_SHORT_LABELS[name]) for name in BAND_ORDER
+)
+
 
 class FrequencyBandPanel(ViewPanel):
     """周波数帯域パワー表示パネル"""
@@ -68,12 +81,13 @@ class FrequencyBandPanel(ViewPanel):
         self.panel_height = screen_height
 
         # フォント初期化
-        self.title_font = pygame.font.Font(None, 22)
-        self.label_font = pygame.font.Font(None, 18)
-        self.value_font = pygame.font.Font(None, 16)
+        self.title_font = get_font(None, 22)
+        self.label_font = get_font(None, 18)
+        self.value_font = get_font(None, 16)
 
-        # レイアウト計算
+        # レイアウト計算と静的部分のプリレンダリング
         self._calculate_layout()
+        self._compose_static()
 
         # 解析結果キャッシュ
         self._current_result: FrequencyAnalysisResult | None = None
@@ -95,6 +109,112 @@ class FrequencyBandPanel(ViewPanel):
         self.channel_bar_height = 10
         self.channel_bar_spacing = 14
 
+        # バー領域（平均セクション / チャンネル別セクション）
+        self.avg_bar_x = self.panel_x + 45
+        self.avg_bar_width = self.panel_width - 85
+        self.channel_bar_x = self.panel_x + 25
+        self.channel_bar_width = self.panel_width - 60
+
+    def _compose_static(self) -> None:
+        """静的部分を事前に合成
+
+        背景・境界線・タイトル・セクション見出し・帯域ラベル・バーのトラックは
+        設定とレイアウトのみに依存するため、初期化時に一度だけ描画しておく。
+        解析結果がない間に表示する「Analyzing...」版も合わせて用意する。
+        """
+        base = pygame.Surface(self.rect.size)
+        base.fill(self.config.colors.background)
+
+        # 左境界線
+        pygame.draw.line(base, self.config.colors.grid, (0, 0), (0, self.panel_height), 2)
+
+        # タイトル
+        title = self.title_font.render("FREQUENCY", True, self.config.colors.text)
+        base.blit(title, (10, self.title_y))
+
+        # データなし表示用
+        self._static_idle = base.copy()
+        no_data = self.label_font.render("Analyzing...", True, self.config.colors.grid)
+        self._static_idle.blit(no_data, (10, self.avg_section_y + 20))
+
+        # 解析結果表示用
+        self._static = base
+        if self.config.frequency.show_average:
+            self._compose_average_section(self._static)
+        if self.config.frequency.show_per_channel:
+            self._compose_channel_sections(self._static)
+
+        self._static_idle = to_display_format(self._static_idle)
+        self._static = to_display_format(self._static)
+
+    def _compose_average_section(self, surface: pygame.Surface) -> None:
+        """平均セクションの静的部分を描画（パネルのローカル座標）"""
+        header = self.label_font.render("AVERAGE", True, self.config.colors.text)
+        surface.blit(header, (10, self.avg_section_y))
+
+        y = self.avg_section_y + 18
+        for color, label in _AVERAGE_BAND_SPECS:
+            self._draw_bar_track(
+                surface, self.avg_bar_x, y, self.avg_bar_width, self.avg_bar_height, color, label
+            )
+            y += self.avg_bar_spacing
+
+    def _compose_channel_sections(self, surface: pygame.Surface) -> None:
+        """チャンネル別セクションの静的部分を描画（パネルのローカル座標）"""
+        y = self.channel_section_start_y
+        for channel_name in CHANNEL_NAMES:
+            # チャンネルヘッダー（チャンネル色で表示）
+            ch_color = self.config.colors.channels.get(channel_name, self.config.colors.text)
+            header = self.label_font.render(channel_name, True, ch_color)
+            surface.blit(header, (10, y))
+
+            bar_y = y + 16
+            for color, label in _CHANNEL_BAND_SPECS:
+                self._draw_bar_track(
+                    surface,
+                    self.channel_bar_x,
+                    bar_y,
+                    self.channel_bar_width,
+                    self.channel_bar_height,
+                    color,
+                    label,
+                )
+                bar_y += self.channel_bar_spacing
+
+            y += self.channel_section_height
+
+    def _draw_bar_track(
+        self,
+        surface: pygame.Surface,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        color: tuple[int, int, int],
+        label: str,
+    ) -> None:
+        """バーの静的部分（トラックとラベル）を描画
+
+        Args:
+            surface: 描画先サーフェス（パネルのローカル座標）
+            x: バーのX座標（画面座標）
+            y: バーのY座標（画面座標）
+            width: バーの幅
+            height: バーの高さ
+            color: バーの色
+            label: ラベル文字列
+        """
+        local_x = x - self.rect.x
+        local_y = y - self.rect.y
+
+        # 背景バー（トラック）
+        track_color = tuple(c // 3 for c in color)
+        pygame.draw.rect(surface, track_color, (local_x, local_y, width, height), border_radius=2)
+
+        # ラベル（バーの左）
+        label_surface = self.value_font.render(label, True, self.config.colors.text)
+        surface.blit(label_surface, (5, local_y))
+
     def update(self, data: FrequencyAnalysisResult | None) -> None:
         """パネルを更新
 
@@ -120,29 +240,13 @@ class FrequencyBandPanel(ViewPanel):
         Args:
             screen: 描画先サーフェス
         """
-        # パネル背景
-        panel_rect = pygame.Rect(self.panel_x, 0, self.panel_width, self.panel_height)
-        pygame.draw.rect(screen, self.config.colors.background, panel_rect)
-
-        # 左境界線
-        pygame.draw.line(
-            screen,
-            self.config.colors.grid,
-            (self.panel_x, 0),
-            (self.panel_x, self.panel_height),
-            2,
-        )
-
-        # タイトル
-        title = self.title_font.render("FREQUENCY", True, self.config.colors.text)
-        screen.blit(title, (self.panel_x + 10, self.title_y))
-
         if self._current_result is None:
-            # データなしメッセージ
-            no_data = self.label_font.render("Analyzing...", True, self.config.colors.grid)
-            screen.blit(no_data, (self.panel_x + 10, self.avg_section_y + 20))
+            screen.blit(self._static_idle, self.rect.topleft)
             return
 
+        # 静的部分を一括転送し、値に応じた部分のみ描画
+        screen.blit(self._static, self.rect.topleft)
+
         # 平均セクション描画
         if self.config.frequency.show_average:
             self._draw_average_section(screen)
@@ -160,10 +264,9 @@ class FrequencyBandPanel(ViewPanel):
         height: int,
         value: float,
         color: tuple[int, int, int],
-        label: str,
         show_value: bool = True,
     ) -> None:
-        """バーチャートを描画
+        """バーの動的部分（塗りつぶしと値）を描画
 
         Args:
             screen: 描画先サーフェス
@@ -173,22 +276,13 @@ class FrequencyBandPanel(ViewPanel):
             height: バーの高さ
             value: 値（0-100%）
             color: バーの色
-            label: ラベル文字列
             show_value: 値を表示するか
         """
-        # 背景バー（トラック）
-        track_color = tuple(c // 3 for c in color)
-        pygame.draw.rect(screen, track_color, (x, y, width, height), border_radius=2)
-
         # 塗りつぶし部分
         filled_width = int(width * min(value, 100) / 100)
         if filled_width > 0:
             pygame.draw.rect(screen, color, (x, y, filled_width, height), border_radius=2)
 
-        # ラベル（バーの左）
-        label_surface = self.value_font.render(label, True, self.config.colors.text)
-        screen.blit(label_surface, (self.panel_x + 5, y))
-
         # 値（バーの右）
         if show_value:
             value_text = f"{value:.0f}%"
@@ -199,28 +293,19 @@ class FrequencyBandPanel(ViewPanel):
         """平均セクションを描画"""
         assert self._current_result is not None
 
-        # セクションヘッダー
-        header = self.label_font.render("AVERAGE", True, self.config.colors.text)
-        screen.blit(header, (self.panel_x + 10, self.avg_section_y))
-
-        bar_x = self.panel_x + 45
-        bar_width = self.panel_width - 85
-
+        average_powers = self._current_result.average_powers
         y = self.avg_section_y + 18
-        for band_name in ["delta", "theta", "alpha", "beta"]:
-            band_power = self._current_result.average_powers.get(band_name)
+        for band_name, (color, _label) in zip(BAND_ORDER, _AVERAGE_BAND_SPECS, strict=True):
+            band_power = average_powers.get(band_name)
             if band_power:
-                color = BAND_COLORS[band_name]
-                label = BAND_DISPLAY_NAMES[band_name][:5]
                 self._draw_bar(
                     screen,
-                    bar_x,
+                    self.avg_bar_x,
                     y,
-                    bar_width,
+                    self.avg_bar_width,
                     self.avg_bar_height,
                     band_power.relative_power,
                     color,
-                    label,
                 )
             y += self.avg_bar_spacing
 
@@ -231,31 +316,18 @@ class FrequencyBandPanel(ViewPanel):
         y = self.channel_section_start_y
 
         for ch_powers in self._current_result.channel_powers:
-            # チャンネルヘッダー（チャンネル色で表示）
-            ch_color = self.config.colors.channels.get(
-                ch_powers.channel_name, self.config.colors.text
-            )
-            header = self.label_font.render(ch_powers.channel_name, True, ch_color)
-            screen.blit(header, (self.panel_x + 10, y))
-
-            bar_x = self.panel_x + 25
-            bar_width = self.panel_width - 60
             bar_y = y + 16
-
-            for band_name in ["delta", "theta", "alpha", "beta"]:
-                band_power = ch_powers.bands.get(band_name)
+            band_powers = (ch_powers.delta, ch_powers.theta, ch_powers.alpha, ch_powers.beta)
+            for (color, _label), band_power in zip(_CHANNEL_BAND_SPECS, band_powers, strict=True):
                 if band_power:
-                    color = BAND_COLORS[band_name]
-                    label = BAND_SHORT_LABELS[band_name]
                     self._draw_bar(
                         screen,
-                        bar_x,
+                        self.channel_bar_x,
                         bar_y,
-                        bar_width,
+                        self.channel_bar_width,
                         self.channel_bar_height,
                         band_power.relative_power,
                         color,
-                        label,
                     )
                 bar_y += self.channel_bar_spacing
 
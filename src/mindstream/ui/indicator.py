@@ -10,7 +10,8 @@ from typing import TYPE_CHECKING
 import pygame
 
 from mindstream.indicators import BrainStateIndicators, IndicatorCalculator
-from mindstream.ui.base import ViewPanel
+from mindstream.ui.base import ViewPanel, to_display_format
+from mindstream.ui.fontcache import get_font
 
 if TYPE_CHECKING:
     from mindstream.config import Config
@@ -24,6 +25,13 @@ INDICATOR_COLORS: dict[str, tuple[int, int, int]] = {
     "meditation": (200, 150, 255),  # 紫
 }
 
+# 変化量表示の色
+CHANGE_UP_COLOR: tuple[int, int, int] = (100, 255, 100)  # 緑
+CHANGE_DOWN_COLOR: tuple[int, int, int] = (255, 100, 100)  # 赤
+
+# 変化量表示の最大値（指標は0-100のため変化量の絶対値も100以下）
+MAX_CHANGE_PERCENT = 100
+
 
 class FocusRelaxPanel(ViewPanel):
     """集中度/リラックス度インジケーターパネル
@@ -63,13 +71,35 @@ class FocusRelaxPanel(ViewPanel):
         self._current_indicators: BrainStateIndicators | None = None
 
         # フォント初期化
-        self.title_font = pygame.font.Font(None, 22)
-        self.label_font = pygame.font.Font(None, 20)
-        self.value_font = pygame.font.Font(None, 18)
-        self.change_font = pygame.font.Font(None, 16)
+        self.title_font = get_font(None, 22)
+        self.label_font = get_font(None, 20)
+        self.value_font = get_font(None, 18)
+        self.change_font = get_font(None, 16)
+
+        # 変化量テキストを事前レンダリング（描画ループでの文字列整形・レンダリングを回避）
+        self._build_change_surfaces()
 
-        # レイアウト計算
+        # レイアウト計算と静的部分のプリレンダリング
         self._calculate_layout()
+        self._compose_static()
+
+    def _build_change_surfaces(self) -> None:
+        """変化量表示用のサーフェスを事前レンダリング
+
+        変化量は整数%に丸めて表示するため、0-100%の上昇/下降と横ばいの
+        全パターンを初期化時に一度だけレンダリングしておく。
+        """
+        self._change_up_surfaces: tuple[pygame.Surface, ...] = tuple(
+            to_display_format(self.change_font.render(f"\u2191{i}%", True, CHANGE_UP_COLOR))
+            for i in range(MAX_CHANGE_PERCENT + 1)
+        )
+        self._change_down_surfaces: tuple[pygame.Surface, ...] = tuple(
+            to_display_format(self.change_font.render(f"\u2193{i}%", True, CHANGE_DOWN_COLOR))
+            for i in range(MAX_CHANGE_PERCENT + 1)
+        )
+        self._change_flat_surface = to_display_format(
+            self.change_font.render("\u2192", True, self.config.colors.grid)
+        )
 
     def _calculate_layout(self) -> None:
         """UIレイアウトを計算"""
@@ -79,10 +109,98 @@ class FocusRelaxPanel(ViewPanel):
         self.gauge_spacing = 80
         self.gauge_margin = 15
 
+        # ゲージ領域
+        self.gauge_x = self.rect.x + self.gauge_margin
+        self.gauge_width = self.rect.width - self.gauge_margin * 2
+
+        # 表示するゲージ（ラベル, 指標名, 色）、上から順に配置
+        gauges: list[tuple[str, str, tuple[int, int, int]]] = []
+        if self.show_focus:
+            gauges.append(("FOCUS", "focus", INDICATOR_COLORS["focus"]))
+        if self.show_relax:
+            gauges.append(("RELAX", "relaxation", INDICATOR_COLORS["relaxation"]))
+        if self.show_meditation:
+            gauges.append(("MEDITATE", "meditation", INDICATOR_COLORS["meditation"]))
+        self._gauges = tuple(gauges)
+
         # トレンドグラフの領域
         self.trend_y = self.rect.height - 120
         self.trend_height = 80
 
+    def _compose_static(self) -> None:
+        """静的部分を事前に合成
+
+        背景・境界線・タイトル・ゲージのラベルとトラック・トレンドグラフの枠と
+        グリッドは設定とレイアウトのみに依存するため、初期化時に一度だけ描画しておく。
+        指標がまだない間に表示する「Analyzing...」版も合わせて用意する。
+        """
+        base = pygame.Surface(self.rect.size)
+        base.fill(self.config.colors.background)
+
+        # 左境界線
+        pygame.draw.line(base, self.config.colors.grid, (0, 0), (0, self.rect.height), 2)
+
+        # タイトル
+        title = self.title_font.render("BRAIN STATE", True, self.config.colors.text)
+        base.blit(title, (10, self.title_y))
+
+        # データなし表示用
+        self._static_idle = base.copy()
+        no_data = self.label_font.render("Analyzing...", True, self.config.colors.grid)
+        self._static_idle.blit(no_data, (10, self.gauge_start_y + 20))
+
+        # 指標表示用
+        self._static = base
+        gauge_x = self.gauge_margin
+        bar_height = self.gauge_height - 22
+        for i, (label, _name, color) in enumerate(self._gauges):
+            gauge_y = self.gauge_start_y + i * self.gauge_spacing
+
+            # ラベル
+            label_surface = self.label_font.render(label, True, self.config.colors.text)
+            self._static.blit(label_surface, (gauge_x, gauge_y))
+
+            # ゲージの背景バー
+            track_color = tuple(c // 3 for c in color)
+            pygame.draw.rect(
+                self._static,
+                track_color,
+                (gauge_x, gauge_y + 22, self.gauge_width, bar_height),
+                border_radius=3,
+            )
+
+        if self.show_trend:
+            self._compose_mini_trend(self._static)
+
+        self._static_idle = to_display_format(self._static_idle)
+        self._static = to_display_format(self._static)
+
+    def _compose_mini_trend(self, surface: pygame.Surface) -> None:
+        """ミニトレンドグラフの静的部分を描画（パネルのローカル座標）"""
+        trend_x = self.gauge_margin
+        trend_y = self.trend_y
+        trend_width = self.gauge_width
+        trend_height = self.trend_height
+
+        # セクションヘッダー
+        header = self.label_font.render("TREND (1min)", True, self.config.colors.text)
+        surface.blit(header, (trend_x, trend_y - 18))
+
+        # グラフ背景
+        graph_rect = pygame.Rect(trend_x, trend_y, trend_width, trend_height)
+        pygame.draw.rect(surface, (15, 15, 25), graph_rect)
+
+        # グリッド線
+        for i in range(1, 4):
+            grid_y = trend_y + int(trend_height * i / 4)
+            pygame.draw.line(
+                surface,
+                self.config.colors.grid,
+                (trend_x, grid_y),
+                (trend_x + trend_width, grid_y),
+                1,
+            )
+
     def update(self, data: FrequencyAnalysisResult | None) -> None:
         """パネルを更新
 
@@ -98,72 +216,23 @@ class FocusRelaxPanel(ViewPanel):
         Args:
             screen: 描画先サーフェス
         """
-        # パネル背景
-        pygame.draw.rect(screen, self.config.colors.background, self.rect)
-
-        # 左境界線
-        pygame.draw.line(
-            screen,
-            self.config.colors.grid,
-            (self.rect.x, self.rect.y),
-            (self.rect.x, self.rect.bottom),
-            2,
-        )
-
-        # タイトル
-        title = self.title_font.render("BRAIN STATE", True, self.config.colors.text)
-        screen.blit(title, (self.rect.x + 10, self.rect.y + self.title_y))
-
         # データがない場合
         if self._current_indicators is None:
-            no_data = self.label_font.render("Analyzing...", True, self.config.colors.grid)
-            screen.blit(no_data, (self.rect.x + 10, self.rect.y + self.gauge_start_y + 20))
+            screen.blit(self._static_idle, self.rect.topleft)
             return
 
-        # ゲージを描画
-        gauge_y = self.rect.y + self.gauge_start_y
-        gauge_x = self.rect.x + self.gauge_margin
-        gauge_width = self.rect.width - self.gauge_margin * 2
+        # 静的部分を一括転送し、値に応じた部分のみ描画
+        screen.blit(self._static, self.rect.topleft)
 
-        if self.show_focus:
-            focus_change = self.calculator.history.get_change("focus", 10.0)
+        for i, (_label, name, color) in enumerate(self._gauges):
             self._draw_gauge(
                 screen,
-                gauge_x,
-                gauge_y,
-                gauge_width,
-                "FOCUS",
-                self._current_indicators.focus_level,
-                INDICATOR_COLORS["focus"],
-                focus_change,
-            )
-            gauge_y += self.gauge_spacing
-
-        if self.show_relax:
-            relax_change = self.calculator.history.get_change("relaxation", 10.0)
-            self._draw_gauge(
-                screen,
-                gauge_x,
-                gauge_y,
-                gauge_width,
-                "RELAX",
-                self._current_indicators.relaxation_level,
-                INDICATOR_COLORS["relaxation"],
-                relax_change,
-            )
-            gauge_y += self.gauge_spacing
-
-        if self.show_meditation:
-            med_change = self.calculator.history.get_change("meditation", 10.0)
-            self._draw_gauge(
-                screen,
-                gauge_x,
-                gauge_y,
-                gauge_width,
-                "MEDITATE",
-                self._current_indicators.meditation_level,
-                INDICATOR_COLORS["meditation"],
-                med_change,
+                self.gauge_x,
+                self.rect.y + self.gauge_start_y + i * self.gauge_spacing,
+                self.gauge_width,
+                getattr(self._current_indicators, f"{name}_level"),
+                color,
+                self.calculator.history.get_change(name, 10.0),
             )
 
         # トレンドグラフを描画
@@ -176,84 +245,53 @@ class FocusRelaxPanel(ViewPanel):
         x: int,
         y: int,
         width: int,
-        label: str,
         value: float,
         color: tuple[int, int, int],
         change: float | None = None,
     ) -> None:
-        """ゲージを描画
+        """ゲージの動的部分（値・塗りつぶし・変化量）を描画
 
         Args:
             screen: 描画先サーフェス
             x: X座標
             y: Y座標
             width: ゲージ幅
-            label: ラベル
             value: 値 (0-100)
             color: ゲージ色
             change: 変化量
         """
-        # ラベル
-        label_surface = self.label_font.render(label, True, self.config.colors.text)
-        screen.blit(label_surface, (x, y))
-
         # 値とパーセンテージ
         value_text = f"{value:.0f}%"
         value_surface = self.value_font.render(value_text, True, self.config.colors.text)
         screen.blit(value_surface, (x + width - value_surface.get_width(), y))
 
-        # ゲージの背景バー
+        # ゲージの塗りつぶし
         bar_y = y + 22
         bar_height = self.gauge_height - 22
-        track_color = tuple(c // 3 for c in color)
-        pygame.draw.rect(screen, track_color, (x, bar_y, width, bar_height), border_radius=3)
-
-        # ゲージの塗りつぶし
         filled_width = int(width * min(value, 100) / 100)
         if filled_width > 0:
             pygame.draw.rect(screen, color, (x, bar_y, filled_width, bar_height), border_radius=3)
 
         # 変化量表示
         if change is not None:
+            # 表示上の丸め（f"{v:.0f}"と同じ偶数丸め）で事前レンダリング済みサーフェスを選択
+            magnitude = min(MAX_CHANGE_PERCENT, round(abs(change)))
             if change > 0:
-                change_text = f"\u2191{change:.0f}%"
-                change_color = (100, 255, 100)  # 緑
+                change_surface = self._change_up_surfaces[magnitude]
             elif change < 0:
-                change_text = f"\u2193{abs(change):.0f}%"
-                change_color = (255, 100, 100)  # 赤
+                change_surface = self._change_down_surfaces[magnitude]
             else:
-                change_text = "\u2192"
-                change_color = self.config.colors.grid
+                change_surface = self._change_flat_surface
 
-            change_surface = self.change_font.render(change_text, True, change_color)
             screen.blit(change_surface, (x, bar_y + bar_height + 2))
 
     def _draw_mini_trend(self, screen: pygame.Surface) -> None:
-        """ミニトレンドグラフを描画"""
-        trend_x = self.rect.x + self.gauge_margin
+        """ミニトレンドグラフの線を描画"""
+        trend_x = self.gauge_x
         trend_y = self.rect.y + self.trend_y
-        trend_width = self.rect.width - self.gauge_margin * 2
+        trend_width = self.gauge_width
         trend_height = self.trend_height
 
-        # セクションヘッダー
-        header = self.label_font.render("TREND (1min)", True, self.config.colors.text)
-        screen.blit(header, (trend_x, trend_y - 18))
-
-        # グラフ背景
-        graph_rect = pygame.Rect(trend_x, trend_y, trend_width, trend_height)
-        pygame.draw.rect(screen, (15, 15, 25), graph_rect)
-
-        # グリッド線
-        for i in range(1, 4):
-            grid_y = trend_y + int(trend_height * i / 4)
-            pygame.draw.line(
-                screen,
-                self.config.colors.grid,
-                (trend_x, grid_y),
-                (trend_x + trend_width, grid_y),
-                1,
-            )
-
         # 履歴データを取得
         entries = self.calculator.history.get_recent(self.trend_window_seconds)
         if len(entries) < 2:
@@ -263,15 +301,7 @@ class FocusRelaxPanel(ViewPanel):
         earliest_time = latest_time - self.trend_window_seconds
 
         # 各指標の線を描画
-        indicators_to_draw = []
-        if self.show_focus:
-            indicators_to_draw.append(("focus", INDICATOR_COLORS["focus"]))
-        if self.show_relax:
-            indicators_to_draw.append(("relaxation", INDICATOR_COLORS["relaxation"]))
-        if self.show_meditation:
-            indicators_to_draw.append(("meditation", INDICATOR_COLORS["meditation"]))
-
-        for indicator_name, color in indicators_to_draw:
+        for _label, indicator_name, color in self._gauges:
             points: list[tuple[int, int]] = []
 
             for entry in entries:
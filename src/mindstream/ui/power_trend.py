@@ -10,7 +10,8 @@ from typing import TYPE_CHECKING
 import pygame
 
 from mindstream.frequency import BAND_ORDER, PowerHistory
-from mindstream.ui.base import ViewPanel
+from mindstream.ui.base import ViewPanel, to_display_format
+from mindstream.ui.fontcache import get_font
 from mindstream.ui.frequency_bar import BAND_COLORS, BAND_DISPLAY_NAMES
 
 if TYPE_CHECKING:
@@ -44,12 +45,13 @@ class PowerTrendPanel(ViewPanel):
         self.show_legend = config.view.power_trend.show_legend
 
         # フォント初期化
-        self.title_font = pygame.font.Font(None, 22)
-        self.label_font = pygame.font.Font(None, 16)
-        self.value_font = pygame.font.Font(None, 14)
+        self.title_font = get_font(None, 22)
+        self.label_font = get_font(None, 16)
+        self.value_font = get_font(None, 14)
 
-        # レイアウト計算
+        # レイアウト計算と静的部分のプリレンダリング
         self._calculate_layout()
+        self._compose_static()
 
     def _calculate_layout(self) -> None:
         """UIレイアウトを計算"""
@@ -82,46 +84,54 @@ class PowerTrendPanel(ViewPanel):
         """パネルを更新（履歴は外部で更新されるため、ここでは何もしない）"""
         pass
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """パネルを描画
+    def _compose_static(self) -> None:
+        """静的部分（背景・枠線・タイトル・凡例・グリッド・軸ラベル）を1枚のサーフェスに合成
 
-        Args:
-            screen: 描画先サーフェス
+        これらはレイアウトと設定のみに依存するため、毎フレーム描画せず
+        初期化時に一度だけ合成しておき、draw()では1回のblitで済ませる。
         """
-        # パネル背景
-        pygame.draw.rect(screen, self.config.colors.background, self.rect)
+        self._static = pygame.Surface(self.rect.size)
+        surface = self._static
+        surface.fill(self.config.colors.background)
+
+        # 以降はパネル左上を原点としたローカル座標で描画
+        graph_x = self.graph_x - self.rect.x
+        graph_y = self.graph_y - self.rect.y
 
         # 左境界線
-        pygame.draw.line(
-            screen,
-            self.config.colors.grid,
-            (self.rect.x, self.rect.y),
-            (self.rect.x, self.rect.bottom),
-            2,
-        )
+        pygame.draw.line(surface, self.config.colors.grid, (0, 0), (0, self.rect.height), 2)
 
         # タイトル
         title = self.title_font.render("POWER TREND", True, self.config.colors.text)
-        screen.blit(title, (self.rect.x + 10, self.rect.y + self.title_y))
+        surface.blit(title, (10, self.title_y))
 
         # 時間表示
         time_text = self.value_font.render(
             f"{self.time_window_seconds}s", True, self.config.colors.text
         )
-        screen.blit(
-            time_text, (self.rect.right - self.graph_margin_right - 20, self.rect.y + self.title_y)
-        )
+        surface.blit(time_text, (self.rect.width - self.graph_margin_right - 20, self.title_y))
 
-        # 凡例を描画
+        # 凡例
         if self.show_legend:
-            self._draw_legend(screen)
+            self._draw_legend(surface)
 
         # グラフ背景
-        graph_rect = pygame.Rect(self.graph_x, self.graph_y, self.graph_width, self.graph_height)
-        pygame.draw.rect(screen, (15, 15, 25), graph_rect)
+        graph_rect = pygame.Rect(graph_x, graph_y, self.graph_width, self.graph_height)
+        pygame.draw.rect(surface, (15, 15, 25), graph_rect)
+
+        # グリッド線
+        self._draw_grid(surface, graph_x, graph_y)
+
+        self._static = to_display_format(surface)
 
-        # グリッド線を描画
-        self._draw_grid(screen)
+    def draw(self, screen: pygame.Surface) -> None:
+        """パネルを描画
+
+        Args:
+            screen: 描画先サーフェス
+        """
+        # 静的部分を一括転送
+        screen.blit(self._static, self.rect.topleft)
 
         # データがない場合
         if self.power_history is None or not self.power_history.entries:
@@ -138,10 +148,10 @@ class PowerTrendPanel(ViewPanel):
         # 各帯域の時系列データを描画
         self._draw_trend_lines(screen)
 
-    def _draw_legend(self, screen: pygame.Surface) -> None:
-        """凡例を描画"""
-        legend_y = self.rect.y + self.graph_margin_top
-        legend_x = self.rect.x + self.graph_margin_left
+    def _draw_legend(self, surface: pygame.Surface) -> None:
+        """凡例を描画（パネルのローカル座標）"""
+        legend_y = self.graph_margin_top
+        legend_x = self.graph_margin_left
 
         for i, band_name in enumerate(BAND_ORDER):
             color = BAND_COLORS[band_name]
@@ -149,45 +159,51 @@ class PowerTrendPanel(ViewPanel):
 
             # 色付きの四角
             box_rect = pygame.Rect(legend_x + i * 70, legend_y, 12, 12)
-            pygame.draw.rect(screen, color, box_rect)
+            pygame.draw.rect(surface, color, box_rect)
 
             # ラベル
             label_surface = self.value_font.render(label, True, self.config.colors.text)
-            screen.blit(label_surface, (legend_x + i * 70 + 16, legend_y))
+            surface.blit(label_surface, (legend_x + i * 70 + 16, legend_y))
+
+    def _draw_grid(self, surface: pygame.Surface, graph_x: int, graph_y: int) -> None:
+        """グリッド線を描画（パネルのローカル座標）
 
-    def _draw_grid(self, screen: pygame.Surface) -> None:
-        """グリッド線を描画"""
+        Args:
+            surface: 描画先サーフェス
+            graph_x: グラフ領域のX座標
+            graph_y: グラフ領域のY座標
+        """
         # 水平線（25%, 50%, 75%）
         for i in range(1, 4):
-            y = self.graph_y + int(self.graph_height * i / 4)
+            y = graph_y + int(self.graph_height * i / 4)
             pygame.draw.line(
-                screen,
+                surface,
                 self.config.colors.grid,
-                (self.graph_x, y),
-                (self.graph_x + self.graph_width, y),
+                (graph_x, y),
+                (graph_x + self.graph_width, y),
                 1,
             )
             # パーセンテージラベル
             pct = 100 - i * 25
             pct_text = self.value_font.render(f"{pct}%", True, self.config.colors.grid)
-            screen.blit(pct_text, (self.rect.x + 5, y - 6))
+            surface.blit(pct_text, (5, y - 6))
 
         # Y軸の0%と100%ラベル
         label_100 = self.value_font.render("100%", True, self.config.colors.grid)
-        screen.blit(label_100, (self.rect.x + 5, self.graph_y - 6))
+        surface.blit(label_100, (5, graph_y - 6))
 
         label_0 = self.value_font.render("0%", True, self.config.colors.grid)
-        screen.blit(label_0, (self.rect.x + 5, self.graph_y + self.graph_height - 6))
+        surface.blit(label_0, (5, graph_y + self.graph_height - 6))
 
         # 垂直線（時間軸）
         num_time_lines = min(6, self.time_window_seconds)
         for i in range(num_time_lines + 1):
-            x = self.graph_x + int(self.graph_width * i / num_time_lines)
+            x = graph_x + int(self.graph_width * i / num_time_lines)
             pygame.draw.line(
-                screen,
+                surface,
                 self.config.colors.grid,
-                (x, self.graph_y),
-                (x, self.graph_y + self.graph_height),
+                (x, graph_y),
+                (x, graph_y + self.graph_height),
                 1,
             )
 
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 
 import pygame
 
+from mindstream.ui.fontcache import get_font
+
 if TYPE_CHECKING:
     from mindstream.config import Config
 
@@ -151,7 +153,7 @@ class SliderPanel:
         self.panel_x = screen_width - self.panel_width
 
         # フォント初期化
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font(None, 20)
 
         # 色設定
         slider_colors = {
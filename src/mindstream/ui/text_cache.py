@@ -0,0 +1,33 @@
+"""MindStream Text Cache
+
+レンダリング済みテキストサーフェスのキャッシュ
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pygame  # noqa: TC002
+
+from mindstream.ui.base import to_display_format
+
+
+@lru_cache(maxsize=256)
+def render_text(
+    font: pygame.font.Font,
+    text: str,
+    color: tuple[int, int, int],
+) -> pygame.Surface:
+    """テキストをレンダリング（同じフォント・文字列・色の結果は再利用）
+
+    返されるサーフェスは共有されるため、呼び出し側で書き換えないこと。
+
+    Args:
+        font: フォント
+        text: 描画する文字列
+        color: 文字色
+
+    Returns:
+        アンチエイリアス済みのテキストサーフェス
+    """
+    return to_display_format(font.render(text, True, color))
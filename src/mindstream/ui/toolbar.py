@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 import pygame
 
 from mindstream.constants import LayoutPreset, ViewMode
+from mindstream.ui.base import to_display_format
+from mindstream.ui.fontcache import get_font
 
 if TYPE_CHECKING:
     from mindstream.config import Config
@@ -37,7 +39,7 @@ class ToolbarButton:
             on_click: クリック時のコールバック
         """
         self.rect = rect
-        self.label = label
+        self._label = label
         self.shortcut = shortcut
         self.mode = mode
         self.on_click = on_click
@@ -45,64 +47,83 @@ class ToolbarButton:
         self.active = False
         self.hovered = False
 
-    def handle_event(self, event: pygame.event.Event) -> bool:
-        """イベントを処理
+        # 状態別（idle/hovered/active）の描画済みサーフェス
+        self._surfaces: dict[str, pygame.Surface] = {}
 
-        Args:
-            event: pygameイベント
+    @property
+    def label(self) -> str:
+        """ボタンラベルを取得"""
+        return self._label
 
-        Returns:
-            クリックされた場合True
-        """
-        if event.type == pygame.MOUSEMOTION:
-            self.hovered = self.rect.collidepoint(event.pos)
-
-        elif (
-            event.type == pygame.MOUSEBUTTONDOWN
-            and event.button == 1
-            and self.rect.collidepoint(event.pos)
-        ):
-            if self.on_click:
-                self.on_click()
-            return True
+    @label.setter
+    def label(self, value: str) -> None:
+        """ボタンラベルを設定（変更時のみキャッシュを破棄）"""
+        if value != self._label:
+            self._label = value
+            self._surfaces.clear()
 
-        return False
+    def _state(self) -> str:
+        """現在の描画状態を取得"""
+        if self.active:
+            return "active"
+        if self.hovered:
+            return "hovered"
+        return "idle"
 
-    def draw(self, screen: pygame.Surface, font: pygame.font.Font, colors: dict) -> None:
-        """ボタンを描画
+    def _build_cache(self, font: pygame.font.Font, colors: dict) -> None:
+        """状態別のボタンサーフェスを作成
 
         Args:
-            screen: 描画先サーフェス
             font: フォント
             colors: 色設定
         """
-        # 背景色
-        if self.active:
-            bg_color = (60, 80, 120)
-        elif self.hovered:
-            bg_color = (50, 50, 70)
-        else:
-            bg_color = (35, 35, 50)
+        label_surface = font.render(self.label, True, colors["text"])
+        shortcut_surface = font.render(f"[{self.shortcut}]", True, colors["grid"])
 
-        pygame.draw.rect(screen, bg_color, self.rect, border_radius=4)
+        width, height = self.rect.size
+        label_pos = ((width - label_surface.get_width()) // 2, 4)
+        shortcut_pos = (
+            (width - shortcut_surface.get_width()) // 2,
+            height - shortcut_surface.get_height() - 4,
+        )
+        local_rect = pygame.Rect(0, 0, width, height)
 
-        # ボーダー
-        border_color = (100, 100, 140) if self.active else colors["grid"]
-        pygame.draw.rect(screen, border_color, self.rect, width=1, border_radius=4)
+        states = {
+            "idle": ((35, 35, 50), colors["grid"]),
+            "hovered": ((50, 50, 70), colors["grid"]),
+            "active": ((60, 80, 120), (100, 100, 140)),
+        }
+        for state, (bg_color, border_color) in states.items():
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            pygame.draw.rect(surface, bg_color, local_rect, border_radius=4)
+            pygame.draw.rect(surface, border_color, local_rect, width=1, border_radius=4)
+            surface.blit(label_surface, label_pos)
+            surface.blit(shortcut_surface, shortcut_pos)
+            self._surfaces[state] = to_display_format(surface)
 
-        # ラベル
-        label_surface = font.render(self.label, True, colors["text"])
-        label_x = self.rect.x + (self.rect.width - label_surface.get_width()) // 2
-        label_y = self.rect.y + 4
+    def get_surface(self, font: pygame.font.Font, colors: dict) -> pygame.Surface:
+        """現在の状態のボタンサーフェスを取得
 
-        screen.blit(label_surface, (label_x, label_y))
+        Args:
+            font: フォント
+            colors: 色設定
 
-        # ショートカット表示
-        shortcut_surface = font.render(f"[{self.shortcut}]", True, colors["grid"])
-        shortcut_x = self.rect.x + (self.rect.width - shortcut_surface.get_width()) // 2
-        shortcut_y = self.rect.y + self.rect.height - shortcut_surface.get_height() - 4
+        Returns:
+            背景・ボーダー・ラベル描画済みのサーフェス
+        """
+        if not self._surfaces:
+            self._build_cache(font, colors)
+        return self._surfaces[self._state()]
 
-        screen.blit(shortcut_surface, (shortcut_x, shortcut_y))
+    def draw(self, screen: pygame.Surface, font: pygame.font.Font, colors: dict) -> None:
+        """ボタンを描画
+
+        Args:
+            screen: 描画先サーフェス
+            font: フォント
+            colors: 色設定
+        """
+        screen.blit(self.get_surface(font, colors), self.rect)
 
 
 class Toolbar:
@@ -135,12 +156,51 @@ class Toolbar:
         self.visible = True
 
         # フォント
-        self.font = pygame.font.Font(None, 16)
+        self.font = get_font(None, 16)
+        self._button_colors = {
+            "text": config.colors.text,
+            "grid": config.colors.grid,
+        }
 
         # ボタン作成
         self.buttons: list[ToolbarButton] = []
         self._create_buttons()
 
+        # ヒットテスト用（ボタン矩形のリストをまとめて判定）
+        self._button_rects = [button.rect for button in self.buttons]
+        self._cursor_rect = pygame.Rect(0, 0, 1, 1)
+        self._hovered_index = -1
+
+        # 背景と下境界線を描画済みのサーフェス
+        self._bg_surface = self._build_background()
+        self._bg_pos = (0, 0)
+
+    def _build_background(self) -> pygame.Surface:
+        """背景と下境界線のサーフェスを作成"""
+        surface = pygame.Surface((self.screen_width, self.height))
+        surface.fill((25, 25, 35))
+        pygame.draw.line(
+            surface,
+            self.config.colors.grid,
+            (0, self.height - 1),
+            (self.screen_width, self.height - 1),
+            1,
+        )
+        return to_display_format(surface)
+
+    def resize(self, screen_width: int) -> None:
+        """画面幅の変更に追従
+
+        Args:
+            screen_width: 新しい画面幅
+        """
+        if screen_width == self.screen_width:
+            return
+
+        self.screen_width = screen_width
+        self.cycle_button.rect.x = screen_width - self.cycle_button.rect.width - 10
+        self._bg_surface = self._build_background()
+
     def _create_buttons(self) -> None:
         """ボタンを作成"""
         button_width = 70
@@ -244,7 +304,7 @@ class Toolbar:
         self.cycle_button.label = labels.get(preset, "Layout")
 
     def process_event(self, event: pygame.event.Event) -> bool:
-        """イベントを処理
+        """イベントを処理（クリックのみ。ホバーはupdate_hoverで更新する）
 
         Args:
             event: pygameイベント
@@ -255,7 +315,47 @@ class Toolbar:
         if not self.visible:
             return False
 
-        return any(button.handle_event(event) for button in self.buttons)
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            index = self._hit_test(event.pos)
+            if index >= 0:
+                button = self.buttons[index]
+                if button.on_click:
+                    button.on_click()
+                return True
+
+        return False
+
+    def update_hover(self, pos: tuple[int, int]) -> None:
+        """ホバー状態を更新
+
+        ホバー表示には最終的なマウス位置だけが必要なため、MOUSEMOTIONイベントごとではなく
+        フレームごとに1回、現在のマウス座標で呼び出す。
+
+        Args:
+            pos: 現在のマウス座標
+        """
+        if not self.visible:
+            return
+
+        index = self._hit_test(pos)
+        if index != self._hovered_index:
+            if self._hovered_index >= 0:
+                self.buttons[self._hovered_index].hovered = False
+            if index >= 0:
+                self.buttons[index].hovered = True
+            self._hovered_index = index
+
+    def _hit_test(self, pos: tuple[int, int]) -> int:
+        """座標にあるボタンのインデックスを取得
+
+        Args:
+            pos: マウス座標
+
+        Returns:
+            ボタンのインデックス（該当なしの場合-1）
+        """
+        self._cursor_rect.topleft = pos
+        return self._cursor_rect.collidelist(self._button_rects)
 
     def draw(self, screen: pygame.Surface) -> None:
         """ツールバーを描画
@@ -266,23 +366,13 @@ class Toolbar:
         if not self.visible:
             return
 
-        # 背景
-        toolbar_rect = pygame.Rect(0, 0, self.screen_width, self.height)
-        pygame.draw.rect(screen, (25, 25, 35), toolbar_rect)
+        # 背景・下境界線
+        screen.blit(self._bg_surface, self._bg_pos)
 
-        # 下境界線
-        pygame.draw.line(
-            screen,
-            self.config.colors.grid,
-            (0, self.height - 1),
-            (self.screen_width, self.height - 1),
-            1,
+        # ボタン描画（状態別キャッシュをまとめて転送）
+        screen.fblits(
+            [
+                (button.get_surface(self.font, self._button_colors), button.rect)
+                for button in self.buttons
+            ]
         )
-
-        # ボタン描画
-        colors = {
-            "text": self.config.colors.text,
-            "grid": self.config.colors.grid,
-        }
-        for button in self.buttons:
-            button.draw(screen, self.font, colors)
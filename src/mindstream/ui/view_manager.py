@@ -16,6 +16,21 @@ if TYPE_CHECKING:
     from mindstream.frequency import FrequencyAnalysisResult
     from mindstream.ui.base import ViewPanel
 
+# レイアウトプリセットごとのアクティブモード
+_LAYOUT_MODES: dict[LayoutPreset, frozenset[ViewMode]] = {
+    # 生波形 + 周波数バー
+    LayoutPreset.CLASSIC: frozenset({ViewMode.RAW_WAVEFORM, ViewMode.FREQUENCY_BARS}),
+    # パワートレンド + 周波数バー
+    LayoutPreset.TREND: frozenset({ViewMode.POWER_TREND, ViewMode.FREQUENCY_BARS}),
+    # インジケーター + 周波数バー
+    LayoutPreset.INDICATOR: frozenset({ViewMode.FOCUS_RELAX, ViewMode.FREQUENCY_BARS}),
+    # 全パネル表示
+    LayoutPreset.FULL: frozenset(ViewMode),
+}
+
+# サイクル順のプリセット
+_PRESET_CYCLE: tuple[LayoutPreset, ...] = tuple(LayoutPreset)
+
 
 class ViewManager:
     """ビューパネルの管理・切り替え
@@ -38,6 +53,9 @@ class ViewManager:
         self.panels: dict[ViewMode, ViewPanel] = {}
         self.active_modes: set[ViewMode] = set()
 
+        # パネルごとに最後に渡した解析結果（同一オブジェクトなら再更新しない）
+        self._last_data: dict[ViewMode, FrequencyAnalysisResult | None] = {}
+
         # デフォルトレイアウトを設定
         self._layout_preset = LayoutPreset.CLASSIC
         self._apply_layout_preset(self._layout_preset)
@@ -68,26 +86,9 @@ class ViewManager:
         Args:
             preset: レイアウトプリセット
         """
+        # 外部から参照を保持されるため、セットはその場で更新する
         self.active_modes.clear()
-
-        if preset == LayoutPreset.CLASSIC:
-            # 生波形 + 周波数バー
-            self.active_modes.add(ViewMode.RAW_WAVEFORM)
-            self.active_modes.add(ViewMode.FREQUENCY_BARS)
-        elif preset == LayoutPreset.TREND:
-            # パワートレンド + 周波数バー
-            self.active_modes.add(ViewMode.POWER_TREND)
-            self.active_modes.add(ViewMode.FREQUENCY_BARS)
-        elif preset == LayoutPreset.INDICATOR:
-            # インジケーター + 周波数バー
-            self.active_modes.add(ViewMode.FOCUS_RELAX)
-            self.active_modes.add(ViewMode.FREQUENCY_BARS)
-        elif preset == LayoutPreset.FULL:
-            # 全パネル表示
-            self.active_modes.add(ViewMode.RAW_WAVEFORM)
-            self.active_modes.add(ViewMode.POWER_TREND)
-            self.active_modes.add(ViewMode.FOCUS_RELAX)
-            self.active_modes.add(ViewMode.FREQUENCY_BARS)
+        self.active_modes.update(_LAYOUT_MODES.get(preset, ()))
 
     def toggle_mode(self, mode: ViewMode) -> None:
         """特定モードのON/OFF切り替え
@@ -117,10 +118,9 @@ class ViewManager:
         Returns:
             新しいレイアウトプリセット
         """
-        presets = list(LayoutPreset)
-        current_index = presets.index(self._layout_preset)
-        next_index = (current_index + 1) % len(presets)
-        self.layout_preset = presets[next_index]
+        current_index = _PRESET_CYCLE.index(self._layout_preset)
+        next_index = (current_index + 1) % len(_PRESET_CYCLE)
+        self.layout_preset = _PRESET_CYCLE[next_index]
         return self._layout_preset
 
     def update(self, data: FrequencyAnalysisResult | None) -> None:
@@ -129,9 +129,14 @@ class ViewManager:
         Args:
             data: 周波数解析結果
         """
-        for mode in self.active_modes:
-            if mode in self.panels:
-                self.panels[mode].update(data)
+        # 登録順に走査（setのハッシュ順に依存しない）
+        for mode, panel in self.panels.items():
+            if mode not in self.active_modes or not panel.visible:
+                continue
+            if mode in self._last_data and self._last_data[mode] is data:
+                continue
+            panel.update(data)
+            self._last_data[mode] = data
 
     def process_event(self, event: pygame.event.Event) -> bool:
         """イベントを処理
@@ -142,8 +147,8 @@ class ViewManager:
         Returns:
             イベントが処理された場合True
         """
-        for mode in self.active_modes:
-            if mode in self.panels and self.panels[mode].process_event(event):
+        for mode, panel in self.panels.items():
+            if mode in self.active_modes and panel.process_event(event):
                 return True
         return False
 
@@ -153,11 +158,11 @@ class ViewManager:
         Args:
             screen: 描画先サーフェス
         """
-        for mode in self.active_modes:
-            if mode in self.panels:
-                panel = self.panels[mode]
-                if panel.visible:
-                    panel.draw(screen)
+        # 非表示またはクリップ領域外のパネルは描画しない
+        clip = screen.get_clip()
+        for mode, panel in self.panels.items():
+            if mode in self.active_modes and panel.visible and clip.colliderect(panel.rect):
+                panel.draw(screen)
 
     def get_active_panel_widths(self) -> dict[ViewMode, int]:
         """アクティブなパネルの幅を取得
@@ -166,7 +171,7 @@ class ViewManager:
             モードとパネル幅のマッピング
         """
         widths: dict[ViewMode, int] = {}
-        for mode in self.active_modes:
-            if mode in self.panels:
-                widths[mode] = self.panels[mode].rect.width
+        for mode, panel in self.panels.items():
+            if mode in self.active_modes:
+                widths[mode] = panel.rect.width
         return widths
@@ -5,14 +5,16 @@ BlueMuse + Muse2 リアルタイム脳波可視化クラス
 
 from __future__ import annotations
 
+import threading
 import time
-from collections import deque
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pygame
-from pylsl import StreamInlet, resolve_byprop
+from pylsl import StreamInlet, cf_double64, cf_float32, resolve_byprop
 
+from mindstream.buffer import RingBuffer
 from mindstream.constants import (
     AMPLITUDE_SCALE_MAX,
     AMPLITUDE_SCALE_MIN,
@@ -23,6 +25,9 @@ from mindstream.constants import (
     LayoutPreset,
     ViewMode,
 )
+from mindstream.ui.base import to_display_format
+from mindstream.ui.fontcache import get_font
+from mindstream.ui.text_cache import render_text
 
 if TYPE_CHECKING:
     from mindstream.config import Config
@@ -38,6 +43,52 @@ if TYPE_CHECKING:
         ViewManager,
     )
 
+# 1回のpull_chunkで取得する最大サンプル数（取り込みスレッド）
+PULL_MAX_SAMPLES = 64
+
+# メインループで処理するイベント種別（ツールバー・スライダー・キー操作・終了）
+_HANDLED_EVENT_TYPES = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+)
+
+# 画面の再描画だけが必要なウィンドウイベント種別（再表示・復元・サイズ変更）
+# 変化のないフレームは描画を省略するため、これらを受け取ったら全体を描き直す
+_REPAINT_EVENT_TYPES = (
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWSIZECHANGED,
+    pygame.VIDEOEXPOSE,
+)
+
+
+@dataclass(frozen=True)
+class _Geometry:
+    """波形描画の寸法と作業配列
+
+    ウィンドウ寸法・表示秒数・振幅スケールのみに依存するため、
+    これらが変わったときだけ作り直す。Y座標は波形レイヤー内の座標。
+    """
+
+    plot_width: int
+    channel_height: int
+    display_samples: int
+    scale: np.float32
+    tops: np.ndarray
+    centers: np.ndarray
+    bottoms: np.ndarray
+    label_ys: tuple[int, ...]
+    decimate: bool
+    bin_edges: np.ndarray
+    xs: list[int]
+    envelope: np.ndarray
+    scaled: np.ndarray
+    ys: np.ndarray
+
 
 class EEGVisualizer:
     """EEG信号のリアルタイム可視化クラス"""
@@ -51,6 +102,10 @@ class EEGVisualizer:
         pygame.init()
         self.config = config
 
+        # 処理しないイベント種別はキューに積ませない
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENT_TYPES + _REPAINT_EVENT_TYPES)
+
         # ツールバーの高さ
         self.toolbar_height = 40
 
@@ -62,19 +117,131 @@ class EEGVisualizer:
         self.screen = pygame.display.set_mode((total_width, total_height))
         pygame.display.set_caption("MindStream - Muse2 EEG Visualizer")
         self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, config.fonts.label_size)
-        self.title_font = pygame.font.Font(None, config.fonts.title_size)
+        self.font = get_font(None, config.fonts.label_size)
+        self.title_font = get_font(None, config.fonts.title_size)
 
-        # ViewManagerを初期化
-        from mindstream.ui import ViewManager
+        # UIパネル・解析器を初期化
+        self._init_panels(total_width)
 
-        self.view_manager: ViewManager = ViewManager(
-            config, total_width, config.display.window_height
+        # 波形領域の右側に重ねて表示されるパネル（表示モード, パネル）
+        self._strip_overlays = (
+            (ViewMode.POWER_TREND, self.power_trend_panel),
+            (ViewMode.FOCUS_RELAX, self.indicator_panel),
         )
 
-        # ツールバーを初期化
-        from mindstream.ui import Toolbar
+        # 生波形ビューをViewManagerに登録（ダミーパネルとして）
+        self.view_manager.active_modes.add(ViewMode.RAW_WAVEFORM)
+
+        # 初期レイアウトを設定
+        self._apply_initial_layout()
+
+        # データバッファ（全チャンネル共通のリングバッファ）
+        self.buffers = RingBuffer(NUM_CHANNELS, config.eeg.buffer_size)
+
+        # LSL接続
+        self.inlet: StreamInlet | None = None
+        self.connected = False
+        self._pull_buf: np.ndarray | None = None
+        # 表示対象のチャンネル数（接続時にストリームのチャンネル数から決定）
+        self._n_ch = NUM_CHANNELS
+
+        # バックグラウンド取り込みスレッド（描画フレームレートとLSL受信を分離）
+        self._buffer_lock = threading.Lock()
+        self._ingest_thread: threading.Thread | None = None
+        self._stop_ingest = threading.Event()
+        # 描画済みのバッファ更新カウンタ
+        self._seen_write_count = self.buffers.write_count
+
+        # 表示パラメータ（調整可能）
+        self._display_seconds = config.eeg.default_display_seconds
+        self._amplitude_scale = config.eeg.default_amplitude_scale
+
+        # 設定値表示のキャッシュ（スライダー操作で値が連続的に変わるため、
+        # 共有のテキストキャッシュには入れず直近の1件のみ保持）
+        self._settings_blit: tuple[pygame.Surface, tuple[int, int]] | None = None
+        self._settings_key: tuple[int, int] | None = None
+
+        # 中央揃えで表示する固定テキストのサーフェスと描画位置（フォント・文字列・色・Y座標ごと）
+        self._centered_cache: dict[
+            tuple[pygame.font.Font, str, tuple[int, int, int], int],
+            tuple[pygame.Surface, tuple[int, int]],
+        ] = {}
+
+        # 背景グリッドのキャッシュ
+        self._grid_surface: pygame.Surface | None = None
+        self._grid_key: tuple[int, int, int, int] | None = None
+
+        # 波形レイヤー（線幅分の上下余白付き）
+        self._wave_margin = config.layout.line_thickness
+        self._wave_surface = pygame.Surface(
+            (
+                config.display.window_width,
+                config.display.window_height - 150 + self._wave_margin * 2 + 1,
+            ),
+            pygame.SRCALPHA,
+        ).convert_alpha()
+
+        # 波形領域（グリッドと波形レイヤーを合わせた範囲）
+        # 新規サンプルのみのフレームではこの範囲だけを描き直して画面へ反映する
+        padding = config.layout.padding
+        self._wave_strip_rect = pygame.Rect(
+            (0, self.toolbar_height + 100 - self._wave_margin),
+            self._wave_surface.get_size(),
+        ).union(
+            pygame.Rect(
+                padding,
+                self.toolbar_height + 100,
+                config.display.window_width - padding * 2 + 1,
+                config.display.window_height - padding - 100 + 1,
+            )
+        )
+
+        # チャンネルごとの波形色とラベル（設定から一度だけ解決）
+        self._channel_colors = tuple(
+            config.colors.channels.get(name, (255, 255, 255)) for name in CHANNEL_NAMES
+        )
+        self._channel_labels = tuple(
+            render_text(self.font, name, color)
+            for name, color in zip(CHANNEL_NAMES, self._channel_colors, strict=True)
+        )
+
+        # 波形描画の寸法（表示パラメータ変更時にNoneへ戻し、次の描画で再計算）
+        self._geom: _Geometry | None = None
+
+        # 波形レイヤーの描画内容に対応するバッファ更新カウンタと寸法
+        # （どちらも変わっていなければレイヤーを描き直さずに転送する）
+        self._layer_write_count = -1
+        self._layer_geom: _Geometry | None = None
+
+    def _init_panels(self, total_width: int) -> None:
+        """ツールバー・各パネル・解析器を初期化
+
+        Args:
+            total_width: ウィンドウの総幅
+        """
+        from mindstream.frequency import FrequencyAnalyzer
+        from mindstream.indicators import IndicatorCalculator
+        from mindstream.ui import (
+            FocusRelaxPanel,
+            FrequencyBandPanel,
+            PowerTrendPanel,
+            SliderPanel,
+            Toolbar,
+            ViewManager,
+        )
+
+        config = self.config
+        window_height = config.display.window_height
+
+        # 右側パネル（パワートレンド・インジケーター）の右端（周波数パネルの左）
+        side_panel_right = total_width
+        if config.frequency.enabled:
+            side_panel_right -= config.frequency.panel_width
+
+        # ViewManagerを初期化
+        self.view_manager: ViewManager = ViewManager(config, total_width, window_height)
 
+        # ツールバーを初期化
         self.toolbar: Toolbar = Toolbar(
             config,
             total_width,
@@ -83,109 +250,53 @@ class EEGVisualizer:
         )
 
         # スライダーパネルを初期化
-        self.slider_panel: SliderPanel | None = None  # type: ignore[unresolved-reference]
+        self.slider_panel: SliderPanel | None = None
         if config.slider.enabled:
-            from mindstream.ui import SliderPanel
-
-            slider_screen_width = total_width
-            if config.frequency.enabled:
-                slider_screen_width -= config.frequency.panel_width
-
-            self.slider_panel = SliderPanel(
-                config,
-                slider_screen_width,
-                config.display.window_height,
-            )
+            self.slider_panel = SliderPanel(config, side_panel_right, window_height)
 
         # 周波数解析を初期化
-        self.frequency_analyzer: FrequencyAnalyzer | None = None  # type: ignore[unresolved-reference]
-        self.frequency_panel: FrequencyBandPanel | None = None  # type: ignore[unresolved-reference]
+        self.frequency_analyzer: FrequencyAnalyzer | None = None
+        self.frequency_panel: FrequencyBandPanel | None = None
         if config.frequency.enabled:
-            from mindstream.frequency import FrequencyAnalyzer
-            from mindstream.ui import FrequencyBandPanel
-
             self.frequency_analyzer = FrequencyAnalyzer(
                 config.frequency,
                 config.eeg.sample_rate,
             )
-            self.frequency_panel = FrequencyBandPanel(
-                config,
-                total_width,
-                config.display.window_height,
-            )
+            self.frequency_panel = FrequencyBandPanel(config, total_width, window_height)
             self.view_manager.register_panel(ViewMode.FREQUENCY_BARS, self.frequency_panel)
 
         # パワートレンドパネルを初期化（常に初期化、切り替え可能に）
-        self.power_trend_panel: PowerTrendPanel | None = None  # type: ignore[unresolved-reference]
-        if True:
-            from mindstream.ui import PowerTrendPanel
-
-            panel_width = config.view.power_trend.panel_width
-            panel_x = total_width - panel_width
-            if config.frequency.enabled:
-                panel_x -= config.frequency.panel_width
-
-            self.power_trend_panel = PowerTrendPanel(
-                config,
-                pygame.Rect(
-                    panel_x, self.toolbar_height, panel_width, config.display.window_height
-                ),
-            )
-            if self.frequency_analyzer:
-                self.power_trend_panel.set_power_history(self.frequency_analyzer.power_history)
-            self.view_manager.register_panel(ViewMode.POWER_TREND, self.power_trend_panel)
+        panel_width = config.view.power_trend.panel_width
+        self.power_trend_panel: PowerTrendPanel = PowerTrendPanel(
+            config,
+            pygame.Rect(
+                side_panel_right - panel_width, self.toolbar_height, panel_width, window_height
+            ),
+        )
+        if self.frequency_analyzer:
+            self.power_trend_panel.set_power_history(self.frequency_analyzer.power_history)
+        self.view_manager.register_panel(ViewMode.POWER_TREND, self.power_trend_panel)
 
         # インジケーターパネルを初期化（常に初期化、切り替え可能に）
-        self.indicator_calculator: IndicatorCalculator | None = None  # type: ignore[unresolved-reference]
-        self.indicator_panel: FocusRelaxPanel | None = None  # type: ignore[unresolved-reference]
-        if True:
-            from mindstream.indicators import IndicatorCalculator
-            from mindstream.ui import FocusRelaxPanel
-
-            self.indicator_calculator = IndicatorCalculator(config.indicator)
-
-            panel_width = config.view.indicator.panel_width
-            panel_x = total_width - panel_width
-            if config.frequency.enabled:
-                panel_x -= config.frequency.panel_width
-
-            self.indicator_panel = FocusRelaxPanel(
-                config,
-                pygame.Rect(
-                    panel_x, self.toolbar_height, panel_width, config.display.window_height
-                ),
-                self.indicator_calculator,
-            )
-            self.view_manager.register_panel(ViewMode.FOCUS_RELAX, self.indicator_panel)
+        self.indicator_calculator: IndicatorCalculator = IndicatorCalculator(config.indicator)
+        panel_width = config.view.indicator.panel_width
+        self.indicator_panel: FocusRelaxPanel = FocusRelaxPanel(
+            config,
+            pygame.Rect(
+                side_panel_right - panel_width, self.toolbar_height, panel_width, window_height
+            ),
+            self.indicator_calculator,
+        )
+        self.view_manager.register_panel(ViewMode.FOCUS_RELAX, self.indicator_panel)
 
         # イベントマネージャーを初期化
-        self.event_manager: EventManager | None = None  # type: ignore[unresolved-reference]
+        self.event_manager: EventManager | None = None
         if config.events.enabled:
             from mindstream.events import EventManager
 
             self.event_manager = EventManager(config.events)
             self.event_manager.dispatcher.register_handler(self._on_brain_event)
 
-        # 生波形ビューをViewManagerに登録（ダミーパネルとして）
-        self.view_manager.active_modes.add(ViewMode.RAW_WAVEFORM)
-
-        # 初期レイアウトを設定
-        self._apply_initial_layout()
-
-        # データバッファ（各チャンネル用）
-        buffer_size = config.eeg.buffer_size
-        self.buffers: list[deque[float]] = [deque(maxlen=buffer_size) for _ in range(NUM_CHANNELS)]
-        for buf in self.buffers:
-            buf.extend([0.0] * buffer_size)
-
-        # LSL接続
-        self.inlet: StreamInlet | None = None
-        self.connected = False
-
-        # 表示パラメータ（調整可能）
-        self._display_seconds = config.eeg.default_display_seconds
-        self._amplitude_scale = config.eeg.default_amplitude_scale
-
     def _calculate_total_width(self) -> int:
         """ウィンドウの総幅を計算"""
         total_width = self.base_width
@@ -233,7 +344,7 @@ class EEGVisualizer:
     @display_seconds.setter
     def display_seconds(self, value: int) -> None:
         """表示秒数を設定（スライダーと同期）"""
-        self._display_seconds = value
+        self._set_view_params(value, self._amplitude_scale)
         if self.slider_panel is not None:
             self.slider_panel.display_seconds = value
 
@@ -245,10 +356,76 @@ class EEGVisualizer:
     @amplitude_scale.setter
     def amplitude_scale(self, value: int) -> None:
         """振幅スケールを設定（スライダーと同期）"""
-        self._amplitude_scale = value
+        self._set_view_params(self._display_seconds, value)
         if self.slider_panel is not None:
             self.slider_panel.amplitude_scale = value
 
+    def _set_view_params(self, display_seconds: int, amplitude_scale: int) -> None:
+        """表示秒数と振幅スケールを更新（変更時のみ描画寸法を破棄）
+
+        Args:
+            display_seconds: 表示秒数
+            amplitude_scale: 振幅スケール
+        """
+        if display_seconds != self._display_seconds or amplitude_scale != self._amplitude_scale:
+            self._display_seconds = display_seconds
+            self._amplitude_scale = amplitude_scale
+            self._geom = None
+
+    def _geometry(self) -> _Geometry:
+        """波形描画の寸法を取得（未計算の場合のみ計算）"""
+        if self._geom is None:
+            self._geom = self._build_geometry()
+        return self._geom
+
+    def _build_geometry(self) -> _Geometry:
+        """現在のウィンドウ寸法と表示パラメータから描画寸法を計算"""
+        width = self.config.display.window_width
+        height = self.config.display.window_height
+        padding = self.config.layout.padding
+        margin = self._wave_margin
+
+        plot_width = width - padding * 2
+        channel_height = (height - 150) // NUM_CHANNELS
+
+        # 表示するサンプル数（最新のdisplay_samples分のみ）
+        display_samples = self._display_seconds * self.config.eeg.sample_rate
+        count = min(display_samples, self.buffers.size)
+
+        # データをダウンサンプリング（描画用）
+        # 描画幅の2倍以上のサンプルがある場合のみmin/maxデシメーションを行う
+        decimate = count >= plot_width * 2
+        if decimate:
+            bin_edges = (np.arange(plot_width) * count) // plot_width
+            xs_array = np.repeat(padding + np.arange(plot_width), 2)
+        else:
+            bin_edges = np.zeros(0, dtype=np.intp)
+            xs_array = padding + (np.arange(count) * plot_width) // max(count, 1)
+        num_points = len(xs_array)
+
+        tops = margin + np.arange(NUM_CHANNELS, dtype=np.int32)[:, np.newaxis] * channel_height
+        centers = tops + channel_height // 2
+        return _Geometry(
+            plot_width=plot_width,
+            channel_height=channel_height,
+            display_samples=display_samples,
+            # スケーリング（amplitude_scaleを使用）。バッファと同じfloat32で保持し、
+            # 射影計算全体をfloat32のまま行う
+            scale=np.float32(channel_height / (self._amplitude_scale * 2)),
+            tops=tops,
+            centers=centers,
+            bottoms=tops + channel_height,
+            label_ys=tuple(int(y) - 10 for y in centers[:, 0]),
+            decimate=decimate,
+            bin_edges=bin_edges,
+            # 座標リストはzipで組み立てるためPythonのintリストで保持
+            xs=xs_array.tolist(),
+            # 射影用の作業配列（毎フレームの一時配列確保を避ける）
+            envelope=np.empty((NUM_CHANNELS, plot_width, 2), dtype=np.float32),
+            scaled=np.empty((NUM_CHANNELS, num_points), dtype=np.float32),
+            ys=np.empty((NUM_CHANNELS, num_points), dtype=np.int32),
+        )
+
     def connect_to_stream(self) -> bool:
         """LSLストリームに接続"""
         print("LSL EEGストリームを検索中...")
@@ -258,152 +435,339 @@ class EEGVisualizer:
             print("EEGストリームが見つかりません。BlueMuseが起動していることを確認してください。")
             return False
 
-        print(f"ストリームが見つかりました: {streams[0].name()}")
-        self.inlet = StreamInlet(streams[0], max_chunklen=12)
+        info = streams[0]
+        print(f"ストリームが見つかりました: {info.name()}")
+        # 再接続時は取り込みスレッドを止めてから受信側の状態を差し替える
+        # （受信中のpullが新しいinletと古い受信先配列を組み合わせないように）
+        self._stop_ingest_thread()
+        # 受信側が遅れた場合もリングバッファ分を超えて溜め込まない
+        self.inlet = StreamInlet(
+            info, max_buflen=self.config.eeg.max_buffer_seconds, max_chunklen=12
+        )
+        self._n_ch = min(NUM_CHANNELS, info.channel_count())
+        self._pull_buf = self._allocate_pull_buffer(info.channel_format(), info.channel_count())
         self.connected = True
+        self._start_ingest_thread()
         return True
 
-    def update_data(self) -> None:
-        """LSLからデータを取得してバッファを更新"""
-        if not self.connected or self.inlet is None:
+    @staticmethod
+    def _allocate_pull_buffer(channel_format: int, channel_count: int) -> np.ndarray | None:
+        """pull_chunkの受信先バッファを確保
+
+        Args:
+            channel_format: ストリームのチャンネル形式（pylslのcf_*定数）
+            channel_count: ストリームのチャンネル数
+
+        Returns:
+            受信先配列（float系以外の形式ではNone）
+        """
+        dtypes = {cf_float32: np.float32, cf_double64: np.float64}
+        dtype = dtypes.get(channel_format)
+        if dtype is None:
+            return None
+        return np.empty((PULL_MAX_SAMPLES, channel_count), dtype=dtype)
+
+    def _start_ingest_thread(self) -> None:
+        """取り込みスレッドを開始（起動済みの場合は何もしない）"""
+        if self._ingest_thread is not None and self._ingest_thread.is_alive():
             return
 
-        # 利用可能なすべてのサンプルを取得
-        samples, _ = self.inlet.pull_chunk(timeout=0.0, max_samples=32)
+        self._stop_ingest.clear()
+        self._ingest_thread = threading.Thread(
+            target=self._ingest_loop, name="mindstream-ingest", daemon=True
+        )
+        self._ingest_thread.start()
+
+    def _stop_ingest_thread(self) -> None:
+        """取り込みスレッドを停止"""
+        self._stop_ingest.set()
+        if self._ingest_thread is not None:
+            self._ingest_thread.join(timeout=1.0)
+            self._ingest_thread = None
+
+    def _ingest_loop(self) -> None:
+        """取り込みスレッド本体
 
-        if samples:
-            for sample in samples:
-                for i in range(min(NUM_CHANNELS, len(sample))):
-                    value = sample[i]
-                    # NaN値は前の値を維持（または0）
-                    if np.isnan(value):
-                        value = self.buffers[i][-1] if self.buffers[i] else 0.0
-                    self.buffers[i].append(float(value))
+        pull_chunkはタイムアウト待ちの間GILを解放するため、描画ループと並行して受信できる。
+        """
+        while not self._stop_ingest.is_set():
+            if not self._pull_chunk(timeout=0.05, max_samples=PULL_MAX_SAMPLES):
+                self._stop_ingest.wait(0.05)
+
+    def _pull_chunk(self, timeout: float, max_samples: int) -> bool:
+        """LSLからチャンクを取得してバッファに追加
+
+        Args:
+            timeout: 受信待ちのタイムアウト（秒）
+            max_samples: 1回に取得する最大サンプル数
+
+        Returns:
+            接続中の場合True
+        """
+        inlet = self.inlet
+        if not self.connected or inlet is None:
+            return False
+
+        pull_buf = self._pull_buf
+        if pull_buf is not None:
+            # liblslが受信先配列へ直接書き込む（Pythonのリスト変換なし）
+            _, timestamps = inlet.pull_chunk(
+                timeout=timeout, max_samples=max_samples, dest_obj=pull_buf[:max_samples]
+            )
+            chunk = pull_buf[: len(timestamps), : self._n_ch]
+        else:
+            samples, _ = inlet.pull_chunk(timeout=timeout, max_samples=max_samples)
+            if not samples:
+                return True
+            chunk = np.asarray(samples, dtype=np.float32)[:, : self._n_ch]
+
+        if len(chunk):
+            # NaN値は前の値を維持
+            with self._buffer_lock:
+                self.buffers.ingest(chunk)
+        return True
+
+    def _snapshot(self, n: int) -> tuple[np.ndarray, int]:
+        """直近nサンプルのコピーとバッファ更新カウンタを取得
+
+        latest()のビューは取り込みスレッドの書き込みで古いサンプル側から上書きされうるため、
+        ロック内でコピーして描画・解析中に内容が変わらないようにする。
+
+        Args:
+            n: 取得するサンプル数
+
+        Returns:
+            形状 (チャンネル数, n) の配列と、コピー時点の更新カウンタ
+        """
+        with self._buffer_lock:
+            return self.buffers.latest(n).copy(), self.buffers.write_count
+
+    def update_data(self) -> bool:
+        """LSLからデータを取得してバッファを更新
+
+        取り込みスレッドの稼働中はスレッド側でバッファが更新されるため受信は行わない。
+
+        Returns:
+            前回の呼び出し以降にバッファが更新された場合True
+        """
+        if self._ingest_thread is None or not self._ingest_thread.is_alive():
+            # 利用可能なすべてのサンプルを取得
+            self._pull_chunk(timeout=0.0, max_samples=32)
+
+        write_count = self.buffers.write_count
+        if write_count == self._seen_write_count:
+            return False
+        self._seen_write_count = write_count
+        return True
 
     def draw_grid(self) -> None:
         """背景グリッドを描画"""
         width = self.config.display.window_width
         height = self.config.display.window_height
         padding = self.config.layout.padding
-        offset_y = self.toolbar_height
+
+        # 寸法・表示秒数が変わったときのみグリッドを再作成
+        key = (width, height, padding, self._display_seconds)
+        if self._grid_surface is None or key != self._grid_key:
+            self._grid_surface = self._build_grid_surface(width, height, padding)
+            self._grid_key = key
+
+        self.screen.blit(self._grid_surface, (padding, self.toolbar_height + 100))
+
+    def _build_grid_surface(self, width: int, height: int, padding: int) -> pygame.Surface:
+        """背景グリッドをサーフェスに描画
+
+        Args:
+            width: 波形領域の幅
+            height: 波形領域の高さ
+            padding: 余白
+
+        Returns:
+            波形領域（グリッド左上基準）のサーフェス
+        """
+        grid_width = width - padding * 2
+        grid_height = height - padding - 100
+        surface = pygame.Surface((grid_width + 1, grid_height + 1)).convert()
+        surface.fill(self.config.colors.background)
+        grid_color = self.config.colors.grid
+        draw_line = pygame.draw.line
+        display_seconds = self._display_seconds
 
         # 水平線
         for i in range(NUM_CHANNELS + 1):
-            y = offset_y + 100 + i * (height - 150) // NUM_CHANNELS
-            pygame.draw.line(
-                self.screen, self.config.colors.grid, (padding, y), (width - padding, y), 1
-            )
+            y = i * (height - 150) // NUM_CHANNELS
+            draw_line(surface, grid_color, (0, y), (grid_width, y), 1)
 
         # 垂直線（1秒ごと）
-        for i in range(self._display_seconds + 1):
-            x = padding + i * (width - padding * 2) // self._display_seconds
-            pygame.draw.line(
-                self.screen,
-                self.config.colors.grid,
-                (x, offset_y + 100),
-                (x, offset_y + height - padding),
-                1,
-            )
+        for i in range(display_seconds + 1):
+            x = i * grid_width // display_seconds
+            draw_line(surface, grid_color, (x, 0), (x, grid_height), 1)
+
+        return surface
 
     def draw_waveforms(self) -> None:
         """EEG波形を描画"""
-        width = self.config.display.window_width
-        height = self.config.display.window_height
-        padding = self.config.layout.padding
-        offset_y = self.toolbar_height
+        geom = self._geometry()
+        layer = self._wave_surface
+        layer_pos = (0, self.toolbar_height + 100 - self._wave_margin)
 
-        plot_width = width - padding * 2
-        channel_height = (height - 150) // NUM_CHANNELS
+        # 前回の描画以降にサンプルも寸法も変わっていなければ描画済みのレイヤーを再利用
+        if self.buffers.write_count == self._layer_write_count and geom is self._layer_geom:
+            self.screen.blit(layer, layer_pos)
+            return
 
-        # 表示するサンプル数
-        display_samples = self._display_seconds * self.config.eeg.sample_rate
+        data, write_count = self._snapshot(geom.display_samples)
+        if data.shape[1] < 2:
+            return
+
+        if geom.decimate:
+            # min/maxデシメーション: 1ピクセル列ごとに最小値と最大値の2点を残してピークを保持
+            envelope = geom.envelope
+            np.minimum.reduceat(data, geom.bin_edges, axis=1, out=envelope[:, :, 0])
+            np.maximum.reduceat(data, geom.bin_edges, axis=1, out=envelope[:, :, 1])
+            downsampled = envelope.reshape(NUM_CHANNELS, geom.plot_width * 2)
+        else:
+            downsampled = data
+
+        # 全チャンネルを波形レイヤーに描画し、最後に1回だけ画面へ転送
+        layer.fill((0, 0, 0, 0))
+
+        # 全チャンネルのY座標を作業配列上でまとめて計算（レイヤー内座標）
+        # 値は0方向へ切り捨ててから中心線からのオフセットとして加算する
+        scaled = np.multiply(downsampled, -geom.scale, out=geom.scaled)
+        ys = geom.ys
+        np.copyto(ys, scaled, casting="unsafe")
+        ys += geom.centers
+        np.clip(ys, geom.tops, geom.bottoms, out=ys)
+        ys_rows = ys.tolist()
+
+        # ループ内で参照する属性・関数をローカル変数に退避
+        xs = geom.xs
+        label_ys = geom.label_ys
+        colors = self._channel_colors
+        labels = self._channel_labels
+        thickness = self.config.layout.line_thickness
+        draw_lines = pygame.draw.lines
+        blit = layer.blit
 
         for ch in range(NUM_CHANNELS):
-            # チャンネルの中心Y座標
-            center_y = offset_y + 100 + ch * channel_height + channel_height // 2
+            points = list(zip(xs, ys_rows[ch], strict=True))
 
-            # データを取得（最新のdisplay_samples分のみ）
-            data = list(self.buffers[ch])[-display_samples:]
+            # 波形を描画
+            if len(points) > 1:
+                draw_lines(layer, colors[ch], False, points, thickness)
 
-            if len(data) < 2:
-                continue
+            # チャンネル名を描画
+            blit(labels[ch], (10, label_ys[ch]))
 
-            # データをダウンサンプリング（描画用）
-            step = max(1, len(data) // plot_width)
-            downsampled = data[::step]
-
-            # スケーリング（amplitude_scaleを使用）
-            scale = channel_height / (self._amplitude_scale * 2)
-
-            # ポイントリストを作成
-            points: list[tuple[int, int]] = []
-            for i, value in enumerate(downsampled):
-                x = padding + (i * plot_width) // len(downsampled)
-                y = center_y - int(value * scale)
-                y = max(
-                    offset_y + 100 + ch * channel_height,
-                    min(offset_y + 100 + (ch + 1) * channel_height, y),
-                )
-                points.append((x, y))
+        self._layer_write_count = write_count
+        self._layer_geom = geom
+        self.screen.blit(layer, layer_pos)
 
-            # 波形を描画
-            channel_name = CHANNEL_NAMES[ch]
-            channel_color = self.config.colors.channels.get(channel_name, (255, 255, 255))
+    def redraw_waveform_strip(self) -> pygame.Rect:
+        """波形領域のみを再描画
 
-            if len(points) > 1:
-                pygame.draw.lines(
-                    self.screen,
-                    channel_color,
-                    False,
-                    points,
-                    self.config.layout.line_thickness,
-                )
+        領域外にはみ出す描画はクリップされる。パワートレンド・インジケーターパネルは
+        ウィンドウの上下全体を覆って波形領域の右側に重なるため、表示中のパネルの
+        左端より右は再描画の対象から外し、パネルの表示を残す。
 
-            # チャンネル名を描画
-            label = self.font.render(channel_name, True, channel_color)
-            self.screen.blit(label, (10, center_y - 10))
+        Returns:
+            再描画した矩形
+        """
+        rect = self._wave_strip_rect
+        active_modes = self.view_manager.active_modes
+        for mode, panel in self._strip_overlays:
+            if mode in active_modes and panel.rect.colliderect(rect):
+                rect = rect.clip(0, rect.top, panel.rect.left, rect.height)
+        screen = self.screen
+        screen.set_clip(rect)
+        screen.fill(self.config.colors.background, rect)
+        self.draw_grid()
+        self.draw_waveforms()
+        self.draw_status()
+        screen.set_clip(None)
+        return rect
+
+    def _centered_pos(self, surface: pygame.Surface, y: int) -> tuple[int, int]:
+        """波形領域の中央に揃える描画位置を計算
+
+        Args:
+            surface: 描画するサーフェス
+            y: Y座標
+
+        Returns:
+            描画位置
+        """
+        return (self.config.display.window_width // 2 - surface.get_width() // 2, y)
+
+    def _blit_centered(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        color: tuple[int, int, int],
+        y: int,
+    ) -> None:
+        """固定テキストを中央揃えで描画（サーフェスと位置は引数の組ごとにキャッシュ）
+
+        Args:
+            font: フォント
+            text: 描画する文字列
+            color: 文字色
+            y: Y座標
+        """
+        key = (font, text, color, y)
+        entry = self._centered_cache.get(key)
+        if entry is None:
+            surface = render_text(font, text, color)
+            entry = (surface, self._centered_pos(surface, y))
+            self._centered_cache[key] = entry
+        self.screen.blit(*entry)
 
     def draw_status(self) -> None:
         """接続状態を表示"""
-        width = self.config.display.window_width
-        height = self.config.display.window_height
         offset_y = self.toolbar_height
+        text_color = self.config.colors.text
 
         # タイトル
-        title = self.title_font.render("MindStream", True, self.config.colors.text)
-        self.screen.blit(title, (width // 2 - title.get_width() // 2, offset_y + 20))
+        self._blit_centered(self.title_font, "MindStream", text_color, offset_y + 20)
 
         # 接続状態
         if self.connected:
-            status = self.font.render("● Connected", True, (100, 255, 100))
+            self._blit_centered(self.font, "● Connected", (100, 255, 100), offset_y + 55)
         else:
-            status = self.font.render(
-                "○ Disconnected - Press SPACE to connect", True, (255, 100, 100)
+            self._blit_centered(
+                self.font,
+                "○ Disconnected - Press SPACE to connect",
+                (255, 100, 100),
+                offset_y + 55,
             )
-        self.screen.blit(status, (width // 2 - status.get_width() // 2, offset_y + 55))
 
-        # 現在の設定値を表示
-        settings = self.font.render(
-            f"Time: {self._display_seconds}s | Amplitude: ±{self._amplitude_scale}μV",
-            True,
-            self.config.colors.text,
-        )
-        self.screen.blit(settings, (width // 2 - settings.get_width() // 2, offset_y + 75))
+        # 現在の設定値を表示（値が変わったときのみ再レンダリング）
+        settings_key = (self._display_seconds, self._amplitude_scale)
+        if self._settings_blit is None or settings_key != self._settings_key:
+            surface = to_display_format(
+                self.font.render(
+                    f"Time: {self._display_seconds}s | Amplitude: ±{self._amplitude_scale}μV",
+                    True,
+                    text_color,
+                )
+            )
+            self._settings_blit = (surface, self._centered_pos(surface, offset_y + 75))
+            self._settings_key = settings_key
+        self.screen.blit(*self._settings_blit)
 
         # 操作説明
-        help_text = self.font.render(
-            "ESC: Quit | SPACE: Reconnect | R: Reset", True, self.config.colors.text
-        )
-        self.screen.blit(
-            help_text, (width // 2 - help_text.get_width() // 2, offset_y + height - 30)
+        self._blit_centered(
+            self.font,
+            "ESC: Quit | SPACE: Reconnect | R: Reset",
+            text_color,
+            offset_y + self.config.display.window_height - 30,
         )
 
     def reset_buffers(self) -> None:
         """バッファをリセット"""
-        buffer_size = self.config.eeg.buffer_size
-        for buf in self.buffers:
-            buf.clear()
-            buf.extend([0.0] * buffer_size)
+        with self._buffer_lock:
+            self.buffers.reset()
 
     def _handle_keydown(self, key: int) -> bool:
         """キー入力を処理
@@ -458,94 +822,151 @@ class EEGVisualizer:
         # 初回接続を試みる
         self.connect_to_stream()
 
+        # ループ内で繰り返し参照する属性・関数をローカル変数に退避
+        fps = self.config.display.fps
+        background = self.config.colors.background
+        screen = self.screen
+        tick = self.clock.tick
+        event_get = pygame.event.get
+        mouse_get_pos = pygame.mouse.get_pos
+        flip = pygame.display.flip
+        display_update = pygame.display.update
+        quit_type = pygame.QUIT
+        keydown_type = pygame.KEYDOWN
+        repaint_types = _REPAINT_EVENT_TYPES
+        toolbar = self.toolbar
+        slider_panel = self.slider_panel
+        frequency_analyzer = self.frequency_analyzer
+        frequency_panel = self.frequency_panel
+        power_trend_panel = self.power_trend_panel
+        indicator_panel = self.indicator_panel
+        indicator_calculator = self.indicator_calculator
+        event_manager = self.event_manager
+        # ViewManagerはactive_modesをその場で更新するため参照を保持できる
+        active_modes = self.view_manager.active_modes
+
+        # 画面全体の再描画が必要か（入力・解析結果・接続状態の変化で立てる）
+        dirty = True
+        # 新規サンプルにより波形領域の再描画が必要か
+        samples_dirty = False
+        last_connected = self.connected
+        last_freq_result = None
+
         running = True
         while running:
             # フレーム時間を計算
-            time_delta = self.clock.tick(self.config.display.fps) / 1000.0
+            time_delta = tick(fps) / 1000.0
+
+            # イベント処理（キューには処理対象の種別のみ届く）
+            for event in event_get():
+                dirty = True
+
+                # ウィンドウの再表示等は再描画のみ行う
+                if event.type in repaint_types:
+                    continue
 
-            # イベント処理
-            for event in pygame.event.get():
                 # ツールバーにイベントを渡す
-                if self.toolbar.process_event(event):
+                if toolbar.process_event(event):
                     continue
 
                 # スライダーパネルにイベントを渡す
-                if self.slider_panel is not None:
-                    self.slider_panel.process_event(event)
+                if slider_panel is not None:
+                    slider_panel.process_event(event)
                     # スライダーの値を同期
-                    self._amplitude_scale = self.slider_panel.amplitude_scale
-                    self._display_seconds = self.slider_panel.display_seconds
+                    self._set_view_params(
+                        slider_panel.display_seconds, slider_panel.amplitude_scale
+                    )
 
-                if event.type == pygame.QUIT or (
-                    event.type == pygame.KEYDOWN and self._handle_keydown(event.key)
+                if event.type == quit_type or (
+                    event.type == keydown_type and self._handle_keydown(event.key)
                 ):
                     running = False
 
+            # ツールバーのホバー状態はフレームごとに現在のマウス位置で判定
+            toolbar.update_hover(mouse_get_pos())
+
             # スライダーパネルを更新
-            if self.slider_panel is not None:
-                self.slider_panel.update(time_delta)
+            if slider_panel is not None:
+                slider_panel.update(time_delta)
 
             # データ更新
-            self.update_data()
+            if self.update_data():
+                samples_dirty = True
+            if self.connected != last_connected:
+                last_connected = self.connected
+                dirty = True
 
             # 周波数解析を更新
             freq_result = None
-            if self.frequency_analyzer is not None:
+            if frequency_analyzer is not None:
                 current_time = time.time()
-                freq_result = self.frequency_analyzer.analyze(
-                    self.buffers,
+                # 解析に使う直近の窓のみをコピーして渡す
+                window, write_count = self._snapshot(frequency_analyzer.window_samples)
+                freq_result = frequency_analyzer.analyze(
+                    window,
                     CHANNEL_NAMES,
                     current_time,
+                    write_count=write_count,
                 )
 
+                # 解析間隔内とバッファ未更新時は同じ結果オブジェクトが返る
+                if freq_result is not last_freq_result:
+                    last_freq_result = freq_result
+                    dirty = True
+
                 # 周波数パネルを更新
-                if self.frequency_panel is not None:
-                    self.frequency_panel.update(freq_result)
+                if frequency_panel is not None:
+                    frequency_panel.update(freq_result)
 
             # インジケーターを更新
-            if freq_result is not None and self.indicator_panel is not None:
-                self.indicator_panel.update(freq_result)
+            if freq_result is not None:
+                indicator_panel.update(freq_result)
 
                 # イベント検知
-                if self.event_manager is not None and self.indicator_calculator is not None:
-                    indicators = self.indicator_calculator.history.entries
+                if event_manager is not None:
+                    indicators = indicator_calculator.history.entries
                     if indicators:
-                        self.event_manager.process(indicators[-1])
+                        event_manager.process(indicators[-1])
+
+            # 新規サンプルのみの場合は波形領域だけを描き直して部分更新する
+            if not dirty:
+                if samples_dirty and ViewMode.RAW_WAVEFORM in active_modes:
+                    display_update(self.redraw_waveform_strip())
+                samples_dirty = False
+                # 変化がなければ前フレームの画面をそのまま残す
+                continue
+            dirty = False
+            samples_dirty = False
 
             # 描画
-            self.screen.fill(self.config.colors.background)
+            screen.fill(background)
 
             # ツールバーを描画
-            self.toolbar.draw(self.screen)
+            toolbar.draw(screen)
 
             # 生波形を描画（アクティブな場合）
-            if self.view_manager.is_mode_active(ViewMode.RAW_WAVEFORM):
+            if ViewMode.RAW_WAVEFORM in active_modes:
                 self.draw_grid()
                 self.draw_waveforms()
                 self.draw_status()
 
             # スライダーパネルを描画
-            if self.slider_panel is not None:
-                self.slider_panel.draw(self.screen)
+            if slider_panel is not None:
+                slider_panel.draw(screen)
 
             # 周波数パネルを描画（アクティブな場合）
-            if self.frequency_panel is not None and self.view_manager.is_mode_active(
-                ViewMode.FREQUENCY_BARS
-            ):
-                self.frequency_panel.draw(self.screen)
+            if frequency_panel is not None and ViewMode.FREQUENCY_BARS in active_modes:
+                frequency_panel.draw(screen)
 
             # パワートレンドパネルを描画（アクティブな場合）
-            if self.power_trend_panel is not None and self.view_manager.is_mode_active(
-                ViewMode.POWER_TREND
-            ):
-                self.power_trend_panel.draw(self.screen)
+            if ViewMode.POWER_TREND in active_modes:
+                power_trend_panel.draw(screen)
 
             # インジケーターパネルを描画（アクティブな場合）
-            if self.indicator_panel is not None and self.view_manager.is_mode_active(
-                ViewMode.FOCUS_RELAX
-            ):
-                self.indicator_panel.draw(self.screen)
+            if ViewMode.FOCUS_RELAX in active_modes:
+                indicator_panel.draw(screen)
 
-            pygame.display.flip()
+            flip()
 
+        self._stop_ingest_thread()
         pygame.quit()
@@ -5,6 +5,7 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -12,10 +13,24 @@ from typing import TYPE_CHECKING
 import pygame
 import pygame_gui
 
+from mindstream.ui import text_cache
+from mindstream.ui.fontcache import get_font
+
 if TYPE_CHECKING:
     from mindstream.config import Config
     from mindstream.data_hub import DataHub
 
+# パネル共通の色定義
+PANEL_BG_COLOR: tuple[int, int, int] = (15, 15, 25)  # パネル・カードの背景
+BAR_AREA_COLOR: tuple[int, int, int] = (25, 25, 35)  # ツールバー・スライダーエリアの背景
+TRACK_COLOR: tuple[int, int, int] = (30, 30, 45)  # ゲージ背景・グリッド
+POSITIVE_COLOR: tuple[int, int, int] = (100, 255, 150)  # 上昇
+NEGATIVE_COLOR: tuple[int, int, int] = (255, 100, 100)  # 下降・切断
+
+# UI要素の変化後にUIマネージャーの更新を続ける時間（秒）
+# ホバー・押下などの状態遷移が落ち着くまで更新し、以降は次の変化まで止める
+UI_SETTLE_SECONDS = 1.0
+
 
 def get_theme_path() -> str:
     """テーマファイルのパスを取得"""
@@ -66,8 +81,16 @@ class BaseWindow(ABC):
         self.ui_manager = pygame_gui.UIManager(size, theme_path)
 
         # フォント
-        self.font = pygame.font.Font(None, config.fonts.label_size)
-        self.title_font = pygame.font.Font(None, config.fonts.title_size)
+        self.font = get_font(None, config.fonts.label_size)
+        self.title_font = get_font(None, config.fonts.title_size)
+
+        # 再描画が必要か（イベント受信で立て、描画後に下ろす）と描画済みの更新カウンタ
+        self._dirty = True
+        self._drawn_revision: tuple[int, ...] = ()
+
+        # UIマネージャーの更新を続ける期限（time.monotonic()基準）
+        self._ui_active_until = 0.0
+        self.invalidate_ui()
 
         # UIをセットアップ
         self.setup_ui()
@@ -116,6 +139,78 @@ class BaseWindow(ABC):
         """ウィンドウの内容を描画"""
         pass
 
+    def content_revision(self) -> tuple[int, ...]:
+        """描画内容が依存するデータハブの更新カウンタを取得
+
+        Returns:
+            更新カウンタのタプル（前回描画時と同じなら再描画不要）
+        """
+        return (self.data_hub.state_revision,)
+
+    def invalidate_ui(self) -> None:
+        """UI要素の変化を通知
+
+        次のフレームで再描画し、UI_SETTLE_SECONDSの間UIマネージャーを更新する。
+        イベント以外でUI要素を書き換えた場合（set_text等）に呼び出す。
+        """
+        self._dirty = True
+        self._ui_active_until = time.monotonic() + UI_SETTLE_SECONDS
+
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """イベントをUIマネージャーとウィンドウ固有の処理に渡す
+
+        イベントを受け取ったウィンドウは次のフレームで再描画する。
+
+        Args:
+            event: pygameイベント
+        """
+        self.invalidate_ui()
+        self.ui_manager.process_events(event)
+        self.process_event(event)
+
+    def render_frame(self, time_delta: float) -> None:
+        """ウィンドウを更新し、変化があった場合のみ描画して表示を更新
+
+        UIマネージャーはUI要素の変化後しばらくの間のみ更新する。
+
+        Args:
+            time_delta: 前回の更新からの経過時間（秒）
+        """
+        self.update(time_delta)
+        if time.monotonic() < self._ui_active_until:
+            self.ui_manager.update(time_delta)
+
+        revision = self.content_revision()
+        if not self._dirty and revision == self._drawn_revision:
+            return
+
+        self.draw_background()
+        self.draw()
+        self.ui_manager.draw_ui(self.surface)
+        self.flip()
+        self._dirty = False
+        self._drawn_revision = revision
+
+    def render_text(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """テキストをレンダリング（同じ文字列・フォント・色の結果は再利用）
+
+        返されるサーフェスは共有されるため、呼び出し側で書き換えないこと。
+
+        Args:
+            text: 描画する文字列
+            font: フォント
+            color: 文字色
+
+        Returns:
+            アンチエイリアス済みのテキストサーフェス
+        """
+        return text_cache.render_text(font, text, color)
+
     def draw_background(self) -> None:
         """背景を描画"""
         self.surface.fill(self.config.colors.background)
@@ -5,18 +5,50 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 import pygame_gui
 
+from mindstream.frequency import BAND_ORDER
+from mindstream.ui.base import to_display_format
+from mindstream.ui.fontcache import get_font
 from mindstream.ui.frequency_bar import BAND_COLORS, BAND_DISPLAY_NAMES
-from mindstream.windows.base import BaseWindow
+from mindstream.windows.base import (
+    BAR_AREA_COLOR,
+    NEGATIVE_COLOR,
+    PANEL_BG_COLOR,
+    POSITIVE_COLOR,
+    TRACK_COLOR,
+    BaseWindow,
+)
 
 if TYPE_CHECKING:
     from mindstream.app import MindStreamApp
     from mindstream.config import Config
     from mindstream.data_hub import DataHub
+    from mindstream.frequency import FrequencyAnalysisResult
+
+# 帯域の描画仕様（帯域名, 色, 表示名）、BAND_ORDER順
+BAND_SPECS: tuple[tuple[str, tuple[int, int, int], str], ...] = tuple(
+    (name, BAND_COLORS[name], BAND_DISPLAY_NAMES[name]) for name in BAND_ORDER
+)
+
+# インジケーターカード（ラベル, 指標名, 色）、左から順に配置
+INDICATOR_CARDS: tuple[tuple[str, str, tuple[int, int, int]], ...] = (
+    ("Focus", "focus", (100, 180, 255)),
+    ("Relax", "relaxation", (100, 255, 150)),
+    ("Meditate", "meditation", (200, 150, 255)),
+)
+
+# インジケーターカードのゲージ寸法
+CARD_GAUGE_HEIGHT = 20
+CARD_GAUGE_MARGIN = 20
+
+# 描画済みインジケーターカードのキャッシュ上限
+CARD_CACHE_SIZE = 512
 
 
 class MainWindow(BaseWindow):
@@ -44,6 +76,20 @@ class MainWindow(BaseWindow):
         self.app = app
         super().__init__(title, size, position, config, data_hub)
 
+        # インジケーター値表示用の大きなフォント
+        self.value_font = get_font(None, 64)
+
+        # レイアウト計算（静的部分は初回の描画時に合成）
+        self._calculate_layout()
+        self._chrome: pygame.Surface | None = None
+
+        # 描画済みの周波数バー領域（解析結果が差し替わったときのみ作り直す）
+        self._freq_bars_surface: pygame.Surface | None = None
+        self._freq_bars_rev = -1
+
+        # 表示内容ごとの描画済みインジケーターカード（古いものから破棄）
+        self._card_cache: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
     def setup_ui(self) -> None:
         """pygame-guiのUI要素を初期化"""
         # ツールバーボタン
@@ -60,6 +106,7 @@ class MainWindow(BaseWindow):
             text="○ Disconnected",
             manager=self.ui_manager,
         )
+        self._shown_connected = False
 
     def process_event(self, event: pygame.event.Event) -> bool:
         """ウィンドウ固有のイベントを処理"""
@@ -89,176 +136,213 @@ class MainWindow(BaseWindow):
 
     def update(self, time_delta: float) -> None:
         """ウィンドウの状態を更新"""
-        # 接続状態を更新
-        if self.data_hub.connected:
-            self.status_label.set_text("● Connected")
-        else:
-            self.status_label.set_text("○ Disconnected")
+        # 接続状態を更新（変化したときのみラベルを書き換える）
+        connected = self.data_hub.connected
+        if connected != self._shown_connected:
+            self.status_label.set_text("● Connected" if connected else "○ Disconnected")
+            self._shown_connected = connected
+            self.invalidate_ui()
+
+    def draw_background(self) -> None:
+        """背景と静的な枠・ラベルを描画（初回のみ合成し、以降は一括転送）"""
+        if self._chrome is None:
+            self._chrome = self._build_chrome()
+        self.surface.blit(self._chrome, (0, 0))
 
     def draw(self) -> None:
         """ウィンドウの内容を描画"""
-        self._draw_toolbar_background()
-        self._draw_power_trend()
+        self._draw_power_trend_graph()
         self._draw_frequency_bars()
         self._draw_indicators()
 
-    def _draw_toolbar_background(self) -> None:
+    def _calculate_layout(self) -> None:
+        """UIレイアウトを計算"""
+        padding = self.PADDING
+        panel_y = self.TOOLBAR_HEIGHT + padding
+        panel_height = self.height - self.TOOLBAR_HEIGHT - self.INDICATOR_HEIGHT - padding * 2
+
+        # パワートレンドグラフ領域とグラフ本体の描画範囲
+        self._trend_rect = pygame.Rect(
+            padding, panel_y, self.width - self.FREQ_BARS_WIDTH - padding * 3, panel_height
+        )
+        self._trend_plot_rect = pygame.Rect(
+            self._trend_rect.x + 10,
+            self._trend_rect.y + 40,
+            self._trend_rect.width - 20,
+            self._trend_rect.height - 60,
+        )
+
+        # 周波数バー領域
+        self._bars_rect = pygame.Rect(
+            self.width - self.FREQ_BARS_WIDTH - padding, panel_y, self.FREQ_BARS_WIDTH, panel_height
+        )
+
+        # インジケーターカード（左から Focus, Relax, Meditate）
+        self._indicator_y = self.height - self.INDICATOR_HEIGHT
+        card_width = (self.width - padding * 4) // 3
+        self._card_rects = tuple(
+            pygame.Rect(
+                padding * (i + 1) + card_width * i,
+                self._indicator_y + padding,
+                card_width,
+                self.INDICATOR_HEIGHT - padding * 2,
+            )
+            for i in range(len(INDICATOR_CARDS))
+        )
+
+    def _build_chrome(self) -> pygame.Surface:
+        """背景・ツールバー・パネル枠・タイトル・凡例・グリッドなどの静的部分を合成
+
+        Returns:
+            ウィンドウ全体サイズの静的部分サーフェス
+        """
+        chrome = pygame.Surface(self.size)
+        chrome.fill(self.config.colors.background)
+        self._draw_toolbar_background(chrome)
+        self._draw_power_trend_frame(chrome)
+        self._draw_frequency_frame(chrome)
+        self._draw_indicator_separator(chrome)
+        return to_display_format(chrome)
+
+    def _draw_panel_frame(self, surface: pygame.Surface, rect: pygame.Rect, title: str) -> None:
+        """角丸の背景・枠線とタイトルを描画"""
+        pygame.draw.rect(surface, PANEL_BG_COLOR, rect, border_radius=5)
+        pygame.draw.rect(surface, self.config.colors.grid, rect, width=1, border_radius=5)
+        title_surface = self.render_text(title, self.title_font, self.config.colors.text)
+        surface.blit(title_surface, (rect.x + 10, rect.y + 10))
+
+    def _draw_toolbar_background(self, surface: pygame.Surface) -> None:
         """ツールバーの背景を描画"""
         pygame.draw.rect(
-            self.surface,
-            (25, 25, 35),
+            surface,
+            BAR_AREA_COLOR,
             (0, 0, self.width, self.TOOLBAR_HEIGHT),
         )
         pygame.draw.line(
-            self.surface,
+            surface,
             self.config.colors.grid,
             (0, self.TOOLBAR_HEIGHT - 1),
             (self.width, self.TOOLBAR_HEIGHT - 1),
             1,
         )
 
-    def _draw_power_trend(self) -> None:
-        """パワートレンドグラフを描画"""
-        # グラフ領域
-        graph_x = self.PADDING
-        graph_y = self.TOOLBAR_HEIGHT + self.PADDING
-        graph_width = self.width - self.FREQ_BARS_WIDTH - self.PADDING * 3
-        graph_height = self.height - self.TOOLBAR_HEIGHT - self.INDICATOR_HEIGHT - self.PADDING * 2
-
-        # 背景
-        pygame.draw.rect(
-            self.surface,
-            (15, 15, 25),
-            (graph_x, graph_y, graph_width, graph_height),
-            border_radius=5,
-        )
-        pygame.draw.rect(
-            self.surface,
-            self.config.colors.grid,
-            (graph_x, graph_y, graph_width, graph_height),
-            width=1,
-            border_radius=5,
-        )
-
-        # タイトル
-        title = self.title_font.render("Power Trend", True, self.config.colors.text)
-        self.surface.blit(title, (graph_x + 10, graph_y + 10))
+    def _draw_power_trend_frame(self, surface: pygame.Surface) -> None:
+        """パワートレンドグラフの枠・タイトル・凡例・グリッドを描画"""
+        rect = self._trend_rect
+        self._draw_panel_frame(surface, rect, "Power Trend")
 
         # 凡例
-        legend_x = graph_x + 120
-        for band_name in ["delta", "theta", "alpha", "beta"]:
-            color = BAND_COLORS[band_name]
-            pygame.draw.rect(self.surface, color, (legend_x, graph_y + 12, 12, 12))
-            label = self.font.render(BAND_DISPLAY_NAMES[band_name], True, self.config.colors.text)
-            self.surface.blit(label, (legend_x + 16, graph_y + 10))
+        legend_x = rect.x + 120
+        for _band_name, color, display_name in BAND_SPECS:
+            pygame.draw.rect(surface, color, (legend_x, rect.y + 12, 12, 12))
+            label = self.render_text(display_name, self.font, self.config.colors.text)
+            surface.blit(label, (legend_x + 16, rect.y + 10))
             legend_x += 100
 
-        # グラフ本体を描画
-        self._draw_power_trend_graph(
-            graph_x + 10,
-            graph_y + 40,
-            graph_width - 20,
-            graph_height - 60,
-        )
-
-    def _draw_power_trend_graph(self, x: int, y: int, width: int, height: int) -> None:
-        """パワートレンドのグラフ本体を描画"""
+        # グリッド（解析器がない場合はグラフ本体を描画しない）
         if self.data_hub.frequency_analyzer is None:
             return
 
-        power_history = self.data_hub.frequency_analyzer.power_history
-        time_window = self.config.view.power_trend.time_window_seconds
-
-        # グリッド
+        x, y, width, height = self._trend_plot_rect
         for i in range(5):
             grid_y = y + (height * i) // 4
             pygame.draw.line(
-                self.surface,
-                (30, 30, 45),
+                surface,
+                TRACK_COLOR,
                 (x, grid_y),
                 (x + width, grid_y),
                 1,
             )
 
+    def _draw_power_trend_graph(self) -> None:
+        """パワートレンドのグラフ本体を描画"""
+        if self.data_hub.frequency_analyzer is None:
+            return
+
+        power_history = self.data_hub.frequency_analyzer.power_history
+        time_window = self.config.view.power_trend.time_window_seconds
+        x, y, width, height = self._trend_plot_rect
+
         # 各帯域のトレンドライン
-        for band_name in ["delta", "theta", "alpha", "beta"]:
+        for band_name, color, _display_name in BAND_SPECS:
             _timestamps, values = power_history.get_band_series(band_name, time_window)
             if len(values) < 2:
                 continue
 
-            color = BAND_COLORS[band_name]
-            points = []
+            # 値を最大値で正規化（0-100%を想定）
+            max_val = float(values.max())
+            if max_val <= 0:
+                max_val = 1.0
 
-            # 値を正規化（0-100%を想定）
-            max_val = max(values) if max(values) > 0 else 1
-            min_val = 0
+            # 正規化して上下反転（座標計算は配列演算でまとめて行う）
+            n = len(values)
+            xs = x + (np.arange(n) * width) // (n - 1)
+            ys = y + height - (values / max_val * height * 0.9).astype(np.int64) - 5
+            points = list(zip(xs.tolist(), ys.tolist(), strict=True))
 
-            for i, val in enumerate(values):
-                px = x + (i * width) // (len(values) - 1) if len(values) > 1 else x
-                # 正規化して上下反転
-                normalized = (val - min_val) / (max_val - min_val) if max_val > min_val else 0.5
-                py = y + height - int(normalized * height * 0.9) - 5
-                points.append((px, py))
+            pygame.draw.lines(self.surface, color, False, points, 2)
 
-            if len(points) > 1:
-                pygame.draw.lines(self.surface, color, False, points, 2)
+    def _draw_frequency_frame(self, surface: pygame.Surface) -> None:
+        """周波数バーの枠とタイトルを描画"""
+        self._draw_panel_frame(surface, self._bars_rect, "Frequency")
 
     def _draw_frequency_bars(self) -> None:
-        """周波数バーを描画"""
-        bar_x = self.width - self.FREQ_BARS_WIDTH - self.PADDING
-        bar_y = self.TOOLBAR_HEIGHT + self.PADDING
-        bar_width = self.FREQ_BARS_WIDTH
-        bar_height = self.height - self.TOOLBAR_HEIGHT - self.INDICATOR_HEIGHT - self.PADDING * 2
+        """周波数バーを描画
 
-        # 背景
-        pygame.draw.rect(
-            self.surface,
-            (15, 15, 25),
-            (bar_x, bar_y, bar_width, bar_height),
-            border_radius=5,
-        )
-        pygame.draw.rect(
-            self.surface,
-            self.config.colors.grid,
-            (bar_x, bar_y, bar_width, bar_height),
-            width=1,
-            border_radius=5,
-        )
-
-        # タイトル
-        title = self.title_font.render("Frequency", True, self.config.colors.text)
-        self.surface.blit(title, (bar_x + 10, bar_y + 10))
-
-        # 各帯域のバー
+        解析結果は描画より低い頻度でしか更新されないため、バー領域を
+        解析結果ごとに一度だけ描画しておき、以降は一括転送する。
+        """
         freq_result = self.data_hub.current_freq_result
         if freq_result is None:
             return
 
+        revision = self.data_hub.freq_result_revision
+        if self._freq_bars_surface is None or self._freq_bars_rev != revision:
+            self._freq_bars_surface = self._build_frequency_bars(freq_result)
+            self._freq_bars_rev = revision
+        self.surface.blit(self._freq_bars_surface, self._bars_rect.topleft)
+
+    def _build_frequency_bars(self, freq_result: FrequencyAnalysisResult) -> pygame.Surface:
+        """周波数バー領域を描画したサーフェスを作成
+
+        Args:
+            freq_result: 周波数解析結果
+
+        Returns:
+            バー領域（枠・タイトルを含む）のサーフェス
+        """
+        # 静的な枠・タイトルの上に描画する（バー領域のローカル座標）
+        assert self._chrome is not None
+        surface = self._chrome.subsurface(self._bars_rect).copy()
+        bar_x, bar_y = 0, 0
+        bar_width, bar_height = self._bars_rect.size
+
+        # 各帯域のバー
         content_y = bar_y + 45
         content_height = bar_height - 60
         band_height = content_height // 4
 
-        for i, band_name in enumerate(["delta", "theta", "alpha", "beta"]):
-            band_power = freq_result.average_powers.get(band_name)
+        average_powers = freq_result.average_powers
+        for i, (band_name, color, display_name) in enumerate(BAND_SPECS):
+            band_power = average_powers.get(band_name)
             if band_power is None:
                 continue
 
             by = content_y + i * band_height
-            color = BAND_COLORS[band_name]
 
             # ラベル
-            label = self.font.render(BAND_DISPLAY_NAMES[band_name], True, color)
-            self.surface.blit(label, (bar_x + 10, by))
+            label = self.render_text(display_name, self.font, color)
+            surface.blit(label, (bar_x + 10, by))
 
             # バー背景
             bar_bg_rect = (bar_x + 10, by + 20, bar_width - 30, 15)
-            pygame.draw.rect(self.surface, (30, 30, 45), bar_bg_rect, border_radius=3)
+            pygame.draw.rect(surface, TRACK_COLOR, bar_bg_rect, border_radius=3)
 
             # バー（相対パワーを表示）
             fill_width = int((bar_width - 30) * min(band_power.relative_power / 100, 1.0))
             if fill_width > 0:
                 pygame.draw.rect(
-                    self.surface,
+                    surface,
                     color,
                     (bar_x + 10, by + 20, fill_width, 15),
                     border_radius=3,
@@ -266,23 +350,23 @@ class MainWindow(BaseWindow):
 
             # 値
             value_text = f"{band_power.relative_power:.0f}%"
-            value = self.font.render(value_text, True, self.config.colors.text)
-            self.surface.blit(value, (bar_x + bar_width - 45, by + 18))
+            value = self.render_text(value_text, self.font, self.config.colors.text)
+            surface.blit(value, (bar_x + bar_width - 45, by + 18))
 
-    def _draw_indicators(self) -> None:
-        """脳状態インジケーターを描画"""
-        indicator_y = self.height - self.INDICATOR_HEIGHT
-        indicator_width = (self.width - self.PADDING * 4) // 3
+        return to_display_format(surface)
 
-        # 区切り線
+    def _draw_indicator_separator(self, surface: pygame.Surface) -> None:
+        """インジケーター領域の区切り線を描画"""
         pygame.draw.line(
-            self.surface,
+            surface,
             self.config.colors.grid,
-            (0, indicator_y),
-            (self.width, indicator_y),
+            (0, self._indicator_y),
+            (self.width, self._indicator_y),
             1,
         )
 
+    def _draw_indicators(self) -> None:
+        """脳状態インジケーターのカードを描画"""
         indicators = self.data_hub.current_indicators
         history = (
             self.data_hub.indicator_calculator.history
@@ -290,119 +374,117 @@ class MainWindow(BaseWindow):
             else None
         )
 
-        # Focus
-        self._draw_indicator_card(
-            self.PADDING,
-            indicator_y + self.PADDING,
-            indicator_width,
-            self.INDICATOR_HEIGHT - self.PADDING * 2,
-            "Focus",
-            indicators.focus_level if indicators else 0,
-            (100, 180, 255),
-            history.get_change("focus", 10) if history else None,
-        )
-
-        # Relax
-        self._draw_indicator_card(
-            self.PADDING * 2 + indicator_width,
-            indicator_y + self.PADDING,
-            indicator_width,
-            self.INDICATOR_HEIGHT - self.PADDING * 2,
-            "Relax",
-            indicators.relaxation_level if indicators else 0,
-            (100, 255, 150),
-            history.get_change("relaxation", 10) if history else None,
-        )
-
-        # Meditate
-        self._draw_indicator_card(
-            self.PADDING * 3 + indicator_width * 2,
-            indicator_y + self.PADDING,
-            indicator_width,
-            self.INDICATOR_HEIGHT - self.PADDING * 2,
-            "Meditate",
-            indicators.meditation_level if indicators else 0,
-            (200, 150, 255),
-            history.get_change("meditation", 10) if history else None,
-        )
+        for card, rect in zip(INDICATOR_CARDS, self._card_rects, strict=True):
+            name = card[1]
+            surface = self._get_card_surface(
+                card,
+                rect.size,
+                getattr(indicators, f"{name}_level") if indicators else 0,
+                history.get_change(name, 10) if history else None,
+            )
+            self.surface.blit(surface, rect.topleft)
 
-    def _draw_indicator_card(
+    def _get_card_surface(
         self,
-        x: int,
-        y: int,
-        width: int,
-        height: int,
-        label: str,
+        card: tuple[str, str, tuple[int, int, int]],
+        size: tuple[int, int],
         value: float,
-        color: tuple[int, int, int],
         change: float | None,
-    ) -> None:
-        """インジケーターカードを描画"""
+    ) -> pygame.Surface:
+        """インジケーターカードのサーフェスを取得
+
+        表示上の値（丸めた%表示・ゲージ幅・変化量表示）が同じカードは描画済みの
+        サーフェスを再利用する。
+
+        Args:
+            card: カード定義（ラベル, 指標名, 色）
+            size: カードサイズ
+            value: 値 (0-100)
+            change: 変化量
+
+        Returns:
+            カード全体を描画したサーフェス
+        """
+        value_text = f"{value:.0f}%"
+        fill_width = int((size[0] - CARD_GAUGE_MARGIN * 2) * min(value / 100, 1.0))
+        change_label = self._format_change(change)
+
+        key = (card[1], value_text, fill_width, change_label)
+        surface = self._card_cache.get(key)
+        if surface is not None:
+            self._card_cache.move_to_end(key)
+            return surface
+
+        surface = self._build_card_surface(card, size, value_text, fill_width, change_label)
+        self._card_cache[key] = surface
+        if len(self._card_cache) > CARD_CACHE_SIZE:
+            self._card_cache.popitem(last=False)
+        return surface
+
+    def _format_change(self, change: float | None) -> tuple[str, tuple[int, int, int]] | None:
+        """変化量の表示文字列と色を取得"""
+        if change is None:
+            return None
+        if change > 0:
+            return f"↑ +{change:.0f}%", POSITIVE_COLOR
+        if change < 0:
+            return f"↓ {change:.0f}%", NEGATIVE_COLOR
+        return "→ 0%", self.config.colors.text
+
+    def _build_card_surface(
+        self,
+        card: tuple[str, str, tuple[int, int, int]],
+        size: tuple[int, int],
+        value_text: str,
+        fill_width: int,
+        change_label: tuple[str, tuple[int, int, int]] | None,
+    ) -> pygame.Surface:
+        """インジケーターカードを描画（カードのローカル座標）"""
+        label, _name, color = card
+        width, height = size
+        surface = pygame.Surface(size)
+        surface.fill(self.config.colors.background)
+
         # 背景
+        pygame.draw.rect(surface, PANEL_BG_COLOR, (0, 0, width, height), border_radius=8)
         pygame.draw.rect(
-            self.surface,
-            (15, 15, 25),
-            (x, y, width, height),
-            border_radius=8,
-        )
-        pygame.draw.rect(
-            self.surface,
+            surface,
             self.config.colors.grid,
-            (x, y, width, height),
+            (0, 0, width, height),
             width=1,
             border_radius=8,
         )
 
         # ラベル
-        label_surface = self.title_font.render(label, True, color)
-        self.surface.blit(label_surface, (x + (width - label_surface.get_width()) // 2, y + 15))
+        label_surface = self.render_text(label, self.title_font, color)
+        surface.blit(label_surface, ((width - label_surface.get_width()) // 2, 15))
 
         # 値（大きく表示）
-        value_font = pygame.font.Font(None, 64)
-        value_text = f"{value:.0f}%"
-        value_surface = value_font.render(value_text, True, self.config.colors.text)
-        self.surface.blit(
-            value_surface,
-            (x + (width - value_surface.get_width()) // 2, y + 50),
-        )
-
-        # ゲージバー
-        gauge_y = y + 120
-        gauge_height = 20
-        gauge_margin = 20
+        value_surface = self.render_text(value_text, self.value_font, self.config.colors.text)
+        surface.blit(value_surface, ((width - value_surface.get_width()) // 2, 50))
 
         # ゲージ背景
+        gauge_y = 120
         pygame.draw.rect(
-            self.surface,
-            (30, 30, 45),
-            (x + gauge_margin, gauge_y, width - gauge_margin * 2, gauge_height),
+            surface,
+            TRACK_COLOR,
+            (CARD_GAUGE_MARGIN, gauge_y, width - CARD_GAUGE_MARGIN * 2, CARD_GAUGE_HEIGHT),
             border_radius=5,
         )
 
         # ゲージ塗りつぶし
-        fill_width = int((width - gauge_margin * 2) * min(value / 100, 1.0))
         if fill_width > 0:
             pygame.draw.rect(
-                self.surface,
+                surface,
                 color,
-                (x + gauge_margin, gauge_y, fill_width, gauge_height),
+                (CARD_GAUGE_MARGIN, gauge_y, fill_width, CARD_GAUGE_HEIGHT),
                 border_radius=5,
             )
 
         # 変化量
-        if change is not None:
-            if change > 0:
-                change_text = f"↑ +{change:.0f}%"
-                change_color = (100, 255, 150)
-            elif change < 0:
-                change_text = f"↓ {change:.0f}%"
-                change_color = (255, 100, 100)
-            else:
-                change_text = "→ 0%"
-                change_color = self.config.colors.text
-
-            change_surface = self.font.render(change_text, True, change_color)
-            self.surface.blit(
-                change_surface,
-                (x + (width - change_surface.get_width()) // 2, y + 150),
-            )
+        if change_label is not None:
+            change_text, change_color = change_label
+            change_surface = self.render_text(change_text, self.font, change_color)
+            surface.blit(change_surface, ((width - change_surface.get_width()) // 2, 150))
+
+        return to_display_format(surface)
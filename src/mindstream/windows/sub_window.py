@@ -7,16 +7,21 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 import pygame_gui
 
 from mindstream.constants import CHANNEL_NAMES, NUM_CHANNELS
-from mindstream.windows.base import BaseWindow
+from mindstream.ui.base import to_display_format
+from mindstream.windows.base import BAR_AREA_COLOR, NEGATIVE_COLOR, BaseWindow
 
 if TYPE_CHECKING:
     from mindstream.config import Config
     from mindstream.data_hub import DataHub
 
+# 接続中表示の色
+CONNECTED_COLOR: tuple[int, int, int] = (100, 255, 100)
+
 
 class SubWindow(BaseWindow):
     """サブウィンドウ
@@ -39,6 +44,27 @@ class SubWindow(BaseWindow):
         """サブウィンドウを初期化"""
         super().__init__(title, size, position, config, data_hub)
 
+        # レイアウト計算（ウィンドウサイズのみに依存）
+        self._calculate_layout()
+
+        # 背景・グリッド・タイトル・スライダーエリア背景の合成済みサーフェス
+        # （グリッドが表示秒数に依存するため、表示秒数が変わったときのみ再合成）
+        self._chrome: pygame.Surface | None = None
+        self._chrome_seconds = 0
+
+        # 描画済みの波形レイヤーとその描画時の条件
+        # （サンプル・振幅・表示秒数が変わらなければ再描画せず一括転送）
+        self._layer_key: tuple[int, ...] = ()
+
+        # 波形のX座標・min/maxビン境界と射影用の作業配列
+        # （サンプル数か描画幅が変わったときのみ作り直す）
+        self._points_key = (0, 0)
+        self._xs: list[int] = []
+        self._bin_edges = np.zeros(0, dtype=np.intp)
+        self._envelope = np.empty((NUM_CHANNELS, 0, 2), dtype=np.float32)
+        self._scaled = np.empty((NUM_CHANNELS, 0), dtype=np.float64)
+        self._ys = np.empty((NUM_CHANNELS, 0), dtype=np.int32)
+
     def setup_ui(self) -> None:
         """pygame-guiのUI要素を初期化"""
         slider_y = self.height - self.SLIDER_AREA_HEIGHT + 15
@@ -92,15 +118,18 @@ class SubWindow(BaseWindow):
     def process_event(self, event: pygame.event.Event) -> bool:
         """ウィンドウ固有のイベントを処理"""
         if event.type == pygame_gui.UI_HORIZONTAL_SLIDER_MOVED:
+            # スライダーは同じ整数値のまま移動イベントを出すため、値が変わったときのみ反映
             if event.ui_element == self.amplitude_slider:
                 value = int(self.amplitude_slider.get_current_value())
-                self.data_hub.amplitude_scale = value
-                self.amplitude_value.set_text(f"{value} uV")
+                if value != self.data_hub.amplitude_scale:
+                    self.data_hub.amplitude_scale = value
+                    self.amplitude_value.set_text(f"{value} uV")
                 return True
             elif event.ui_element == self.time_slider:
                 value = int(self.time_slider.get_current_value())
-                self.data_hub.display_seconds = value
-                self.time_value.set_text(f"{value} sec")
+                if value != self.data_hub.display_seconds:
+                    self.data_hub.display_seconds = value
+                    self.time_value.set_text(f"{value} sec")
                 return True
 
         # キーボードショートカット
@@ -146,27 +175,84 @@ class SubWindow(BaseWindow):
         self.time_slider.set_current_value(new_value)
         self.time_value.set_text(f"{new_value} sec")
 
+    def content_revision(self) -> tuple[int, ...]:
+        """描画内容が依存するデータハブの更新カウンタを取得（生波形を含む）"""
+        return (self.data_hub.state_revision, self.data_hub.sample_revision)
+
     def update(self, time_delta: float) -> None:
         """ウィンドウの状態を更新"""
         pass
 
+    def draw_background(self) -> None:
+        """背景と静的部分を描画（表示秒数が変わったときのみ再合成）"""
+        display_seconds = self.data_hub.display_seconds
+        if self._chrome is None or display_seconds != self._chrome_seconds:
+            self._chrome = self._build_chrome()
+            self._chrome_seconds = display_seconds
+        self.surface.blit(self._chrome, (0, 0))
+
     def draw(self) -> None:
         """ウィンドウの内容を描画"""
-        self._draw_grid()
         self._draw_waveforms()
         self._draw_status()
-        self._draw_slider_area_background()
 
-    def _draw_grid(self) -> None:
+    def _build_chrome(self) -> pygame.Surface:
+        """背景・グリッド・タイトル・スライダーエリア背景を合成
+
+        Returns:
+            ウィンドウ全体サイズの静的部分サーフェス
+        """
+        chrome = pygame.Surface(self.size)
+        chrome.fill(self.config.colors.background)
+        self._draw_grid(chrome)
+        self._draw_slider_area_background(chrome)
+
+        # タイトル
+        title = self.render_text("EEG Signals", self.title_font, self.config.colors.text)
+        chrome.blit(title, (self.width // 2 - title.get_width() // 2, 15))
+        return to_display_format(chrome)
+
+    def _calculate_layout(self) -> None:
+        """波形領域のレイアウトを計算
+
+        描画幅・チャンネルごとの上端/中心/下端とラベル位置、チャンネル色は
+        ウィンドウサイズと設定のみに依存するため、初期化時に一度だけ計算する。
+        """
+        self._waveform_height = self.height - self.SLIDER_AREA_HEIGHT - 100
+        self._plot_width = self.width - self.PADDING * 2
+        self._channel_height = self._waveform_height // NUM_CHANNELS
+
+        # 波形レイヤー（線の太さ分はみ出しても欠けないよう上下に余白を取る）
+        margin = self.config.layout.line_thickness
+        self._layer_pos = (0, 80 - margin)
+        self._layer = to_display_format(
+            pygame.Surface((self.width, self._waveform_height + margin * 2 + 1), pygame.SRCALPHA)
+        )
+
+        # 射影でブロードキャストするため (チャンネル数, 1) の列ベクトルで保持（レイヤー内座標）
+        tops = (
+            margin + np.arange(NUM_CHANNELS, dtype=np.int32)[:, np.newaxis] * self._channel_height
+        )
+        self._channel_tops = tops
+        self._channel_centers = tops + self._channel_height // 2
+        self._channel_bottoms = tops + self._channel_height
+        self._label_ys = tuple(
+            int(y) + self._layer_pos[1] - 10 for y in self._channel_centers[:, 0]
+        )
+        self._channel_colors = tuple(
+            self.config.colors.channels.get(name, (255, 255, 255)) for name in CHANNEL_NAMES
+        )
+
+    def _draw_grid(self, surface: pygame.Surface) -> None:
         """背景グリッドを描画"""
-        waveform_height = self.height - self.SLIDER_AREA_HEIGHT - 100
+        waveform_height = self._waveform_height
         padding = self.PADDING
 
         # 水平線
         for i in range(NUM_CHANNELS + 1):
             y = 80 + i * waveform_height // NUM_CHANNELS
             pygame.draw.line(
-                self.surface,
+                surface,
                 self.config.colors.grid,
                 (padding, y),
                 (self.width - padding, y),
@@ -178,7 +264,7 @@ class SubWindow(BaseWindow):
         for i in range(display_seconds + 1):
             x = padding + i * (self.width - padding * 2) // display_seconds
             pygame.draw.line(
-                self.surface,
+                surface,
                 self.config.colors.grid,
                 (x, 80),
                 (x, 80 + waveform_height),
@@ -187,81 +273,122 @@ class SubWindow(BaseWindow):
 
     def _draw_waveforms(self) -> None:
         """EEG波形を描画"""
-        waveform_height = self.height - self.SLIDER_AREA_HEIGHT - 100
-        padding = self.PADDING
-        plot_width = self.width - padding * 2
-        channel_height = waveform_height // NUM_CHANNELS
-
         # 表示するサンプル数
         display_samples = self.data_hub.display_seconds * self.config.eeg.sample_rate
 
-        for ch in range(NUM_CHANNELS):
-            # チャンネルの中心Y座標
-            center_y = 80 + ch * channel_height + channel_height // 2
-
-            # データを取得（最新のdisplay_samples分のみ）
-            data = list(self.data_hub.buffers[ch])[-display_samples:]
-
-            if len(data) < 2:
-                continue
-
-            # データをダウンサンプリング（描画用）
-            step = max(1, len(data) // plot_width)
-            downsampled = data[::step]
-
-            # スケーリング
-            scale = channel_height / (self.data_hub.amplitude_scale * 2)
-
-            # ポイントリストを作成
-            points: list[tuple[int, int]] = []
-            for i, value in enumerate(downsampled):
-                x = padding + (i * plot_width) // len(downsampled)
-                y = center_y - int(value * scale)
-                y = max(80 + ch * channel_height, min(80 + (ch + 1) * channel_height, y))
-                points.append((x, y))
-
-            # 波形を描画
-            channel_name = CHANNEL_NAMES[ch]
-            channel_color = self.config.colors.channels.get(channel_name, (255, 255, 255))
-
-            if len(points) > 1:
-                pygame.draw.lines(
-                    self.surface,
-                    channel_color,
-                    False,
-                    points,
-                    self.config.layout.line_thickness,
-                )
+        # 前回の描画以降にサンプルも表示条件も変わっていなければ描画済みのレイヤーを再利用
+        layer_key = (
+            self.data_hub.sample_revision,
+            self.data_hub.amplitude_scale,
+            display_samples,
+        )
+        if layer_key != self._layer_key and not self._draw_waveform_layer(display_samples):
+            return
+        self._layer_key = layer_key
+        self.surface.blit(self._layer, self._layer_pos)
+
+        # チャンネル名を描画
+        for channel_name, channel_color, label_y in zip(
+            CHANNEL_NAMES, self._channel_colors, self._label_ys, strict=True
+        ):
+            label = self.render_text(channel_name, self.font, channel_color)
+            self.surface.blit(label, (10, label_y))
+
+    def _draw_waveform_layer(self, display_samples: int) -> bool:
+        """波形レイヤーに全チャンネルの波形を描画
+
+        Args:
+            display_samples: 表示するサンプル数
+
+        Returns:
+            描画できるだけのサンプルがあった場合True
+        """
+        plot_width = self._plot_width
+
+        # データを取得（最新のdisplay_samples分のみ、コピーなしのビュー）
+        data = self.data_hub.tail(display_samples)
+        count = data.shape[1]
+        if count < 2:
+            return False
+
+        # サンプル数か描画幅が変わったときのみX座標と作業配列を作り直す
+        decimate = count >= plot_width * 2
+        if self._points_key != (count, plot_width):
+            self._prepare_points(count, plot_width)
+
+        # データをダウンサンプリング（描画用）
+        # 描画幅の2倍以上のサンプルがある場合は1ピクセル列ごとに最小値と最大値の
+        # 2点を残すmin/maxデシメーションでピークを保持し、点数を描画幅の2倍に抑える
+        if decimate:
+            envelope = self._envelope
+            np.minimum.reduceat(data, self._bin_edges, axis=1, out=envelope[:, :, 0])
+            np.maximum.reduceat(data, self._bin_edges, axis=1, out=envelope[:, :, 1])
+            downsampled = envelope.reshape(NUM_CHANNELS, plot_width * 2)
+        else:
+            downsampled = data
+
+        # スケーリング
+        scale = self._channel_height / (self.data_hub.amplitude_scale * 2)
+
+        # 全チャンネルのY座標を作業配列上でまとめて計算（0方向へ切り捨ててから中心線から引く）
+        ys = self._ys
+        np.copyto(ys, np.multiply(downsampled, scale, out=self._scaled), casting="unsafe")
+        np.subtract(self._channel_centers, ys, out=ys)
+        np.clip(ys, self._channel_tops, self._channel_bottoms, out=ys)
+        ys_rows = ys.tolist()
+
+        layer = self._layer
+        layer.fill((0, 0, 0, 0))
+        xs = self._xs
+        thickness = self.config.layout.line_thickness
+        for channel_color, ys_row in zip(self._channel_colors, ys_rows, strict=True):
+            points = list(zip(xs, ys_row, strict=True))
+            pygame.draw.lines(layer, channel_color, False, points, thickness)
+        return True
+
+    def _prepare_points(self, count: int, plot_width: int) -> None:
+        """波形のX座標・ビン境界・作業配列を作成
+
+        Args:
+            count: 表示するサンプル数
+            plot_width: 描画幅
+        """
+        padding = self.PADDING
+        if count >= plot_width * 2:
+            self._bin_edges = (np.arange(plot_width) * count) // plot_width
+            xs_array = np.repeat(padding + np.arange(plot_width), 2)
+        else:
+            self._bin_edges = np.zeros(0, dtype=np.intp)
+            xs_array = padding + (np.arange(count) * plot_width) // count
+        num_points = len(xs_array)
 
-            # チャンネル名を描画
-            label = self.font.render(channel_name, True, channel_color)
-            self.surface.blit(label, (10, center_y - 10))
+        self._points_key = (count, plot_width)
+        self._xs = xs_array.tolist()
+        self._envelope = np.empty((NUM_CHANNELS, plot_width, 2), dtype=np.float32)
+        self._scaled = np.empty((NUM_CHANNELS, num_points), dtype=np.float64)
+        self._ys = np.empty((NUM_CHANNELS, num_points), dtype=np.int32)
 
     def _draw_status(self) -> None:
         """接続状態を表示"""
-        # タイトル
-        title = self.title_font.render("EEG Signals", True, self.config.colors.text)
-        self.surface.blit(title, (self.width // 2 - title.get_width() // 2, 15))
-
         # 接続状態
         if self.data_hub.connected:
-            status = self.font.render("● Connected", True, (100, 255, 100))
+            status = self.render_text("● Connected", self.font, CONNECTED_COLOR)
         else:
-            status = self.font.render(
-                "○ Disconnected - Press SPACE to connect", True, (255, 100, 100)
+            status = self.render_text(
+                "○ Disconnected - Press SPACE to connect", self.font, NEGATIVE_COLOR
             )
         self.surface.blit(status, (self.width // 2 - status.get_width() // 2, 45))
 
-    def _draw_slider_area_background(self) -> None:
+    def _draw_slider_area_background(self, surface: pygame.Surface) -> None:
         """スライダーエリアの背景を描画"""
         slider_area_y = self.height - self.SLIDER_AREA_HEIGHT
         pygame.draw.rect(
-            self.surface,
-            (25, 25, 35),
+            surface,
+            BAR_AREA_COLOR,
             (0, slider_area_y, self.width, self.SLIDER_AREA_HEIGHT),
         )
         pygame.draw.line(
-            self.surface,
+            surface,
             self.config.colors.grid,
             (0, slider_area_y),
             (self.width, slider_area_y),
@@ -5,7 +5,7 @@ from pathlib import Path
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config_toml() -> str:
     """サンプルTOML設定コンテンツ"""
     return """
@@ -41,7 +41,7 @@ line_thickness = 3
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def partial_config_toml() -> str:
     """部分的なTOML設定コンテンツ"""
     return """
@@ -51,25 +51,25 @@ fps = 120
 """
 
 
-@pytest.fixture
-def config_file(sample_config_toml: str, tmp_path: Path) -> Path:
-    """一時ディレクトリに設定ファイルを作成"""
-    config_path = tmp_path / "config.toml"
+@pytest.fixture(scope="session")
+def config_file(sample_config_toml: str, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """一時ディレクトリに設定ファイルを作成（読み取り専用としてセッション内で共有）"""
+    config_path = tmp_path_factory.mktemp("config") / "config.toml"
     config_path.write_text(sample_config_toml)
     return config_path
 
 
-@pytest.fixture
-def partial_config_file(partial_config_toml: str, tmp_path: Path) -> Path:
-    """部分的な設定ファイルを作成"""
-    config_path = tmp_path / "partial_config.toml"
+@pytest.fixture(scope="session")
+def partial_config_file(partial_config_toml: str, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """部分的な設定ファイルを作成（読み取り専用としてセッション内で共有）"""
+    config_path = tmp_path_factory.mktemp("config") / "partial_config.toml"
     config_path.write_text(partial_config_toml)
     return config_path
 
 
-@pytest.fixture
-def invalid_toml_file(tmp_path: Path) -> Path:
-    """不正なTOMLファイルを作成"""
-    config_path = tmp_path / "invalid.toml"
+@pytest.fixture(scope="session")
+def invalid_toml_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """不正なTOMLファイルを作成（読み取り専用としてセッション内で共有）"""
+    config_path = tmp_path_factory.mktemp("config") / "invalid.toml"
     config_path.write_text("this is not valid toml [[[")
     return config_path
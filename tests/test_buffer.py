@@ -0,0 +1,74 @@
+"""Ring buffer tests"""
+
+import numpy as np
+
+from mindstream.buffer import RingBuffer, fill_nan_forward
+
+
+class TestFillNanForward:
+    """fill_nan_forward関数テスト"""
+
+    def test_no_nan_unchanged(self) -> None:
+        chunk = np.array([[1.0, 2.0], [3.0, 4.0]], dtype=np.float32)
+        result = fill_nan_forward(chunk, np.zeros(2, dtype=np.float32))
+        np.testing.assert_array_equal(result, [[1.0, 2.0], [3.0, 4.0]])
+
+    def test_leading_nan_uses_previous(self) -> None:
+        chunk = np.array([[np.nan, 2.0], [3.0, 4.0]], dtype=np.float32)
+        fill_nan_forward(chunk, np.array([9.0, 8.0], dtype=np.float32))
+        np.testing.assert_array_equal(chunk, [[9.0, 2.0], [3.0, 4.0]])
+
+    def test_nan_chain_holds_last_valid(self) -> None:
+        chunk = np.array([[1.0], [np.nan], [np.nan], [5.0], [np.nan]], dtype=np.float32)
+        fill_nan_forward(chunk, np.zeros(1, dtype=np.float32))
+        np.testing.assert_array_equal(chunk[:, 0], [1.0, 1.0, 1.0, 5.0, 5.0])
+
+
+class TestRingBuffer:
+    """RingBufferクラステスト"""
+
+    def test_initial_zeros(self) -> None:
+        buffer = RingBuffer(4, 8)
+        assert len(buffer) == 8
+        latest = buffer.latest(8)
+        assert latest.shape == (4, 8)
+        assert not latest.any()
+
+    def test_latest_is_chronological_after_wrap(self) -> None:
+        buffer = RingBuffer(2, 5)
+        for start in range(0, 12, 3):
+            values = np.arange(start, start + 3, dtype=np.float32)
+            buffer.extend(np.column_stack((values, -values)))
+
+        np.testing.assert_array_equal(buffer.latest(5)[0], [7, 8, 9, 10, 11])
+        np.testing.assert_array_equal(buffer.latest(2)[1], [-10, -11])
+
+    def test_extend_longer_than_size_keeps_tail(self) -> None:
+        buffer = RingBuffer(1, 4)
+        buffer.extend(np.arange(10, dtype=np.float32)[:, np.newaxis])
+        np.testing.assert_array_equal(buffer.latest(4)[0], [6, 7, 8, 9])
+
+    def test_extra_channels_are_ignored(self) -> None:
+        buffer = RingBuffer(2, 4)
+        buffer.extend(np.array([[1.0, 2.0, 3.0]], dtype=np.float32))
+        np.testing.assert_array_equal(buffer.latest(1)[:, 0], [1.0, 2.0])
+
+    def test_ingest_fills_nan_from_stored_sample(self) -> None:
+        buffer = RingBuffer(2, 4)
+        buffer.extend(np.array([[1.0, 2.0]], dtype=np.float32))
+        buffer.ingest(np.array([[np.nan, 3.0], [4.0, np.nan]], dtype=np.float32))
+        np.testing.assert_array_equal(buffer.latest(3), [[1.0, 1.0, 4.0], [2.0, 3.0, 3.0]])
+
+    def test_write_count_tracks_changes(self) -> None:
+        buffer = RingBuffer(1, 4)
+        buffer.extend(np.ones((3, 1), dtype=np.float32))
+        buffer.extend(np.zeros((0, 1), dtype=np.float32))
+        assert buffer.write_count == 3
+        buffer.reset()
+        assert buffer.write_count == 4
+
+    def test_reset(self) -> None:
+        buffer = RingBuffer(1, 4)
+        buffer.extend(np.ones((3, 1), dtype=np.float32))
+        buffer.reset()
+        assert not buffer.latest(4).any()
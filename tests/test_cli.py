@@ -50,6 +50,12 @@ class TestParseArgs:
         args = parse_args(["--amplitude", "200"])
         assert args.amplitude_scale == 200
 
+    def test_repeated_calls_are_independent(self) -> None:
+        parse_args(["--fps", "144", "--width", "1920"])
+        args = parse_args([])
+        assert args.fps is None
+        assert args.window_width is None
+
     def test_all_options(self, tmp_path: Path) -> None:
         config_path = tmp_path / "test.toml"
         config_path.write_text("[display]\nwindow_width = 800")
@@ -160,6 +166,27 @@ window_width = 1440
 
         assert config.display.window_width == 2560
 
+    def test_loaded_configs_are_independent(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[colors.channels]\nTP9 = [1, 2, 3]")
+
+        args = parse_args(["-c", str(config_path)])
+        first = load_config(args)
+        with pytest.raises(TypeError):
+            first.colors.channels["TP9"] = (9, 9, 9)  # ty: ignore[invalid-assignment]
+
+        assert load_config(args).colors.channels["TP9"] == (1, 2, 3)
+
+    def test_reloads_modified_file(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[display]\nwindow_width = 1440")
+        args = parse_args(["-c", str(config_path)])
+        assert load_config(args).display.window_width == 1440
+
+        config_path.write_text("[display]\nwindow_width = 25600")
+
+        assert load_config(args).display.window_width == 25600
+
 
 class TestConfigPrecedence:
     """設定の優先順位テスト"""
@@ -99,6 +99,12 @@ class TestConfigFromToml:
         with pytest.raises(tomllib.TOMLDecodeError):
             Config.from_toml(invalid_toml_file)
 
+    def test_load_from_bytes(self, partial_config_toml: str) -> None:
+        config = Config.from_toml_bytes(partial_config_toml.encode())
+
+        assert config.display.window_width == 1920
+        assert config.display.window_height == 800  # default
+
 
 class TestColorParsing:
     """カラー値のパーステスト"""
@@ -125,6 +131,16 @@ AF7 = [0, 100, 0]
         assert config.colors.channels["TP9"] == (100, 0, 0)
         assert config.colors.channels["AF7"] == (0, 100, 0)
 
+    def test_identical_colors_are_shared(self, tmp_path: Path) -> None:
+        config_path = tmp_path / "shared_colors.toml"
+        config_path.write_text("""
+[colors]
+grid = [50, 50, 50]
+text = [50, 50, 50]
+""")
+        config = Config.from_toml(config_path)
+        assert config.colors.grid is config.colors.text
+
 
 class TestConfigMerge:
     """CLI引数マージのテスト"""
@@ -190,6 +206,9 @@ class TestConfigMerge:
         assert config.display.window_width == 1200
         assert merged.display.window_width == 1920
 
+        # 上書きしていないセクションは共有される
+        assert merged.eeg is config.eeg
+
 
 class TestDisplayConfig:
     """DisplayConfig単体テスト"""
@@ -234,3 +253,16 @@ class TestColorsConfig:
         custom_channels = {"CH1": (255, 0, 0), "CH2": (0, 255, 0)}
         colors = ColorsConfig(channels=custom_channels)
         assert colors.channels == custom_channels
+
+    def test_channels_are_read_only(self) -> None:
+        custom_channels = {"CH1": (255, 0, 0)}
+        colors = ColorsConfig(channels=custom_channels)
+        with pytest.raises(TypeError):
+            colors.channels["CH1"] = (0, 0, 0)  # ty: ignore[invalid-assignment]
+
+        # 渡した辞書を書き換えても設定には影響しない
+        custom_channels["CH1"] = (0, 0, 0)
+        assert colors.channels["CH1"] == (255, 0, 0)
+
+    def test_config_is_hashable(self) -> None:
+        assert hash(Config()) == hash(Config())
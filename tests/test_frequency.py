@@ -5,6 +5,7 @@ from collections import deque
 import numpy as np
 import pytest
 
+from mindstream.buffer import RingBuffer
 from mindstream.config import Config, FrequencyConfig
 from mindstream.frequency import (
     BAND_ORDER,
@@ -13,6 +14,7 @@ from mindstream.frequency import (
     ChannelBandPowers,
     FrequencyAnalysisResult,
     FrequencyAnalyzer,
+    PowerHistory,
 )
 
 
@@ -92,13 +94,16 @@ class TestChannelBandPowers:
     """ChannelBandPowers dataclassテスト"""
 
     def test_creation(self) -> None:
-        bands = {
-            "alpha": BandPower("alpha", 100.0, 50.0),
-            "beta": BandPower("beta", 100.0, 50.0),
-        }
-        ch = ChannelBandPowers(channel_name="TP9", bands=bands)
+        ch = ChannelBandPowers(
+            channel_name="TP9",
+            alpha=BandPower("alpha", 100.0, 50.0),
+            beta=BandPower("beta", 100.0, 50.0),
+        )
         assert ch.channel_name == "TP9"
-        assert len(ch.bands) == 2
+        assert ch.alpha is not None
+        assert ch.beta is not None
+        assert ch.delta is None
+        assert ch.theta is None
 
 
 class TestFrequencyAnalysisResult:
@@ -113,6 +118,25 @@ class TestFrequencyAnalysisResult:
         assert result.timestamp == 1234567890.0
 
 
+class TestPowerHistory:
+    """PowerHistoryクラステスト"""
+
+    def test_band_series_returns_arrays(self) -> None:
+        history = PowerHistory()
+        history.add(1.0, {"alpha": 10.0, "beta": 5.0})
+        history.add(2.0, {"beta": 6.0})
+        history.add(3.0, {"alpha": 30.0})
+
+        timestamps, values = history.get_band_series("alpha", 60.0)
+        np.testing.assert_array_equal(timestamps, [1.0, 3.0])
+        np.testing.assert_array_equal(values, [10.0, 30.0])
+
+    def test_band_series_empty(self) -> None:
+        timestamps, values = PowerHistory().get_band_series("alpha", 60.0)
+        assert len(timestamps) == 0
+        assert len(values) == 0
+
+
 class TestFrequencyBands:
     """周波数帯域定義テスト"""
 
@@ -142,20 +166,17 @@ class TestFrequencyAnalyzer:
         return FrequencyAnalyzer(config, sample_rate=256)
 
     @pytest.fixture
-    def sample_buffers(self) -> list[deque[float]]:
+    def sample_buffers(self) -> np.ndarray:
         """テスト用バッファ（10Hz正弦波 = アルファ帯域）"""
         buffer_size = 256 * 30  # 30秒分
-        buffers = []
+        buffer = RingBuffer(4, buffer_size)
 
-        for _ in range(4):
-            buf: deque[float] = deque(maxlen=buffer_size)
-            # 10Hz正弦波を生成（アルファ帯域）
-            t = np.linspace(0, 30, buffer_size)
-            signal = np.sin(2 * np.pi * 10 * t)
-            buf.extend(signal.tolist())
-            buffers.append(buf)
+        # 10Hz正弦波を生成（アルファ帯域）
+        t = np.linspace(0, 30, buffer_size)
+        signal = np.sin(2 * np.pi * 10 * t).astype(np.float32)
+        buffer.extend(np.repeat(signal[:, np.newaxis], 4, axis=1))
 
-        return buffers
+        return buffer.latest(buffer_size)
 
     def test_analyzer_initialization(self, analyzer: FrequencyAnalyzer) -> None:
         """analyzerの初期化テスト"""
@@ -189,10 +210,30 @@ class TestFrequencyAnalyzer:
         result = analyzer.analyze(short_buffers, ["TP9", "AF7", "AF8", "TP10"], 0.0)
         assert result is None
 
+    def test_deque_buffers_match_array(
+        self,
+        analyzer: FrequencyAnalyzer,
+        sample_buffers: np.ndarray,
+    ) -> None:
+        """dequeのリストでも配列と同じ結果になる"""
+        names = ["TP9", "AF7", "AF8", "TP10"]
+        deques = [deque(row.tolist(), maxlen=len(row)) for row in sample_buffers]
+        from_array = analyzer.analyze(sample_buffers, names, 0.0)
+        from_deques = FrequencyAnalyzer(FrequencyConfig(), sample_rate=256).analyze(
+            deques, names, 0.0
+        )
+
+        assert from_array is not None
+        assert from_deques is not None
+        for band_name in BAND_ORDER:
+            assert from_deques.average_powers[band_name].absolute_power == pytest.approx(
+                from_array.average_powers[band_name].absolute_power
+            )
+
     def test_analyze_produces_results(
         self,
         analyzer: FrequencyAnalyzer,
-        sample_buffers: list[deque[float]],
+        sample_buffers: np.ndarray,
     ) -> None:
         """解析結果が正しく生成されることを確認"""
         result = analyzer.analyze(
@@ -212,7 +253,7 @@ class TestFrequencyAnalyzer:
     def test_alpha_band_detected(
         self,
         analyzer: FrequencyAnalyzer,
-        sample_buffers: list[deque[float]],
+        sample_buffers: np.ndarray,
     ) -> None:
         """10Hz信号がアルファ帯域として検出されることを確認"""
         result = analyzer.analyze(
@@ -236,7 +277,7 @@ class TestFrequencyAnalyzer:
     def test_caching_returns_same_result(
         self,
         analyzer: FrequencyAnalyzer,
-        sample_buffers: list[deque[float]],
+        sample_buffers: np.ndarray,
     ) -> None:
         """更新間隔内はキャッシュされた結果が返される"""
         result1 = analyzer.analyze(sample_buffers, ["TP9", "AF7", "AF8", "TP10"], 0.0)
@@ -245,10 +286,25 @@ class TestFrequencyAnalyzer:
         # 同じオブジェクト（キャッシュ）であるべき
         assert result1 is result2
 
+    def test_unchanged_write_count_returns_same_result(
+        self,
+        analyzer: FrequencyAnalyzer,
+        sample_buffers: np.ndarray,
+    ) -> None:
+        """更新間隔が経過してもバッファ未更新ならキャッシュされた結果が返される"""
+        names = ["TP9", "AF7", "AF8", "TP10"]
+        result1 = analyzer.analyze(sample_buffers, names, 0.0, write_count=5)
+        result2 = analyzer.analyze(sample_buffers, names, 10.0, write_count=5)
+        result3 = analyzer.analyze(sample_buffers, names, 20.0, write_count=6)
+
+        assert result1 is result2
+        assert result3 is not result1
+        assert len(analyzer.power_history.entries) == 2
+
     def test_channel_powers_match_channels(
         self,
         analyzer: FrequencyAnalyzer,
-        sample_buffers: list[deque[float]],
+        sample_buffers: np.ndarray,
     ) -> None:
         """チャンネル別結果が正しいチャンネル名を持つ"""
         channel_names = ["TP9", "AF7", "AF8", "TP10"]
@@ -257,6 +313,8 @@ class TestFrequencyAnalyzer:
         assert result is not None
         for i, ch_power in enumerate(result.channel_powers):
             assert ch_power.channel_name == channel_names[i]
+            for band_name in BAND_ORDER:
+                assert getattr(ch_power, band_name) is not None
 
 
 class TestFrequencyBandPanel:
@@ -2,7 +2,7 @@
 
 import pytest
 
-from mindstream.config import Config, SliderConfig
+from mindstream.config import Config, EEGConfig, SliderConfig
 
 
 class TestSliderConfig:
@@ -113,10 +113,10 @@ class TestSliderPanel:
         """カスタム設定でSliderPanelが作成されることを確認"""
         from mindstream.ui import SliderPanel
 
-        config = Config()
-        config.eeg.default_amplitude_scale = 200
-        config.eeg.default_display_seconds = 10
-        config.slider.width = 100
+        config = Config(
+            eeg=EEGConfig(default_amplitude_scale=200, default_display_seconds=10),
+            slider=SliderConfig(width=100),
+        )
 
         panel = SliderPanel(config, 1300, 800)
 
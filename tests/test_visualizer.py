@@ -0,0 +1,90 @@
+"""EEG visualizer tests"""
+
+import numpy as np
+import pytest
+
+from mindstream.config import Config
+from mindstream.constants import NUM_CHANNELS, ViewMode
+
+
+@pytest.fixture
+def visualizer(monkeypatch: pytest.MonkeyPatch):
+    """ダミービデオドライバでEEGVisualizerを作成（pygame初期化を含む）"""
+    import pygame
+
+    from mindstream.visualizer import EEGVisualizer
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    visualizer = EEGVisualizer(Config())
+    yield visualizer
+    pygame.quit()
+
+
+class TestEventFilter:
+    """イベントキューの種別制限テスト"""
+
+    def test_repaint_events_reach_queue(self, visualizer) -> None:
+        """ウィンドウの再表示・復元イベントはキューに届く"""
+        import pygame
+
+        from mindstream.visualizer import _REPAINT_EVENT_TYPES
+
+        for event_type in _REPAINT_EVENT_TYPES:
+            assert not pygame.event.get_blocked(event_type)
+
+    def test_unhandled_events_are_blocked(self, visualizer) -> None:
+        """処理しないイベント種別はキューに積まれない"""
+        import pygame
+
+        assert pygame.event.get_blocked(pygame.MOUSEWHEEL)
+
+
+class TestWaveformStrip:
+    """波形領域の部分更新テスト"""
+
+    def _fill_buffers(self, visualizer, frequency: float) -> None:
+        """バッファ全体を全チャンネル同じ正弦波で埋める"""
+        t = np.arange(visualizer.buffers.size, dtype=np.float32) / 256
+        signal = (80 * np.sin(2 * np.pi * frequency * t)).astype(np.float32)
+        visualizer.buffers.extend(np.repeat(signal[:, np.newaxis], NUM_CHANNELS, axis=1))
+
+    @pytest.mark.parametrize("mode", [ViewMode.POWER_TREND, ViewMode.FOCUS_RELAX])
+    def test_overlay_panel_survives_strip_update(self, visualizer, mode: ViewMode) -> None:
+        """波形領域の部分更新で重なって表示中のパネルが消えない"""
+        import pygame
+
+        if mode not in visualizer.view_manager.active_modes:
+            visualizer._on_mode_toggle(mode)
+        panel = dict(visualizer._strip_overlays)[mode]
+        screen = visualizer.screen
+
+        self._fill_buffers(visualizer, 3.0)
+        screen.fill(visualizer.config.colors.background)
+        visualizer.draw_grid()
+        visualizer.draw_waveforms()
+        visualizer.draw_status()
+        panel.draw(screen)
+        panel_before = pygame.image.tobytes(screen.subsurface(panel.rect), "RGB")
+
+        self._fill_buffers(visualizer, 7.0)
+        updated = visualizer.redraw_waveform_strip()
+
+        assert not updated.colliderect(panel.rect)
+        assert pygame.image.tobytes(screen.subsurface(panel.rect), "RGB") == panel_before
+
+
+class TestCenteredText:
+    """中央揃えテキストのキャッシュテスト"""
+
+    def test_same_text_with_different_style(self, visualizer) -> None:
+        """同じ文字列でもフォント・色・位置が違えば別々に描画される"""
+        visualizer._blit_centered(visualizer.font, "MindStream", (255, 255, 255), 10)
+        visualizer._blit_centered(visualizer.title_font, "MindStream", (255, 255, 255), 10)
+        visualizer._blit_centered(visualizer.font, "MindStream", (255, 0, 0), 10)
+        visualizer._blit_centered(visualizer.font, "MindStream", (255, 255, 255), 50)
+
+        entries = list(visualizer._centered_cache.values())
+        assert len(entries) == 4
+        assert entries[0][0].get_size() != entries[1][0].get_size()
+        assert entries[0][0] is not entries[2][0]
+        assert entries[3][1][1] == 50